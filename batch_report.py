@@ -0,0 +1,75 @@
+"""
+Batch Report CLI - Xuất báo cáo sprint cho nhiều board / sprint không cần Streamlit
+
+Ví dụ:
+    python batch_report.py --board 12 --board 15 --sprint active --sprint last:3 \\
+        --format parquet xlsx json --output reports/2025-06-13 --workers 8
+"""
+
+import argparse
+import logging
+import time
+
+from service.sprint_report_batch import (
+    OUTPUT_FORMATS,
+    run_batch,
+    timings_table,
+    write_results,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Xuất báo cáo sprint hàng loạt")
+    parser.add_argument(
+        "--board", dest="boards", type=int, action="append", required=True,
+        help="Board ID (có thể lặp lại)",
+    )
+    parser.add_argument(
+        "--sprint", dest="selectors", action="append", default=[],
+        help="Selector sprint: active | future | closed | last:N | id:123 | name:abc "
+        "(có thể lặp lại, mặc định: active)",
+    )
+    parser.add_argument(
+        "--format", dest="formats", nargs="+", choices=OUTPUT_FORMATS,
+        default=["xlsx"], help="Định dạng file output",
+    )
+    parser.add_argument("--output", default="reports", help="Thư mục output")
+    parser.add_argument("--workers", type=int, default=4, help="Số sprint chạy song song")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Luôn gọi API thay vì dùng file cache"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log chi tiết tiến trình")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    started = time.perf_counter()
+    results = run_batch(
+        args.boards, args.selectors, max_workers=args.workers, use_cache=not args.no_cache
+    )
+    paths = write_results(results, args.output, args.formats)
+    elapsed = time.perf_counter() - started
+
+    timings = timings_table(results)
+    total_issues = int(timings["issues"].sum()) if not timings.empty else 0
+    print(timings.to_string(index=False) if not timings.empty else "Không có sprint nào")
+    print()
+    print(
+        f"{len(results)} sprint, {total_issues} issue trong {elapsed:.2f}s "
+        f"({len(results) / elapsed:.2f} sprint/s, {total_issues / elapsed:.1f} issue/s)"
+    )
+    for path in paths:
+        print(f"💾 {path}")
+
+    failed = int((timings["error"] != "").sum()) if not timings.empty else 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
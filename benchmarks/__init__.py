@@ -0,0 +1,3 @@
+"""
+Benchmarks - Các script đo hiệu năng (chạy từ thư mục gốc: python -m benchmarks.<tên>)
+"""
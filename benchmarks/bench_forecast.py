@@ -0,0 +1,46 @@
+"""
+Benchmark: dự báo Monte Carlo vectorized so với vòng lặp Python từng trial
+
+Chạy: python -m benchmarks.bench_forecast [số_trial ...]
+"""
+
+import random
+import sys
+
+import numpy as np
+
+from benchmarks.fixtures import timed
+
+SAMPLES = [153, 215, 83.5, 40, 120, 180, 96, 140]
+REMAINING = 1000
+
+
+def _loop_forecast(trials):
+    """Cách làm thông thường: mô phỏng từng trial bằng vòng lặp Python"""
+    rng = random.Random(42)
+    results = []
+    for _ in range(trials):
+        done, sprints = 0.0, 0
+        while done < REMAINING:
+            done += rng.choice(SAMPLES)
+            sprints += 1
+        results.append(sprints)
+    return np.percentile(results, [50, 85, 95])
+
+
+def main(sizes):
+    from service.sprint_forecast import forecast_completion
+
+    print(f"{'trials':>8} {'loop (s)':>9} {'numpy (s)':>10} {'speedup':>8}  p50/p85/p95")
+    for trials in sizes:
+        loop, loop_time = timed(_loop_forecast, trials)
+        forecast, numpy_time = timed(forecast_completion, SAMPLES, REMAINING, trials=trials)
+        print(
+            f"{trials:>8} {loop_time:>9.3f} {numpy_time:>10.3f} "
+            f"{loop_time / numpy_time:>7.1f}x  "
+            f"{list(forecast['confidence'].values())} (loop {loop.tolist()})"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 50000, 100000])
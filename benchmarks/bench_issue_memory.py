@@ -0,0 +1,74 @@
+"""
+Benchmark: bộ nhớ của issue đã xử lý dạng dict (cũ) so với IssueRecord + DataFrame gọn
+
+Đo cho một sprint (mặc định 1000 issue):
+- Bộ nhớ Python giữ danh sách issue (tracemalloc): list dict so với list IssueRecord
+- DataFrame.memory_usage(deep=True): pd.DataFrame(dicts) so với build_issue_frame
+- Kích thước pickle (file cache của sprint)
+
+Chạy: python -m benchmarks.bench_issue_memory [số_issue ...]
+"""
+
+import copy
+import pickle
+import sys
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.fixtures import SPRINT_END, SPRINT_START, make_raw_issues, offline_jira
+
+
+def _measure(build):
+    """Bộ nhớ (bytes) còn giữ sau khi gọi build, cùng với kết quả"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def run(count: int):
+    from service.clients.jira.issue_processor import process_sprint
+    from service.models.issue_model import build_issue_frame, to_issue_records
+
+    processed = process_sprint(make_raw_issues(count), SPRINT_START, SPRINT_END).issues
+    # Bản sao pickle mô phỏng dict đọc từ file cache: chuỗi không được chia sẻ
+    payload = pickle.dumps(processed)
+
+    dicts, dict_bytes = _measure(lambda: pickle.loads(payload))
+    records, record_bytes = _measure(lambda: to_issue_records(pickle.loads(payload)))
+    assert [record.to_dict() for record in records] == copy.deepcopy(dicts)
+
+    dict_frame = pd.DataFrame(dicts)
+    record_frame = build_issue_frame(records)
+    dict_frame_bytes = dict_frame.memory_usage(deep=True).sum()
+    record_frame_bytes = record_frame.memory_usage(deep=True).sum()
+
+    print(f"Sprint {count} issue")
+    print(
+        f"  list (Python)  : dict {dict_bytes / 1024:8.1f} KB ({dict_bytes / count:6.0f} B/issue)"
+        f" | IssueRecord {record_bytes / 1024:8.1f} KB ({record_bytes / count:6.0f} B/issue)"
+        f" | x{dict_bytes / record_bytes:.2f}"
+    )
+    print(
+        f"  DataFrame      : cũ {dict_frame_bytes / 1024:8.1f} KB"
+        f" | gọn {record_frame_bytes / 1024:8.1f} KB"
+        f" | x{dict_frame_bytes / record_frame_bytes:.2f}"
+    )
+    print(
+        f"  pickle (cache) : dict {len(payload) / 1024:8.1f} KB"
+        f" | IssueRecord {len(pickle.dumps(records)) / 1024:8.1f} KB"
+    )
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000]
+    with offline_jira():
+        for count in counts:
+            run(count)
+
+
+if __name__ == "__main__":
+    main()
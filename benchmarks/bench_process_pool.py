@@ -0,0 +1,77 @@
+"""
+Benchmark: xử lý sprint lớn trên một process (process_sprint) so với process pool
+(process_sprint_parallel)
+
+Chạy: python -m benchmarks.bench_process_pool [số_issue ...]
+Tùy chọn qua biến môi trường: SPRINT_PROCESS_CHUNK_SIZE, SPRINT_PROCESS_MAX_WORKERS
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.fixtures import (
+    SPRINT_END,
+    SPRINT_START,
+    make_raw_issues,
+    offline_jira,
+    timed,
+)
+
+# Cố định thời điểm hiện tại để hai đường xử lý cho cùng hours_elapsed
+NOW = datetime(2025, 6, 16, 9, 0)
+
+
+def _assert_same(serial, parallel):
+    assert serial.issues == parallel.issues, "Danh sách issue khác nhau"
+    pd.testing.assert_frame_equal(serial.status_events, parallel.status_events)
+    for name, frame in serial.worklog_summary.items():
+        other = parallel.worklog_summary[name]
+        if name == "by_issue":
+            pd.testing.assert_frame_equal(frame, other, check_index_type=False, check_names=False)
+        else:
+            pd.testing.assert_frame_equal(
+                frame.sort_values(list(frame.columns[:-3])).reset_index(drop=True),
+                other.sort_values(list(other.columns[:-3])).reset_index(drop=True),
+            )
+
+
+def main(sizes):
+    with offline_jira():
+        from conf import SPRINT_PROCESS_CHUNK_SIZE, SPRINT_PROCESS_MAX_WORKERS
+        from service.clients.jira.issue_processor import (
+            process_sprint,
+            process_sprint_parallel,
+        )
+
+        workers = SPRINT_PROCESS_MAX_WORKERS or os.cpu_count() or 1
+        print(f"chunk_size={SPRINT_PROCESS_CHUNK_SIZE} workers={workers}")
+        print(f"{'issues':>8} {'serial (s)':>11} {'pool (s)':>9} {'speedup':>8}")
+        for size in sizes:
+            raw_issues = make_raw_issues(size)
+
+            serial, serial_time = timed(
+                lambda: process_sprint(raw_issues, SPRINT_START, SPRINT_END, now=NOW)
+            )
+            parallel, parallel_time = timed(
+                lambda: process_sprint_parallel(
+                    raw_issues,
+                    SPRINT_START,
+                    SPRINT_END,
+                    now=NOW,
+                    chunk_size=SPRINT_PROCESS_CHUNK_SIZE,
+                    max_workers=workers,
+                )
+            )
+            _assert_same(serial, parallel)
+
+            print(
+                f"{size:>8} {serial_time:>11.3f} {parallel_time:>9.3f} "
+                f"{serial_time / parallel_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [2000, 10000, 30000])
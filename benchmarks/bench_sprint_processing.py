@@ -0,0 +1,72 @@
+"""
+Benchmark: thời gian process_sprint và phần chia của nó: tổng hợp cả sprint
+(worklog summary + bảng sự kiện changelog) và vòng lặp process_issue từng issue
+
+Chạy: python -m benchmarks.bench_sprint_processing [số_issue ...]
+"""
+
+import sys
+from datetime import datetime
+
+from benchmarks.fixtures import (
+    SPRINT_END,
+    SPRINT_START,
+    make_raw_issues,
+    offline_jira,
+    timed,
+)
+
+# Cố định thời điểm hiện tại để các lần đo cho cùng hours_elapsed
+NOW = datetime(2025, 6, 16, 9, 0)
+
+
+def _cold(func):
+    """Xóa memo parse timestamp để mỗi lần đo đều bắt đầu từ cache rỗng"""
+    from service.utils.time_utils import parse_jira_timestamp
+
+    def wrapper():
+        parse_jira_timestamp.cache_clear()
+        return func()
+
+    return wrapper
+
+
+def main(sizes):
+    with offline_jira():
+        from service.clients.jira.changelog_events import build_status_events
+        from service.clients.jira.worklog_service import WorklogService
+        from service.clients.jira.issue_processor import process_issue, process_sprint
+
+        print(
+            f"{'issues':>8} {'aggregate (s)':>14} {'per-issue (s)':>14} "
+            f"{'process_sprint (s)':>19}"
+        )
+        for size in sizes:
+            raw_issues = make_raw_issues(size)
+
+            def run_aggregate():
+                WorklogService.aggregate_sprint_worklogs(raw_issues, SPRINT_START, SPRINT_END)
+                build_status_events(raw_issues)
+
+            _, aggregate_time = timed(_cold(run_aggregate))
+            per_issue, per_issue_time = timed(
+                _cold(
+                    lambda: [
+                        process_issue(issue, SPRINT_START, SPRINT_END, now=NOW)
+                        for issue in raw_issues
+                    ]
+                )
+            )
+            processed, sprint_time = timed(
+                _cold(lambda: process_sprint(raw_issues, SPRINT_START, SPRINT_END, now=NOW))
+            )
+            assert processed.issues == per_issue, "process_sprint khác process_issue"
+
+            print(
+                f"{size:>8} {aggregate_time:>14.3f} {per_issue_time:>14.3f} "
+                f"{sprint_time:>19.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 200, 500, 1000, 5000])
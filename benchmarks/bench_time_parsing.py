@@ -0,0 +1,72 @@
+"""
+Microbenchmark: parse timestamp Jira bằng dateutil / strptime / parse_jira_timestamp
+(memo) / parse_jira_timestamps (vectorized)
+
+Chạy: python -m benchmarks.bench_time_parsing [số_chuỗi]
+"""
+
+import sys
+from datetime import datetime
+
+from benchmarks.fixtures import make_raw_issues, timed
+
+
+def _sample_timestamps(count: int) -> list:
+    """Lấy các chuỗi thời gian thật từ worklog/changelog giả lập"""
+    values = []
+    for issue in make_raw_issues(max(count // 8, 10)):
+        fields = issue["fields"]
+        values.append(fields["updated"])
+        values.extend(w["started"] for w in fields["worklog"]["worklogs"])
+        values.extend(h["created"] for h in issue["changelog"]["histories"])
+    return (values * (count // len(values) + 1))[:count]
+
+
+def main(count: int):
+    from dateutil import parser
+
+    from service.utils.time_utils import parse_jira_timestamp, parse_jira_timestamps
+
+    values = _sample_timestamps(count)
+    unique_count = len(set(values))
+
+    def run_dateutil():
+        return [parser.parse(v).replace(tzinfo=None) for v in values]
+
+    def run_strptime():
+        return [
+            datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%f%z").replace(tzinfo=None)
+            for v in values
+        ]
+
+    def run_memo_cold():
+        parse_jira_timestamp.cache_clear()
+        return [parse_jira_timestamp(v) for v in values]
+
+    def run_memo_warm():
+        return [parse_jira_timestamp(v) for v in values]
+
+    def run_vectorized():
+        return parse_jira_timestamps(values)
+
+    expected, baseline = timed(run_dateutil)
+    results = [("dateutil.parser.parse", baseline)]
+    for name, func in [
+        ("strptime %z", run_strptime),
+        ("parse_jira_timestamp (cold)", run_memo_cold),
+        ("parse_jira_timestamp (warm)", run_memo_warm),
+        ("parse_jira_timestamps", run_vectorized),
+    ]:
+        parsed, elapsed = timed(func)
+        parsed = list(parsed.dt.to_pydatetime()) if hasattr(parsed, "dt") else parsed
+        assert parsed == expected, f"{name} cho kết quả khác dateutil"
+        results.append((name, elapsed))
+
+    print(f"{count} chuỗi ({unique_count} chuỗi khác nhau)")
+    print(f"{'parser':<30} {'time (ms)':>10} {'speedup':>8}")
+    for name, elapsed in results:
+        print(f"{name:<30} {elapsed * 1000:>10.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,99 @@
+"""
+Benchmark: export Excel của worklog bằng pd.ExcelWriter (openpyxl, giữ mọi ô
+trong bộ nhớ) so với ghi streaming write_only (service.utils.excel_writer)
+
+Mỗi cách chạy trong một process con riêng để đo peak RSS (ru_maxrss) độc lập:
+- peak RSS sau khi sinh dữ liệu (nền) và sau khi export (phần tăng thêm là của export)
+- thời gian export và kích thước file
+
+Chạy: python -m benchmarks.bench_xlsx_export [số_dòng ...]
+"""
+
+import resource
+import subprocess
+import sys
+import time
+
+MODES = ["pandas", "streaming"]
+
+
+def _peak_rss_mb() -> float:
+    # Linux: ru_maxrss tính bằng KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _export_with_pandas(df_worklog, start_date, end_date) -> bytes:
+    """Cách cũ: DataFrame.to_excel qua pd.ExcelWriter (openpyxl chế độ thường)"""
+    from io import BytesIO
+
+    import pandas as pd
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    from component.worklog.worklog_stats import (
+        _create_excel_export_data,
+        _format_export_columns,
+    )
+    from service.utils.excel_writer import column_widths
+
+    pivot_table = _create_excel_export_data(df_worklog)
+    df_export = _format_export_columns(df_worklog)
+    header_info = [
+        "📊 BÁO CÁO THỐNG KÊ WORKLOG THEO USER",
+        f"📅 Khoảng thời gian: {start_date} → {end_date}",
+        f"📊 Tổng số user: {len(pivot_table.index)}",
+    ]
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        pivot_table.to_excel(writer, sheet_name="Thống kê theo User", startrow=4)
+        df_export.to_excel(writer, sheet_name="Raw Data", index=False)
+        stats_sheet = writer.sheets["Thống kê theo User"]
+        for row, text in enumerate(header_info, start=1):
+            stats_sheet[f"A{row}"] = text
+        stats_sheet["A1"].font = Font(bold=True, size=14)
+        for sheet, widths in [
+            (stats_sheet, column_widths(pivot_table, True, tuple(header_info))),
+            (writer.sheets["Raw Data"], column_widths(df_export)),
+        ]:
+            for position, width in enumerate(widths, start=1):
+                sheet.column_dimensions[get_column_letter(position)].width = width
+    return output.getvalue()
+
+
+def run_mode(mode: str, rows: int):
+    """Chạy một cách export trong process hiện tại và in kết quả"""
+    from benchmarks.fixtures import make_worklog_frame, offline_jira
+
+    with offline_jira():
+        from component.worklog.worklog_stats import _export_to_excel
+
+        df_worklog = make_worklog_frame(rows)
+        export = _export_with_pandas if mode == "pandas" else _export_to_excel
+        baseline = _peak_rss_mb()
+        started = time.perf_counter()
+        data = export(df_worklog, "2025-06-02", "2025-07-02")
+        seconds = time.perf_counter() - started
+        peak = _peak_rss_mb()
+    print(
+        f"  {mode:<9}: {seconds:6.2f}s | peak RSS {peak:7.1f} MB"
+        f" (export +{peak - baseline:6.1f} MB) | file {len(data) / 1024 / 1024:5.1f} MB"
+    )
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], int(sys.argv[3]))
+        return
+    counts = [int(arg) for arg in sys.argv[1:]] or [100_000]
+    for rows in counts:
+        print(f"Export worklog {rows} dòng")
+        sys.stdout.flush()
+        for mode in MODES:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_xlsx_export", "--mode", mode, str(rows)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
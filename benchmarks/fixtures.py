@@ -0,0 +1,159 @@
+"""
+Dữ liệu giả lập cho benchmark - sinh issue Jira thô giống response của API
+và bảng worklog đã chuẩn bị (như _prepare_worklog_data)
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+SPRINT_START = datetime(2025, 6, 2)
+SPRINT_END = datetime(2025, 6, 15, 23, 59, 59, 999999)
+
+STATUSES = ["To Do", "In Progress", "Wait for review", "Dev Done", "Done", "Reopen"]
+USERS = [f"User {idx:02d}" for idx in range(30)]
+FEATURES = ["Login", "Report", "Payment", "Calendar", "Worklog", "Dashboard"]
+
+
+def _jira_time(value: datetime, offset: str = "+0700") -> str:
+    """Format thời gian theo kiểu Jira: 2025-06-11T09:58:07.555+0700"""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}{offset}"
+
+
+def _option(value, as_list: bool):
+    option = {"value": value}
+    return [option] if as_list else option
+
+
+def make_raw_issues(count: int = 1000, seed: int = 42, worklogs_per_issue: int = 6):
+    """Sinh danh sách issue thô (expand=changelog) cho một sprint"""
+    rng = random.Random(seed)
+    issues = []
+    for idx in range(count):
+        created = SPRINT_START - timedelta(days=rng.randint(0, 30), minutes=rng.randint(0, 600))
+        assignee = rng.choice(USERS) if rng.random() > 0.1 else None
+        estimate = rng.choice([None, 0, 1800, 3600, 7200, 14400, 28800, 54000])
+        spent = rng.choice([0, 900, 3600, 7200, 10800])
+
+        worklogs = []
+        for _ in range(rng.randint(0, worklogs_per_issue)):
+            started = SPRINT_START + timedelta(
+                days=rng.randint(-3, 16), hours=rng.randint(8, 18), minutes=rng.randint(0, 59)
+            )
+            worklogs.append(
+                {
+                    "author": {"displayName": rng.choice(USERS)},
+                    "started": _jira_time(started),
+                    "timeSpentSeconds": rng.choice([900, 1800, 3600, 7200]),
+                }
+            )
+
+        histories = []
+        moment = created
+        status_from = "To Do"
+        for _ in range(rng.randint(0, 8)):
+            moment += timedelta(hours=rng.randint(1, 72), minutes=rng.randint(0, 59))
+            status_to = rng.choice([s for s in STATUSES if s != status_from])
+            items = [{"field": "status", "fromString": status_from, "toString": status_to}]
+            if rng.random() < 0.1:
+                items.append({"field": "resolution", "fromString": None, "toString": "Done"})
+            histories.append(
+                {
+                    "created": _jira_time(moment),
+                    "author": {"displayName": rng.choice(USERS)},
+                    "items": items,
+                }
+            )
+            status_from = status_to
+
+        issues.append(
+            {
+                "key": f"CLD-{1000 + idx}",
+                "fields": {
+                    "summary": f"Issue {idx} - {rng.choice(FEATURES)}",
+                    "status": {"name": status_from},
+                    "issuetype": {"name": rng.choice(["Task", "Bug", "Story", "Epic"])},
+                    "assignee": {"displayName": assignee} if assignee else None,
+                    "priority": {"name": rng.choice(["High", "Medium", "Low"])},
+                    "timeoriginalestimate": estimate,
+                    "customfield_10192": _option(rng.choice(["BE", "FE", "QA"]), rng.random() < 0.5),
+                    "customfield_10160": _option(rng.choice(["YES", "NO"]), False) if rng.random() > 0.1 else None,
+                    "customfield_10130": _option(rng.choice(["YES", "NO"]), False),
+                    "customfield_10132": _option(rng.choice(FEATURES), rng.random() < 0.5),
+                    "customfield_10159": None,
+                    "customfield_10092": _option(rng.choice(["ACME", "Globex"]), False),
+                    "customfield_10031": {"displayName": rng.choice(USERS)},
+                    "customfield_10191": _option(rng.choice(["prod", "staging"]), False),
+                    "subtasks": [{"key": "CLD-1"}] if rng.random() < 0.1 else [],
+                    "reporter": {"displayName": rng.choice(USERS)},
+                    "worklog": {"total": len(worklogs), "worklogs": worklogs},
+                    "closedSprints": [{"id": 1}] * rng.randint(0, 2),
+                    "created": _jira_time(created),
+                    "updated": _jira_time(created + timedelta(days=rng.randint(0, 20))),
+                    "timetracking": {
+                        "originalEstimate": "1d",
+                        "timeSpent": "1h",
+                        "remainingEstimate": "7h",
+                        "originalEstimateSeconds": estimate or 0,
+                        "timeSpentSeconds": spent,
+                        "remainingEstimateSeconds": max((estimate or 0) - spent, 0),
+                    }
+                    if rng.random() > 0.05
+                    else {},
+                    "duedate": (SPRINT_END - timedelta(days=rng.randint(0, 10))).strftime("%Y-%m-%d")
+                    if rng.random() > 0.3
+                    else None,
+                },
+                "changelog": {"histories": histories},
+            }
+        )
+    return issues
+
+
+def make_worklog_frame(rows: int = 100_000, seed: int = 42, days: int = 31):
+    """Sinh bảng worklog (cột giống WORKLOG_COLUMNS, Date kiểu datetime)"""
+    rng = np.random.default_rng(seed)
+    seconds = rng.choice([900, 1800, 3600, 7200, 14400], rows)
+    issue_ids = rng.integers(0, max(1, rows // 6), rows)
+    return pd.DataFrame(
+        {
+            "User": pd.Categorical(rng.choice(USERS, rows)),
+            "Date": pd.Timestamp(SPRINT_START)
+            + pd.to_timedelta(rng.integers(0, days, rows), unit="D"),
+            "Time": [f"{hour:02d}:{minute:02d}" for hour, minute in zip(
+                rng.integers(8, 19, rows), rng.integers(0, 60, rows)
+            )],
+            "Issue Key": [f"CLD-{idx}" for idx in issue_ids],
+            "Issue Summary": [f"{FEATURES[idx % len(FEATURES)]} task {idx}" for idx in issue_ids],
+            "Status": rng.choice(STATUSES, rows),
+            "Time Spent": [f"{value // 3600}h" if value >= 3600 else f"{value // 60}m" for value in seconds],
+            "Time (Hours)": (seconds / 3600).round(2),
+            "Comment": [f"Comment {idx} " * (idx % 8) for idx in range(rows)],
+        }
+    ).sort_values(["User", "Date"], ignore_index=True)
+
+
+@contextmanager
+def offline_jira():
+    """Thay JIRA client bằng mock để khởi tạo service không cần kết nối mạng"""
+    with mock.patch("service.base.jira_base.JIRA"), mock.patch(
+        "service.base.jira_base.JIRA_SERVER", "https://bench.atlassian.net"
+    ):
+        yield
+
+
+def timed(func, *args, repeat: int = 3, **kwargs):
+    """Chạy func nhiều lần, trả về (kết quả lần cuối, thời gian tốt nhất tính bằng giây)"""
+    import time
+
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return result, best
@@ -0,0 +1,44 @@
+"""
+Worklog Gap CLI - Cập nhật bảng ngày log thiếu giờ mà trang Worklog hiển thị
+
+Chỉ đọc các worklog thay đổi từ lần chạy trước nên có thể đặt cron dày, ví dụ:
+    0 * * * * cd /path/to/app && python check_worklog_gaps.py
+"""
+
+import argparse
+
+from conf import WORKLOG_GAP_LOOKBACK_DAYS
+from service.utils.worklog_gap_store import worklog_gap_store
+from service.worklog_gap_job import run_gap_job
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Phát hiện ngày làm việc bị log thiếu giờ")
+    parser.add_argument(
+        "--lookback", type=int, default=WORKLOG_GAP_LOOKBACK_DAYS,
+        help="Số ngày gần nhất được kiểm tra",
+    )
+    parser.add_argument(
+        "--reset", action="store_true",
+        help="Xóa dữ liệu đã lưu và đọc lại toàn bộ cửa sổ kiểm tra",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.reset:
+        worklog_gap_store.reset()
+
+    result = run_gap_job(lookback_days=args.lookback)
+    mode = "lần đầu (toàn bộ cửa sổ)" if result.bootstrap else "tăng dần"
+    print(
+        f"Chạy {mode}: {result.updated} worklog cập nhật, {result.deleted} bị xóa, "
+        f"tính lại {result.days_checked} ngày trong {result.seconds:.2f}s"
+    )
+    print(f"💾 {result.gaps} ngày log thiếu giờ trong {worklog_gap_store.store_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -136,6 +136,9 @@ class CalendarComponent:
     ):
         """Render calendar grid với các ngày sử dụng grid layout đồng nhất"""
         cal = calendar.monthcalendar(selected_year, selected_month)
+        self.user_helper.prefetch_avatars(
+            {item["user_name"] for users in time_off_dict.values() for item in users}
+        )
 
         for week in cal:
             self._render_week_row_improved(
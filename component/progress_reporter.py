@@ -0,0 +1,49 @@
+"""
+Streamlit adapter cho ProgressReporter của service layer
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import streamlit as st
+
+from service.base.progress import ProgressReporter
+
+
+class StreamlitProgressReporter(ProgressReporter):
+    """Hiển thị sự kiện của service bằng toast / spinner / progress bar của Streamlit"""
+
+    def __init__(self, show_debug: bool = True):
+        self.show_debug = show_debug
+        self._progress_bar = None
+
+    def info(self, message: str):
+        st.toast(message)
+
+    def success(self, message: str):
+        st.success(message)
+
+    def warning(self, message: str):
+        st.warning(message)
+
+    def error(self, message: str):
+        st.error(message)
+
+    def debug(self, label: str, data: Any):
+        if self.show_debug:
+            st.write(data)
+
+    def progress(self, done: int, total: int, message: str = ""):
+        if not total:
+            return
+        if self._progress_bar is None:
+            self._progress_bar = st.progress(0.0)
+        self._progress_bar.progress(min(done / total, 1.0), text=f"{message} ({done}/{total})")
+        if done >= total:
+            self._progress_bar.empty()
+            self._progress_bar = None
+
+    @contextmanager
+    def task(self, message: str) -> Iterator[None]:
+        with st.spinner(message):
+            yield
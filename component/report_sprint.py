@@ -49,8 +49,10 @@ def render_sprint_sidebar(jira_client, sprint_service: SprintService):
             # Find the active sprint to set as default
             active_sprint_index = 0
 
-            # Create a dictionary for easy lookup: {sprint_name: sprint_id}
-            sprint_name_to_id = {sprint["name"]: sprint["id"] for sprint in all_sprints}
+            # Create a dictionary for easy lookup: {display_name: sprint_id}
+            sprint_name_to_id = {
+                sprint.display_name: sprint.id for sprint in all_sprints
+            }
 
             # Display the sprint selector in the sidebar
             selected_sprint_name = st.selectbox(
@@ -110,6 +112,7 @@ def render_sprint_sidebar(jira_client, sprint_service: SprintService):
             use_container_width=True,
         ):
             file_cache.clear_cache()
+            SprintService.clear_sprint_list_cache()
             st.success("✅ Tất cả cache đã được xóa!")
             st.rerun()
 
@@ -262,3 +265,168 @@ def render_pie_chart(
 
     # Hiển thị chart trong streamlit
     st.plotly_chart(fig, use_container_width=True)
+
+
+# Nhãn hiển thị cho các chiều của percentile cycle/lead time
+FLOW_DIMENSION_LABELS = {
+    "issuetype": "Loại issue",
+    "feature": "Feature",
+    "assignee": "Assignee",
+}
+
+
+def render_status_analytics(status_analytics):
+    """
+    Hiển thị time-in-status và percentile cycle/lead time (đã tính sẵn khi load sprint)
+
+    Args:
+        status_analytics: Kết quả ``SprintService.get_status_analytics()``
+    """
+    st.subheader("⏱️ Time-in-status & Cycle time")
+    if not status_analytics:
+        st.warning("Không có dữ liệu changelog để tính cycle time")
+        return
+
+    time_in_status = status_analytics["time_in_status"]
+    if not time_in_status.empty:
+        average_hours = time_in_status.mean().round(1)
+        fig = go.Figure(
+            go.Bar(
+                x=average_hours.index.tolist(),
+                y=average_hours.tolist(),
+                marker_color=[
+                    STATUS_ORDER.get(status, {}).get("color", "#95a5a6")
+                    for status in average_hours.index
+                ],
+                hovertemplate="<b>%{x}</b><br>Trung bình: %{y}h<extra></extra>",
+            )
+        )
+        fig.update_layout(
+            title={
+                "text": "Số giờ trung bình ở mỗi Status",
+                "x": 0.5,
+                "xanchor": "center",
+                "font": {"size": 16, "color": "#2c3e50"},
+            },
+            yaxis_title="Giờ",
+            height=300,
+            plot_bgcolor="rgba(0,0,0,0)",
+            paper_bgcolor="rgba(0,0,0,0)",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    dimension = st.radio(
+        "Percentile cycle/lead time (giờ) theo",
+        options=list(FLOW_DIMENSION_LABELS),
+        format_func=FLOW_DIMENSION_LABELS.get,
+        horizontal=True,
+    )
+    st.dataframe(status_analytics["percentiles"][dimension], use_container_width=True)
+
+    with st.expander("Ma trận time-in-status (giờ) theo issue"):
+        st.dataframe(time_in_status, use_container_width=True)
+
+
+# Đơn vị burndown: nhãn hiển thị -> hậu tố cột trong bảng burndown
+BURNDOWN_UNITS = {"Points": "points", "Số issue": "count"}
+
+
+def render_burndown_chart(burndown):
+    """
+    Render burndown (remaining + ideal) và burnup (done / total) của sprint
+
+    Args:
+        burndown: Kết quả ``SprintService.get_burndown()``
+    """
+    st.subheader("📉 Burndown / Burnup")
+    if burndown is None or burndown.empty:
+        st.warning("Không có dữ liệu để vẽ burndown")
+        return
+
+    unit_label = st.radio(
+        "Đơn vị", options=list(BURNDOWN_UNITS), horizontal=True, key="burndown_unit"
+    )
+    unit = BURNDOWN_UNITS[unit_label]
+    dates = [d.strftime("%d/%m") for d in burndown.index]
+
+    fig = go.Figure()
+    lines = [
+        (f"remaining_{unit}", "Còn lại", "#e74c3c", None),
+        (f"ideal_{unit}", "Lý tưởng", "#95a5a6", "dash"),
+        (f"done_{unit}", "Đã xong (burnup)", "#22c55e", None),
+        (f"total_{unit}", "Scope", "#34495e", "dot"),
+    ]
+    for column, name, color, dash in lines:
+        fig.add_trace(
+            go.Scatter(
+                x=dates,
+                y=burndown[column],
+                name=name,
+                mode="lines+markers" if dash is None else "lines",
+                line=dict(color=color, dash=dash),
+                hovertemplate=f"<b>{name}</b><br>%{{x}}: %{{y}}<extra></extra>",
+            )
+        )
+
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title=unit_label,
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_snapshot_history(
+    sprint_service: SprintService, sprint_id: int, all_sprints
+):
+    """
+    Hiển thị trạng thái sprint tại một ngày trong quá khứ và so sánh với sprint khác,
+    đọc từ snapshot store (không gọi API)
+
+    Args:
+        sprint_service: Sprint service đã set board
+        sprint_id: Sprint đang xem
+        all_sprints: Danh sách SprintRecord của board
+    """
+    with st.expander("🕰️ Snapshot lịch sử của sprint"):
+        snapshot_dates = sprint_service.get_snapshot_dates(sprint_id)
+        if not snapshot_dates:
+            st.info("Chưa có snapshot - snapshot được ghi mỗi lần load sprint từ API")
+            return
+
+        as_of_date = st.select_slider(
+            "Trạng thái tại ngày",
+            options=snapshot_dates,
+            value=snapshot_dates[-1],
+            format_func=lambda d: d.strftime("%d/%m/%Y"),
+        )
+        state = sprint_service.get_snapshot_as_of(sprint_id, as_of_date)
+        render_chart_by_status(
+            {
+                status: int(count)
+                for status, count in state["status"].value_counts().items()
+            }
+        )
+        st.dataframe(state, use_container_width=True)
+
+        other_sprints = {
+            sprint.display_name: sprint.id
+            for sprint in all_sprints
+            if sprint.id != sprint_id and sprint_service.has_snapshot(sprint.id)
+        }
+        if not other_sprints:
+            return
+        other_name = st.selectbox("So sánh với sprint", options=list(other_sprints))
+        comparison = sprint_service.compare_sprint_snapshots(
+            sprint_id, other_sprints[other_name], as_of_date=as_of_date
+        )
+        labels = {"left": "Sprint này", "right": other_name}
+        col1, col2 = st.columns(2)
+        with col1:
+            st.dataframe(comparison["totals"].rename(columns=labels))
+        with col2:
+            st.dataframe(comparison["by_status"].rename(columns=labels, level=0))
+        st.caption(f"{len(comparison['carried_over'])} issue có mặt ở cả hai sprint")
@@ -0,0 +1,169 @@
+"""
+Component hiển thị trend velocity / done / reopen / drift qua nhiều sprint
+"""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+# Nhãn hiển thị cho bảng trend
+TREND_LABELS = {
+    "sprint_name": "Sprint",
+    "issue_count": "Số issue",
+    "committed_points": "Points cam kết",
+    "velocity_points": "Velocity (points)",
+    "done_count": "Issue done",
+    "reopen_count": "Reopen",
+    "reopen_rate": "Tỉ lệ reopen (%)",
+    "estimate_hours": "Estimate (h)",
+    "spent_hours": "Spent (h)",
+    "drift_pct": "Drift (%)",
+    "seconds": "Thời gian load (s)",
+}
+
+
+def _layout(fig, title: str, yaxis_title: str = ""):
+    fig.update_layout(
+        title={
+            "text": title,
+            "x": 0.5,
+            "xanchor": "center",
+            "font": {"size": 16, "color": "#2c3e50"},
+        },
+        yaxis_title=yaxis_title,
+        height=350,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_trend_charts(trend):
+    """
+    Render các chart trend của sprint
+
+    Args:
+        trend: Kết quả ``build_sprint_trend`` (sprint cũ nhất trước)
+    """
+    if trend is None or trend.empty:
+        st.warning("Không có sprint nào để hiển thị trend")
+        return
+
+    sprints = trend["sprint_name"].tolist()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = go.Figure()
+        fig.add_trace(
+            go.Bar(
+                x=sprints,
+                y=trend["committed_points"],
+                name="Cam kết",
+                marker_color="#95a5a6",
+            )
+        )
+        fig.add_trace(
+            go.Bar(
+                x=sprints,
+                y=trend["velocity_points"],
+                name="Velocity",
+                marker_color="#22c55e",
+            )
+        )
+        _layout(fig, "Velocity (points)", "Points")
+    with col2:
+        fig = go.Figure(
+            go.Scatter(
+                x=sprints,
+                y=trend["done_count"],
+                name="Issue done",
+                mode="lines+markers",
+                line=dict(color="#3498db"),
+            )
+        )
+        _layout(fig, "Số issue done trong sprint", "Issue")
+
+    col3, col4 = st.columns(2)
+    with col3:
+        fig = go.Figure(
+            go.Scatter(
+                x=sprints,
+                y=trend["reopen_rate"],
+                name="Reopen",
+                mode="lines+markers",
+                line=dict(color="#e74c3c"),
+            )
+        )
+        _layout(fig, "Tỉ lệ reopen", "%")
+    with col4:
+        fig = go.Figure(
+            go.Bar(
+                x=sprints,
+                y=trend["drift_pct"],
+                name="Drift",
+                marker_color=[
+                    "#e74c3c" if drift > 0 else "#22c55e" for drift in trend["drift_pct"]
+                ],
+            )
+        )
+        _layout(fig, "Chênh lệch Spent so với Estimate", "%")
+
+    st.dataframe(
+        trend[list(TREND_LABELS)].rename(columns=TREND_LABELS),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+def render_forecast(forecast: dict, completion_dates: dict, unit_label: str):
+    """
+    Render kết quả dự báo Monte Carlo: số sprint / ngày dự kiến theo mức tin cậy
+    và phân phối xác suất
+
+    Args:
+        forecast: Kết quả ``forecast_completion``
+        completion_dates: Kết quả ``forecast_dates``
+        unit_label: Nhãn đơn vị backlog (points / issue)
+    """
+    columns = st.columns(len(forecast["confidence"]))
+    for column, (level, sprints) in zip(columns, forecast["confidence"].items()):
+        with column:
+            completion_date = completion_dates.get(level)
+            st.metric(
+                f"Độ tin cậy {level}%",
+                f"{sprints} sprint" if sprints is not None else "Không xác định",
+                completion_date.strftime("%d/%m/%Y") if completion_date else None,
+                delta_color="off",
+            )
+    if forecast["unfinished_rate"]:
+        st.warning(
+            f"{forecast['unfinished_rate']:.1%} trial chưa xong backlog "
+            f"{unit_label} trong giới hạn mô phỏng"
+        )
+
+    distribution = forecast["distribution"]
+    if distribution.empty:
+        return
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            x=distribution["sprints"],
+            y=distribution["probability"] * 100,
+            name="Xác suất",
+            marker_color="#3498db",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=distribution["sprints"],
+            y=distribution["cumulative"] * 100,
+            name="Tích lũy",
+            mode="lines+markers",
+            line=dict(color="#22c55e"),
+        )
+    )
+    _layout(
+        fig,
+        f"Phân phối số sprint cần thiết ({forecast['trials']:,} trial)",
+        "%",
+    )
@@ -3,7 +3,8 @@ User Avatar Helper - Helper class để quản lý avatar và user data
 """
 
 from typing import Dict, List, Optional
-import streamlit as st
+from service.clients.jira.user_directory import user_directory
+from service.utils.avatar_cache import avatar_cache
 
 
 class UserAvatarHelper:
@@ -15,31 +16,10 @@ class UserAvatarHelper:
 
     def __init__(self, jira_client):
         self.jira = jira_client
-        self._user_cache = {}
-        self._init_user_cache()
-
-    def _init_user_cache(self):
-        """Khởi tạo cache cho user data"""
-        try:
-            self._user_cache = {
-                user.get("displayName"): user for user in self.jira.users
-            }
-        except AttributeError:
-            # Fallback nếu không có jira.users
-            self._user_cache = {}
 
     def get_user_data(self, display_name: str) -> Dict:
-        """Lấy user data với cache"""
-        if display_name in self._user_cache:
-            return self._user_cache[display_name]
-
-        # Fallback to API call
-        try:
-            user_data = self.jira.user_service.get_user_by_display_name(display_name)
-            self._user_cache[display_name] = user_data  # Cache for next time
-            return user_data
-        except Exception:
-            return {}
+        """Lấy user data từ danh bạ user dùng chung"""
+        return user_directory.get_by_display_name(display_name) or {}
 
     def get_avatar_url(self, display_name: str) -> str:
         """Lấy avatar URL cho user"""
@@ -48,19 +28,18 @@ class UserAvatarHelper:
 
     def get_short_name(self, display_name: str) -> str:
         """Lấy short name cho user"""
-        user_data = self.get_user_data(display_name)
-        return user_data.get("shortName", display_name)
+        return user_directory.get_short_name(display_name)
 
     def render_user_avatar_html(
         self, display_name: str, size: Optional[int] = None
     ) -> str:
-        """Render HTML cho avatar của user"""
-        avatar_url = self.get_avatar_url(display_name)
-        if not avatar_url:
+        """Render HTML cho avatar của user (ảnh nhúng data URI từ avatar cache)"""
+        size = size or self.AVATAR_SIZE
+        avatar_src = avatar_cache.get_data_uri(self.get_avatar_url(display_name), size)
+        if not avatar_src:
             return ""
 
-        size = size or self.AVATAR_SIZE
-        return f'<img src="{avatar_url}?s={size}" class="custom-img" style="{self.DEFAULT_AVATAR_STYLE}">'
+        return f'<img src="{avatar_src}" class="custom-img" style="{self.DEFAULT_AVATAR_STYLE}">'
 
     def render_user_display_with_avatar(
         self, display_name: str, additional_info: str = "", use_short_name: bool = True
@@ -76,14 +55,20 @@ class UserAvatarHelper:
         else:
             return f"**{name_to_show}**{additional_info}"
 
+    def prefetch_avatars(self, display_names: List[str]):
+        """Tải song song avatar chưa cache của các user trước khi render"""
+        avatar_cache.prefetch(self.get_avatar_url(name) for name in display_names)
+
     def render_avatar_list_for_day(self, users_off: List[Dict]) -> str:
         """Render danh sách avatar cho một ngày"""
         avatar_list = []
         for user_data in users_off:
             display_name = user_data["user_name"]
-            avatar_url = self.get_avatar_url(display_name)
-            if avatar_url:
-                avatar_list.append(f"![Ảnh]({avatar_url}?s={self.AVATAR_SIZE})")
+            avatar_src = avatar_cache.get_data_uri(
+                self.get_avatar_url(display_name), self.AVATAR_SIZE
+            )
+            if avatar_src:
+                avatar_list.append(f"![Ảnh]({avatar_src})")
 
         # Loại bỏ duplicates và giữ thứ tự
         unique_avatars = list(dict.fromkeys(avatar_list))
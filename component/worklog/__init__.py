@@ -2,13 +2,21 @@
 
 from .worklog_table import display_worklog_table, _prepare_worklog_data
 from .worklog_stats import display_worklog_statistics
-from .worklog_utils import _get_user_avatar, _truncate_comment, _break_long_text
+from .worklog_capacity import display_worklog_capacity
+from .worklog_gaps import display_worklog_gaps
+from .worklog_utils import (
+    _get_user_avatar,
+    _prefetch_user_avatars,
+    _truncate_comment,
+)
 
 __all__ = [
     "display_worklog_table",
     "display_worklog_statistics",
+    "display_worklog_capacity",
+    "display_worklog_gaps",
     "_prepare_worklog_data",
     "_get_user_avatar",
+    "_prefetch_user_avatars",
     "_truncate_comment",
-    "_break_long_text",
 ]
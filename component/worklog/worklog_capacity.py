@@ -0,0 +1,85 @@
+"""Component hiển thị năng lực / mức sử dụng của team từ worklog và ngày nghỉ"""
+
+from datetime import date
+
+import streamlit as st
+
+from conf import validate_supabase_config
+from service.capacity_service import CapacityReport, cached_capacity
+from service.time_off_service import cached_time_off_in_range
+from .worklog_utils import _hash_worklog_frame
+
+
+def _resolve_range(df_worklog, start_date=None, end_date=None):
+    """Khoảng ngày của báo cáo (chuỗi YYYY-MM-DD), mặc định theo ngày có worklog"""
+    start = date.fromisoformat(start_date) if start_date else None
+    end = date.fromisoformat(end_date) if end_date else None
+    if start is None or end is None:
+        dates = df_worklog["Date"]
+        start = start or dates.min().date()
+        end = end or dates.max().date()
+    return start, end
+
+
+def _get_capacity_report(df_worklog, start_date=None, end_date=None) -> CapacityReport:
+    """Capacity của bảng worklog trong khoảng ngày (ngày nghỉ và kết quả đều được memo)"""
+    start, end = _resolve_range(df_worklog, start_date, end_date)
+    is_valid, _ = validate_supabase_config()
+    if not is_valid:
+        # Chưa cấu hình Supabase: coi như không có ngày nghỉ, không tạo client
+        # (client báo lỗi cấu hình bằng st.error ở mỗi lần gọi)
+        time_off_data = []
+    else:
+        try:
+            time_off_data = cached_time_off_in_range(start, end)
+        except Exception as e:
+            # Không đọc được ngày nghỉ: vẫn tính theo ngày làm việc
+            print(f"Warning: Could not load time off: {e}")
+            time_off_data = []
+    return cached_capacity(
+        _hash_worklog_frame(df_worklog), df_worklog, time_off_data, start, end
+    )
+
+
+def display_worklog_capacity(df_worklog, start_date=None, end_date=None):
+    """Hiển thị giờ kỳ vọng, giờ đã log và mức sử dụng theo team / user"""
+    report = _get_capacity_report(df_worklog, start_date, end_date)
+    team = report.team_summary()
+
+    st.subheader("📈 Năng lực & mức sử dụng")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("📅 Ngày làm việc", team["working_days"])
+    col2.metric("🎯 Giờ kỳ vọng", f"{team['expected']:.1f}h")
+    col3.metric("⏱️ Giờ đã log", f"{team['logged']:.1f}h", f"{team['diff']:+.1f}h")
+    col4.metric(
+        "📊 Mức sử dụng",
+        f"{team['utilization']:.0%}" if team["utilization"] is not None else "-",
+    )
+
+    with st.expander("👥 Chi tiết theo user", expanded=False):
+        by_user = report.by_user().reset_index()
+        by_user["utilization"] = by_user["utilization"] * 100
+        st.dataframe(
+            by_user,
+            hide_index=True,
+            column_config={
+                "User": st.column_config.TextColumn("User", width="medium"),
+                "working_days": st.column_config.NumberColumn(
+                    "Ngày làm việc", help="Không tính ngày nghỉ", format="%.1f"
+                ),
+                "leave_days": st.column_config.NumberColumn(
+                    "Ngày nghỉ", format="%.1f"
+                ),
+                "expected": st.column_config.NumberColumn(
+                    "Kỳ vọng (h)", format="%.1f"
+                ),
+                "logged": st.column_config.NumberColumn("Đã log (h)", format="%.1f"),
+                "diff": st.column_config.NumberColumn("Chênh lệch (h)", format="%+.1f"),
+                "utilization": st.column_config.ProgressColumn(
+                    "Mức sử dụng",
+                    format="%.0f%%",
+                    min_value=0,
+                    max_value=max(100.0, by_user["utilization"].fillna(0).max()),
+                ),
+            },
+        )
@@ -0,0 +1,51 @@
+"""Component hiển thị các ngày làm việc bị log thiếu giờ (bảng do job kiểm tra worklog tạo)"""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from service.utils.worklog_gap_store import worklog_gap_store
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_worklog_gaps(last_modified: float) -> pd.DataFrame:
+    """Bảng gap, memo theo thời điểm file được ghi (job chạy lại thì đọc lại)"""
+    return worklog_gap_store.load_gaps()
+
+
+def display_worklog_gaps(start_date=None, end_date=None):
+    """Hiển thị các ngày log thiếu giờ trong khoảng ngày (chuỗi YYYY-MM-DD)"""
+    st.subheader("⏰ Ngày log thiếu giờ")
+    last_run = worklog_gap_store.load_state().get("last_run")
+    if not last_run:
+        st.caption(
+            "Chưa có dữ liệu. Chạy `python check_worklog_gaps.py` (ví dụ đặt cron mỗi giờ)."
+        )
+        return
+
+    gaps = _load_worklog_gaps(worklog_gap_store.last_modified())
+    if start_date:
+        gaps = gaps[gaps["Date"] >= pd.Timestamp(start_date)]
+    if end_date:
+        gaps = gaps[gaps["Date"] <= pd.Timestamp(end_date)]
+
+    updated_at = datetime.fromisoformat(last_run).strftime("%d/%m/%Y %H:%M")
+    if gaps.empty:
+        st.success("✅ Không có ngày làm việc nào bị log thiếu giờ trong khoảng này")
+    else:
+        st.dataframe(
+            gaps,
+            hide_index=True,
+            column_config={
+                "User": st.column_config.TextColumn("User", width="medium"),
+                "Date": st.column_config.DateColumn("Ngày", format="DD/MM/YYYY"),
+                "expected": st.column_config.NumberColumn("Kỳ vọng (h)", format="%.1f"),
+                "logged": st.column_config.NumberColumn("Đã log (h)", format="%.2f"),
+                "missing": st.column_config.NumberColumn("Thiếu (h)", format="%.2f"),
+            },
+        )
+    st.caption(
+        f"Cập nhật lúc {updated_at} bởi `python check_worklog_gaps.py`; "
+        "chỉ tính các ngày đã kết thúc."
+    )
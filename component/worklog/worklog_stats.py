@@ -1,131 +1,120 @@
 """Component hiển thị thống kê worklog"""
 
+import hashlib
+import numpy as np
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from io import BytesIO
-from .worklog_utils import _get_user_avatar
+from functools import partial
+from openpyxl.styles import Font
+from service.utils.excel_writer import ExcelSheet, write_excel
+from conf import WORKDAY_HOURS
+from .worklog_capacity import _get_capacity_report
+from .worklog_utils import (
+    _get_user_avatar,
+    _hash_worklog_frame,
+    _prefetch_user_avatars,
+)
+
+
+TOTAL_COLUMN = "Tổng (h)"
+TOTAL_ROW = "TỔNG"
+DISPLAY_DATE_FORMAT = "%d/%m/%Y"
+WEEKDAY_LABELS = ["Thứ 2", "Thứ 3", "Thứ 4", "Thứ 5", "Thứ 6", "Thứ 7", "CN"]
 
 
 def _create_sorted_pivot_table(df_worklog, add_totals=True):
-    """Tạo pivot table với columns được sort theo thời gian tăng dần"""
+    """
+    Tạo pivot table với columns được sort theo thời gian tăng dần
+
+    Cột của pivot là ngày (Timestamp, từ cột Date kiểu datetime) nên chỉ cần
+    sort_index; thêm cột / hàng tổng khi có nhiều hơn một ngày.
+    """
     # Tạo pivot table: hàng = User, cột = Date, giá trị = tổng giờ
-    pivot_table = df_worklog.pivot_table(
-        index="User", columns="Date", values="Time (Hours)", aggfunc="sum", fill_value=0
-    ).round(2)
-
-    # SORT CỘT THEO THỜI GIAN TĂNG DẦN
-    # Convert column names to datetime for sorting
-    date_columns = []
-    other_columns = []
-
-    for col in pivot_table.columns:
-        if col == "Tổng (h)":
-            other_columns.append(col)
-        else:
-            try:
-                # Parse DD/MM/YYYY format
-                date_obj = datetime.strptime(col, "%d/%m/%Y")
-                date_columns.append((date_obj, col))
-            except:
-                other_columns.append(col)
-
-    # Sort date columns by datetime object
-    date_columns.sort(key=lambda x: x[0])
-    sorted_date_columns = [col for _, col in date_columns]
-
-    # Reorder columns: sorted dates first, then other columns (like "Tổng (h)")
-    new_column_order = sorted_date_columns + other_columns
-    pivot_table = pivot_table.reindex(columns=new_column_order)
-
-    # Chỉ thêm totals nếu được yêu cầu
-    if add_totals:
-        # Kiểm tra số ngày để quyết định có hiển thị tổng hay không
-        num_dates = len(sorted_date_columns)
-        show_totals = num_dates > 1
-
-        if show_totals:
-            # Thêm cột tổng chỉ khi có nhiều ngày (nếu chưa có)
-            if "Tổng (h)" not in pivot_table.columns:
-                pivot_table["Tổng (h)"] = pivot_table[sorted_date_columns].sum(axis=1)
-
-            # Thêm hàng tổng chỉ khi có nhiều ngày
-            total_row = pivot_table.sum(axis=0)
-            total_row.name = "TỔNG"
-            pivot_table = pd.concat([pivot_table, total_row.to_frame().T])
+    pivot_table = (
+        df_worklog.groupby(["User", "Date"])["Time (Hours)"]
+        .sum()
+        .unstack(fill_value=0)
+        .round(2)
+        .sort_index(axis=1)
+    )
+    date_columns = list(pivot_table.columns)
+
+    # Chỉ thêm totals nếu được yêu cầu và có nhiều ngày
+    if add_totals and len(date_columns) > 1:
+        pivot_table[TOTAL_COLUMN] = pivot_table[date_columns].sum(axis=1)
+        total_row = pivot_table.sum(axis=0)
+        total_row.name = TOTAL_ROW
+        pivot_table = pd.concat([pivot_table, total_row.to_frame().T])
 
     return pivot_table
 
 
+def _format_export_columns(frame):
+    """Đổi cột / giá trị ngày thành chuỗi DD/MM/YYYY để export"""
+    frame = frame.copy()
+    frame.columns = [
+        (
+            column.strftime(DISPLAY_DATE_FORMAT)
+            if isinstance(column, pd.Timestamp)
+            else column
+        )
+        for column in frame.columns
+    ]
+    for column in frame.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[column]):
+            frame[column] = frame[column].dt.strftime(DISPLAY_DATE_FORMAT)
+    return frame
+
+
 def _create_excel_export_data(df_worklog):
     """Tạo data export Excel từ worklog dataframe - TÁCH BIỆT khỏi UI"""
     # Tạo copy của dataframe để không ảnh hưởng UI
     df_copy = df_worklog.copy()
-    return _create_sorted_pivot_table(df_copy, add_totals=True)
+    return _format_export_columns(_create_sorted_pivot_table(df_copy, add_totals=True))
 
 
 def _export_to_excel(df_worklog, start_date=None, end_date=None):
     """Export worklog statistics to Excel file - HOÀN TOÀN TÁCH BIỆT"""
-    # Tạo deep copy để đảm bảo không ảnh hưởng original data
-    df_export = df_worklog.copy(deep=True)
-
-    # Tạo data cho export - sử dụng data copy
-    pivot_table = _create_excel_export_data(df_export)
-
-    # Tạo BytesIO buffer để lưu Excel file
-    output = BytesIO()
-
-    # Tạo Excel writer
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:  # type: ignore
-        # Export pivot table
-        pivot_table.to_excel(
-            writer,
-            sheet_name="Thống kê theo User",
-            startrow=4,  # Để chỗ cho header info
-            index=True,
-        )
-
-        # Export raw data (sử dụng original df copy, không phải pivot)
-        df_export.to_excel(writer, sheet_name="Raw Data", index=False)
+    # Pivot tính trên cột Date kiểu datetime (đúng thứ tự ngày), rồi mới format
+    pivot_table = _create_excel_export_data(df_worklog)
+    # Copy raw data với ngày dạng DD/MM/YYYY, không ảnh hưởng original data
+    df_export = _format_export_columns(df_worklog)
+
+    # Header info phía trên bảng thống kê
+    header_info = [
+        ("📊 BÁO CÁO THỐNG KÊ WORKLOG THEO USER", Font(bold=True, size=14)),
+        (
+            (
+                f"📅 Khoảng thời gian: {start_date} → {end_date}"
+                if start_date and end_date
+                else ""
+            ),
+            Font(size=12),
+        ),
+        (f"📊 Tổng số user: {len(pivot_table.index)}", Font(size=12)),
+    ]
+
+    # Ghi streaming (write_only): raw data được đổ theo chunk, không giữ từng ô
+    return write_excel(
+        [
+            ExcelSheet(
+                name="Thống kê theo User",
+                frame=pivot_table,
+                index=True,
+                title_rows=header_info,
+                startrow=4,  # Để chỗ cho header info
+            ),
+            # Raw data (sử dụng original df copy, không phải pivot)
+            ExcelSheet(name="Raw Data", frame=df_export),
+        ]
+    )
 
-        # Get workbook and worksheets
-        workbook = writer.book
-        stats_sheet = writer.sheets["Thống kê theo User"]
-        raw_sheet = writer.sheets["Raw Data"]
 
-        # Add header info to stats sheet
-        stats_sheet["A1"] = "📊 BÁO CÁO THỐNG KÊ WORKLOG THEO USER"
-        stats_sheet["A2"] = (
-            f"📅 Khoảng thời gian: {start_date} → {end_date}"
-            if start_date and end_date
-            else ""
-        )
-        stats_sheet["A3"] = f"📊 Tổng số user: {len(pivot_table.index)}"
-
-        # Format header
-        from openpyxl.styles import Font, Alignment
-
-        stats_sheet["A1"].font = Font(bold=True, size=14)
-        stats_sheet["A2"].font = Font(size=12)
-        stats_sheet["A3"].font = Font(size=12)
-
-        # Auto-adjust column widths
-        for sheet in [stats_sheet, raw_sheet]:
-            for column in sheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                sheet.column_dimensions[column_letter].width = adjusted_width
-
-    # Get Excel data
-    output.seek(0)
-    return output.getvalue()
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_excel_export(data_hash: str, _df_worklog, start_date, end_date) -> bytes:
+    """File Excel của bảng worklog (memo theo hash dữ liệu và khoảng thời gian)"""
+    return _export_to_excel(_df_worklog, start_date, end_date)
 
 
 def display_worklog_statistics(df_worklog, start_date=None, end_date=None):
@@ -148,37 +137,44 @@ def display_worklog_statistics(df_worklog, start_date=None, end_date=None):
             current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"worklog_stats_{current_time}.xlsx"
 
-        # Create stable key không thay đổi theo thời gian
-        export_key = (
-            f"excel_export_{abs(hash(f'{len(df_worklog)}_{start_date}_{end_date}'))}"
+        # Key ổn định theo nội dung data, không thay đổi theo thời gian
+        data_hash = _hash_worklog_frame(df_worklog)
+        export_key = f"excel_export_{data_hash}"
+
+        # File chỉ được tạo khi bấm nút (data là callable), và được memo. Lỗi
+        # tạo file xảy ra lúc tải (ngoài lần chạy script) nên không bọc try ở đây
+        st.download_button(
+            label="📥 Xuất Excel",
+            data=partial(
+                _cached_excel_export, data_hash, df_worklog, start_date, end_date
+            ),
+            on_click="ignore",
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            help=f"Click để tải file {filename}",
+            key=export_key,
+            use_container_width=False,  # Avoid UI layout shifts
         )
 
-        try:
-            st.download_button(
-                label="📥 Xuất Excel",
-                data=_export_to_excel(df_worklog, start_date, end_date),
-                file_name=filename,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                help=f"Click để tải file {filename}",
-                key=export_key,
-                use_container_width=False,  # Avoid UI layout shifts
-            )
-        except Exception as e:
-            st.error(f"❌ Lỗi tạo file Excel: {str(e)}")
-            st.info("💡 Thử lại sau hoặc liên hệ admin")
-
     # UI DISPLAY - Tạo pivot table HOÀN TOÀN RIÊNG BIỆT
     # Đảm bảo không bị ảnh hưởng bởi export action
     try:
         pivot_table = _create_sorted_pivot_table(df_display, add_totals=True)
 
+        # Giờ kỳ vọng từng ô (ngày làm việc, trừ ngày nghỉ) để tính biên độ
+        report = _get_capacity_report(df_display, start_date, end_date)
+        expected = report.expected.reindex(
+            index=pivot_table.index, columns=pivot_table.columns, fill_value=0.0
+        )
+
         # Tạo formatted index với avatar cho users (trừ hàng TỔNG)
         formatted_index = []
+        _prefetch_user_avatars(user for user in pivot_table.index if user != TOTAL_ROW)
         for user in pivot_table.index:
-            if user == "TỔNG":
+            if user == TOTAL_ROW:
                 formatted_index.append("📊 TỔNG")
             else:
-                avatar_url = _get_user_avatar(user)
+                avatar_url = _get_user_avatar(user, size=24)
                 if avatar_url:
                     formatted_user = f'<img src="{avatar_url}" width="24" style="border-radius: 50%; margin-right: 6px; vertical-align: middle;">{user}'
                 else:
@@ -189,7 +185,7 @@ def display_worklog_statistics(df_worklog, start_date=None, end_date=None):
         pivot_table.index = formatted_index
 
         # Generate HTML table
-        html_table = _generate_stats_html_table(pivot_table)
+        html_table = _generate_stats_html_table(pivot_table, expected)
 
         # Hiển thị HTML table
         st.markdown(html_table, unsafe_allow_html=True)
@@ -202,83 +198,113 @@ def display_worklog_statistics(df_worklog, start_date=None, end_date=None):
         st.info("💡 Thử refresh trang hoặc liên hệ admin")
 
 
-def _format_date_header(date_str):
+def _format_date_header(column):
     """Format header ngày với DD/MM ở trên và thứ ở dưới"""
-    if date_str == "Tổng (h)":
+    if column == TOTAL_COLUMN:
         return "Tổng<br/>(h)"
+    if not isinstance(column, pd.Timestamp):
+        return str(column)
 
-    try:
-        # Parse date từ DD/MM/YYYY
-        date_obj = datetime.strptime(date_str, "%d/%m/%Y")
+    weekday = WEEKDAY_LABELS[column.weekday()]
+    return f"{column.strftime('%d/%m')}<br/><small>{weekday}</small>"
 
-        # Tạo DD/MM
-        day_month = date_obj.strftime("%d/%m")
 
-        # Tạo thứ trong tuần
-        weekdays = ["Thứ 2", "Thứ 3", "Thứ 4", "Thứ 5", "Thứ 6", "Thứ 7", "CN"]
-        weekday = weekdays[date_obj.weekday()]
-
-        return f"{day_month}<br/><small>{weekday}</small>"
-    except:
-        return date_str
-
-
-def _format_hours_cell(value, is_total_row=False, is_total_col=False):
-    """Format ô giờ với biên độ và màu sắc"""
+def _format_hours_cell(value, expected=WORKDAY_HOURS):
+    """Format ô giờ với biên độ so với giờ kỳ vọng của ngày và màu sắc"""
     if value == 0:
         return "0.00"
 
-    # Không format biên độ cho hàng/cột tổng
-    if is_total_row or is_total_col:
-        return f"{value:.2f}"
-
-    # Tính biên độ so với 8h
-    diff = value - 8.0
+    # Tính biên độ so với giờ kỳ vọng (0 nếu cuối tuần / nghỉ cả ngày)
+    diff = value - expected
 
     if diff > 0:
-        # Trên 8h - màu xanh
+        # Trên kỳ vọng - màu xanh
         color = "#28a745"
         formatted = f"{value:.2f} (+{diff:.1f})"
     elif diff < 0:
-        # Dưới 8h - màu đỏ
+        # Dưới kỳ vọng - màu đỏ
         color = "#dc3545"
         formatted = f"{value:.2f} ({diff:.1f})"
     else:
-        # Đúng 8h - màu bình thường
+        # Đúng kỳ vọng - màu bình thường
         color = "#000000"
         formatted = f"{value:.2f}"
 
     return f'<span style="color: {color}; font-weight: 500;">{formatted}</span>'
 
 
-def _generate_stats_html_table(pivot_table):
-    """Tạo HTML table với formatting tùy chỉnh"""
-    html_table = '<table id="worklog_stats">\n'
+def _format_hours_cells(values, expected, is_total_row, is_total_col):
+    """
+    Format toàn bộ ô giờ của bảng: mỗi cặp (giờ, kỳ vọng) chỉ format một lần
+
+    Args:
+        values: Ma trận giờ (hàng × cột)
+        expected: Ma trận giờ kỳ vọng cùng shape với values
+        is_total_row: Mask các hàng tổng (không format biên độ)
+        is_total_col: Mask các cột tổng (không format biên độ)
+
+    Returns:
+        np.ndarray: Ma trận chuỗi HTML của từng ô
+    """
+    values = np.asarray(values, dtype=float)
+    pairs = np.stack([values.ravel(), np.asarray(expected, dtype=float).ravel()], axis=1)
+    uniques, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    inverse = inverse.reshape(values.shape)
+    styled = np.array(
+        [_format_hours_cell(value, target) for value, target in uniques], dtype=object
+    )
+    plain = np.array([f"{value:.2f}" for value, _ in uniques], dtype=object)
+
+    cells = styled[inverse]
+    # Không format biên độ cho hàng/cột tổng
+    no_diff = np.asarray(is_total_row)[:, None] | np.asarray(is_total_col)[None, :]
+    cells[no_diff] = plain[inverse[no_diff]]
+    return cells
+
+
+def _hash_pivot(pivot_table, expected) -> str:
+    """Hash nội dung pivot (giá trị, kỳ vọng, index đã format, header) để memo HTML"""
+    digest = hashlib.md5(pivot_table.to_numpy(dtype=float).tobytes())
+    digest.update(np.asarray(expected, dtype=float).tobytes())
+    for labels in (pivot_table.index, pivot_table.columns):
+        digest.update("\x1f".join(map(str, labels)).encode())
+    return digest.hexdigest()
+
+
+def _generate_stats_html_table(pivot_table, expected):
+    """Tạo HTML table với formatting tùy chỉnh (memo theo hash của pivot)"""
+    return _render_stats_html_table(
+        _hash_pivot(pivot_table, expected), pivot_table, expected
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _render_stats_html_table(pivot_hash: str, _pivot_table, _expected) -> str:
+    """Render HTML theo cột: header format một lần / cột, các ô format vectorized"""
+    columns = list(_pivot_table.columns)
+    users = list(_pivot_table.index)
+    is_total_row = np.array([user == "📊 TỔNG" for user in users], dtype=bool)
+    is_total_col = np.array([column == TOTAL_COLUMN for column in columns], dtype=bool)
+    cells = _format_hours_cells(
+        _pivot_table.to_numpy(dtype=float),
+        np.asarray(_expected, dtype=float),
+        is_total_row,
+        is_total_col,
+    )
 
     # Header với format ngày đặc biệt
-    html_table += "<thead><tr><th>User</th>"
-    for col in pivot_table.columns:
-        formatted_header = _format_date_header(col)
-        html_table += f"<th>{formatted_header}</th>"
-    html_table += "</tr></thead>\n"
-
-    # Body
-    html_table += "<tbody>\n"
-    for i, (user, row) in enumerate(pivot_table.iterrows()):
-        is_total_row = user == "📊 TỔNG"
-        row_class = ' class="total-row"' if is_total_row else ""
-        html_table += f"<tr{row_class}>"
-        html_table += f'<td class="user-col">{user}</td>'
-
-        for j, (col_name, cell_value) in enumerate(row.items()):
-            is_total_col = col_name == "Tổng (h)"
-            formatted_value = _format_hours_cell(cell_value, is_total_row, is_total_col)
-            html_table += f"<td>{formatted_value}</td>"
-
-        html_table += "</tr>\n"
-
-    html_table += "</tbody></table>"
-    return html_table
+    headers = "".join(f"<th>{_format_date_header(column)}</th>" for column in columns)
+    parts = [
+        '<table id="worklog_stats">\n',
+        f"<thead><tr><th>User</th>{headers}</tr></thead>\n",
+        "<tbody>\n",
+    ]
+    for user, total_row, row_cells in zip(users, is_total_row, cells):
+        row_class = ' class="total-row"' if total_row else ""
+        row_html = "".join(f"<td>{cell}</td>" for cell in row_cells)
+        parts.append(f'<tr{row_class}><td class="user-col">{user}</td>{row_html}</tr>\n')
+    parts.append("</tbody></table>")
+    return "".join(parts)
 
 
 def _add_stats_css():
@@ -2,80 +2,123 @@
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from service.utils.time_utils import seconds_to_hours
-from .worklog_utils import _get_user_avatar, _break_long_text, _truncate_comment
-
-
-def _prepare_worklog_data(worklog_data):
-    """Chuẩn bị dữ liệu worklog cho hiển thị"""
-    user_worklog_data = []
-
-    for issue in worklog_data:
-        for wl in issue["worklogs"]:
-            worklog_date = datetime.strptime(wl["started"][:10], "%Y-%m-%d").strftime(
-                "%d/%m/%Y"
-            )
-            worklog_time = wl["started"][11:16]  # Lấy giờ:phút
-
-            user_worklog_data.append(
-                {
-                    "User": wl["author"],
-                    "Date": worklog_date,
-                    "Time": worklog_time,
-                    "Issue Key": issue["key"],
-                    "Issue Summary": issue["summary"],
-                    "Status": issue["status"],
-                    "Time Spent": wl["timeSpent"],
-                    "Time (Hours)": seconds_to_hours(wl["timeSpentSeconds"]),
-                    "Comment": _truncate_comment(wl["comment"]),
-                }
-            )
-
-    # Sắp xếp theo User, sau đó theo Date
-    user_worklog_data.sort(key=lambda x: (x["User"], x["Date"]))
-    return user_worklog_data
-
-
-def _display_user_header(user, user_data):
-    """Hiển thị header với avatar và thông tin user - UI gọn"""
-    # Tính tổng giờ cho user này
-    total_hours = sum(item["Time (Hours)"] for item in user_data)
-    unique_issues = len(set(item["Issue Key"] for item in user_data))
-
-    # Lấy avatar
-    avatar_url = _get_user_avatar(user)
-
-    # Layout compact với nền xám
-    with st.container():
-        # Tạo một div với nền xám bao quanh toàn bộ header
-        st.markdown(
-            f"""
-            <div style="
-                background-color: #f0f2f6; 
-                padding: 8px 12px; 
-                border-radius: 4px; 
-                margin-bottom: 8px;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            ">
-                <div style="display: flex; align-items: center;">
-                    {'<img src="' + avatar_url + '" width="32" style="border-radius: 50%; margin-right: 8px;">' if avatar_url else '👤'} 
-                    <strong>{user}</strong>
-                </div>
-                <div style="font-weight: 600;">
-                    {len(user_data)} worklog | {total_hours:.1f}h | {unique_issues} issues
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+from .worklog_utils import (
+    _get_user_avatar,
+    _hash_worklog_frame,
+    _prefetch_user_avatars,
+)
+
+
+# Các cột của bảng worklog (một dòng / worklog)
+WORKLOG_COLUMNS = [
+    "User",
+    "Date",
+    "Time",
+    "Issue Key",
+    "Issue Summary",
+    "Status",
+    "Time Spent",
+    "Time (Hours)",
+    "Comment",
+]
+JIRA_BROWSE_URL = "https://vieted.atlassian.net/browse/"
+
+# Chiều cao tối đa (px) của bảng worklog, bảng cuộn ảo khi nhiều dòng hơn
+WORKLOG_GRID_MAX_HEIGHT = 600
+GRID_ROW_HEIGHT = 35
+
+
+def _prepare_worklog_data(worklog_data) -> pd.DataFrame:
+    """
+    Chuẩn bị bảng worklog cho hiển thị
+
+    Cột Date là datetime64 (ngày của started) để sort / pivot theo đúng thứ tự
+    thời gian; chỉ format thành chuỗi DD/MM/YYYY khi hiển thị hoặc export.
+    """
+    rows = [
+        (
+            wl["author"],
+            wl["started"],
+            issue["key"],
+            issue["summary"],
+            issue["status"],
+            wl["timeSpent"],
+            wl["timeSpentSeconds"],
+            wl.get("comment", ""),
         )
+        for issue in worklog_data
+        for wl in issue["worklogs"]
+    ]
+    frame = pd.DataFrame(
+        rows,
+        columns=[
+            "User",
+            "started",
+            "Issue Key",
+            "Issue Summary",
+            "Status",
+            "Time Spent",
+            "seconds",
+            "Comment",
+        ],
+    )
+    started = frame["started"].astype(str)
+    frame["Date"] = pd.to_datetime(started.str[:10], format="%Y-%m-%d")
+    frame["Time"] = started.str[11:16]  # Lấy giờ:phút
+    frame["Time (Hours)"] = (
+        pd.to_numeric(frame["seconds"], errors="coerce").fillna(0) / 3600
+    ).round(2)
 
+    # Sắp xếp theo User, sau đó theo Date
+    frame = frame.sort_values(["User", "Date"], kind="stable", ignore_index=True)
+    return frame[WORKLOG_COLUMNS]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_worklog_grid(data_hash: str, _df_worklog):
+    """
+    Tính sẵn bảng tổng hợp theo user và bảng worklog hiển thị (memo theo hash data)
+
+    Returns:
+        (summary, grid): summary một dòng / user (avatar, số worklog, tổng giờ,
+        số issue); grid một dòng / worklog, đã sort theo User, Date
+    """
+    by_user = _df_worklog.groupby("User", sort=False, observed=True)
+    summary = by_user.agg(
+        Worklog=("Issue Key", "size"),
+        Hours=("Time (Hours)", "sum"),
+        Issues=("Issue Key", "nunique"),
+    ).reset_index()
+    summary["User"] = summary["User"].astype(str)
+    summary["Hours"] = summary["Hours"].round(2)
+    _prefetch_user_avatars(summary["User"])
+    summary.insert(
+        0, "Avatar", [_get_user_avatar(user, size=32) for user in summary["User"]]
+    )
 
-def _display_user_filter(all_users, user_groups):
-    """Hiển thị bộ lọc user với avatar và thống kê"""
+    grid = pd.DataFrame(
+        {
+            "User": _df_worklog["User"].astype(str),
+            "STT": by_user.cumcount() + 1,  # Số thứ tự trong từng user
+            "Date": _df_worklog["Date"],
+            "Time": _df_worklog["Time"],
+            # Store URL nhưng sẽ display issue key
+            "Issue Key": JIRA_BROWSE_URL + _df_worklog["Issue Key"].astype(str),
+            "Issue Summary": _df_worklog["Issue Summary"],
+            "Time (Hours)": _df_worklog["Time (Hours)"],
+            "Comment": _df_worklog["Comment"],
+        }
+    ).reset_index(drop=True)
+    return summary, grid
+
+
+def _grid_height(rows: int) -> int:
+    """Chiều cao vừa đủ cho số dòng, tối đa WORKLOG_GRID_MAX_HEIGHT"""
+    return min(WORKLOG_GRID_MAX_HEIGHT, GRID_ROW_HEIGHT * (rows + 1) + 3)
+
+
+def _display_user_filter(summary):
+    """Hiển thị bộ lọc user với thống kê (từ bảng tổng hợp đã tính sẵn)"""
     # Initialize filter session state key
     filter_key = "worklog_user_filter"
 
@@ -83,21 +126,10 @@ def _display_user_filter(all_users, user_groups):
     user_options = []
     user_mapping = {}  # Để map từ formatted option về user name
 
-    for user in all_users:
-        # Lấy avatar
-        avatar_url = _get_user_avatar(user)
-
-        # Tính toán metrics cho user này
-        user_data = user_groups[user]
-        total_hours = sum(item["Time (Hours)"] for item in user_data)
-        worklog_count = len(user_data)
-
-        # Format với avatar và metrics
-        if avatar_url:
-            formatted = f"👤 {user} ({worklog_count} logs, {total_hours:.1f}h)"
-        else:
-            formatted = f"👤 {user} ({worklog_count} logs, {total_hours:.1f}h)"
-
+    for user, worklog_count, total_hours in zip(
+        summary["User"], summary["Worklog"], summary["Hours"]
+    ):
+        formatted = f"👤 {user} ({worklog_count} logs, {total_hours:.1f}h)"
         user_options.append(formatted)
         user_mapping[formatted] = user
 
@@ -119,45 +151,23 @@ def _display_user_filter(all_users, user_groups):
         selected_users = [user_mapping[formatted] for formatted in selected_formatted]
     else:
         # Không chọn gì -> hiển thị tất cả
-        selected_users = all_users
+        selected_users = summary["User"].tolist()
 
     return selected_users
 
 
-def display_worklog_table(user_worklog_data):
-    """Hiển thị bảng worklog theo user - mỗi user một bảng"""
-
-    # CSS để force text wrap trong dataframe
-    st.markdown(
-        """
-    <style>
-    .stDataFrame [data-testid="stDataFrameResizeHandle"] {
-        display: none;
-    }
-    .stDataFrame td {
-        white-space: pre-wrap !important;
-        word-wrap: break-word !important;
-        max-width: 300px !important;
-        vertical-align: top !important;
-    }
-    .stDataFrame th {
-        white-space: nowrap !important;
-    }
-    </style>
-    """,
-        unsafe_allow_html=True,
-    )
+def display_worklog_table(df_worklog):
+    """
+    Hiển thị worklog theo user trong một bảng duy nhất
 
-    # Group data theo user từ data có sẵn (KHÔNG call API)
-    user_groups = {}
-    for item in user_worklog_data:
-        user = item["User"]
-        if user not in user_groups:
-            user_groups[user] = []
-        user_groups[user].append(item)
+    Bảng tổng hợp (một dòng / user) và bảng worklog (sort theo User, Date,
+    STT đánh lại theo từng user) được tính sẵn một lần cho mỗi data; mỗi lần
+    rerun chỉ lọc theo user được chọn rồi gửi một payload Arrow cho mỗi bảng.
+    """
+    summary, grid = _build_worklog_grid(_hash_worklog_frame(df_worklog), df_worklog)
 
     # Lấy danh sách tất cả users từ data đã load
-    all_users = list(user_groups.keys())
+    all_users = summary["User"].tolist()
 
     # Header và bộ lọc trên cùng một hàng
     col1, col2, col3 = st.columns([2, 2, 2])
@@ -166,9 +176,9 @@ def display_worklog_table(user_worklog_data):
         st.subheader("👥 Danh sách Worklog theo User")
 
     with col2:
-        # Bộ lọc user với avatar - CHỈ ẨN/HIỆN bảng, KHÔNG render lại data
+        # Bộ lọc user - CHỈ lọc dòng của bảng, KHÔNG tính lại data
         if len(all_users) > 1:  # Chỉ hiển thị filter nếu có nhiều hơn 1 user
-            selected_users = _display_user_filter(all_users, user_groups)
+            selected_users = _display_user_filter(summary)
         else:
             selected_users = all_users
 
@@ -176,61 +186,52 @@ def display_worklog_table(user_worklog_data):
         # Info export Excel - updated for new UX
         st.info("💡 **📥 Xuất Excel** ở phần Thống kê sẽ tải trực tiếp")
 
-    # Hiển thị bảng cho từng user (CHỈ users được chọn)
-    # Data đã có sẵn, chỉ quyết định hiển thị hay skip
-    for user, user_data in user_groups.items():
-        if user not in selected_users:
-            continue  # CHỈ SKIP hiển thị, data vẫn còn nguyên
-
-        # Hiển thị header với avatar và thông tin
-        _display_user_header(user, user_data)
-
-        # Tạo DataFrame cho user này từ data có sẵn
-        user_df_data = []
-        for idx, item in enumerate(user_data, 1):  # Bắt đầu từ 1
-            # Tạo URL từ issue key
-            issue_key = item["Issue Key"]
-            issue_url = f"https://vieted.atlassian.net/browse/{issue_key}"
-
-            # Break long text
-            issue_summary = _break_long_text(item["Issue Summary"], 40)
-            comment = _break_long_text(item["Comment"], 50)
-
-            user_df_data.append(
-                {
-                    "STT": idx,
-                    "Date": item["Date"],
-                    "Time": item["Time"],
-                    "Issue Key": issue_url,  # Store URL nhưng sẽ display issue key
-                    "Issue Summary": issue_summary,
-                    "Time (Hours)": item["Time (Hours)"],
-                    "Comment": comment,
-                }
-            )
-
-        df_user = pd.DataFrame(user_df_data)
-        st.dataframe(
-            df_user,
-            use_container_width=True,
-            hide_index=True,  # Ẩn cột index đầu tiên
-            column_config={
-                "STT": st.column_config.NumberColumn(
-                    "STT", help="Số thứ tự", width="small"
-                ),
-                "Date": st.column_config.Column("Date", width="small"),
-                "Time": st.column_config.Column("Time", width="small"),
-                "Issue Key": st.column_config.LinkColumn(
-                    "Issue Key",
-                    help="Click để mở issue trong Jira",
-                    display_text=r"https://vieted\.atlassian\.net/browse/(.+)",
-                    width="small",
-                ),
-                "Issue Summary": st.column_config.TextColumn(
-                    "Issue Summary", width="large"
-                ),
-                "Time (Hours)": st.column_config.NumberColumn(
-                    "Time (Hours)", width="small", format="%.2f"
-                ),
-                "Comment": st.column_config.TextColumn("Comment", width="large"),
-            },
-        )
+    if len(selected_users) < len(all_users):
+        summary = summary[summary["User"].isin(selected_users)]
+        grid = grid[grid["User"].isin(selected_users)]
+
+    # Tổng hợp theo user (thay cho header riêng của từng user)
+    st.dataframe(
+        summary,
+        height=_grid_height(len(summary)),
+        hide_index=True,
+        column_config={
+            "Avatar": st.column_config.ImageColumn("", width="small"),
+            "User": st.column_config.TextColumn("User", width="medium"),
+            "Worklog": st.column_config.NumberColumn("Worklog", width="small"),
+            "Hours": st.column_config.NumberColumn(
+                "Tổng (h)", width="small", format="%.1f"
+            ),
+            "Issues": st.column_config.NumberColumn("Issues", width="small"),
+        },
+    )
+
+    # Toàn bộ worklog trong một bảng (cuộn ảo), cột User ghim bên trái
+    st.dataframe(
+        grid,
+        height=_grid_height(len(grid)),
+        hide_index=True,  # Ẩn cột index đầu tiên
+        column_config={
+            "User": st.column_config.TextColumn("User", width="medium", pinned=True),
+            "STT": st.column_config.NumberColumn(
+                "STT", help="Số thứ tự trong từng user", width="small"
+            ),
+            "Date": st.column_config.DateColumn(
+                "Date", format="DD/MM/YYYY", width="small"
+            ),
+            "Time": st.column_config.Column("Time", width="small"),
+            "Issue Key": st.column_config.LinkColumn(
+                "Issue Key",
+                help="Click để mở issue trong Jira",
+                display_text=r"https://vieted\.atlassian\.net/browse/(.+)",
+                width="small",
+            ),
+            "Issue Summary": st.column_config.TextColumn(
+                "Issue Summary", width="large"
+            ),
+            "Time (Hours)": st.column_config.NumberColumn(
+                "Time (Hours)", width="small", format="%.2f"
+            ),
+            "Comment": st.column_config.TextColumn("Comment", width="large"),
+        },
+    )
@@ -1,34 +1,27 @@
 """Utility functions cho worklog components"""
 
-from service.clients.jira.user_service import UserService
+import hashlib
 
+import pandas as pd
 
-def _get_user_avatar(username):
-    """Lấy avatar URL của user từ Jira"""
-    try:
-        user_service = UserService()
-        users = user_service.get_list_users()
+from service.clients.jira.user_directory import user_directory
+from service.utils.avatar_cache import avatar_cache
 
-        for user in users:
-            # Safe access to user attributes - could be JIRA User object or dict
-            user_display_name = ""
-            user_avatar = ""
 
-            if hasattr(user, "displayName"):
-                # JIRA User object
-                user_display_name = getattr(user, "displayName", "")
-                user_avatar = getattr(user, "avatar", "")
-            elif isinstance(user, dict):
-                # Dictionary
-                user_display_name = user.get("displayName", "")
-                user_avatar = user.get("avatar", "")
+def _get_user_avatar(username, size=32):
+    """Lấy avatar của user (data URI từ avatar cache, không gọi API mỗi lần)"""
+    return avatar_cache.get_data_uri(user_directory.get_avatar_url(username), size)
 
-            if user_display_name == username:
-                return user_avatar
-        return ""
-    except Exception as e:
-        print(f"Warning: Could not get user avatar: {e}")
-        return ""
+
+def _prefetch_user_avatars(usernames):
+    """Tải song song avatar chưa cache của các user trước khi render"""
+    avatar_cache.prefetch(user_directory.get_avatar_url(name) for name in usernames)
+
+
+def _hash_worklog_frame(df_worklog) -> str:
+    """Hash nội dung bảng worklog, dùng làm key memo (bảng hiển thị, file Excel)"""
+    hashed = pd.util.hash_pandas_object(df_worklog, index=False).to_numpy()
+    return hashlib.md5(hashed.tobytes()).hexdigest()
 
 
 def _truncate_comment(comment):
@@ -36,26 +29,3 @@ def _truncate_comment(comment):
     if len(comment) > 100:
         return comment[:100] + "..."
     return comment
-
-
-def _break_long_text(text, max_chars=50):
-    """Chia text dài thành nhiều dòng"""
-    if not text or len(text) <= max_chars:
-        return text
-
-    words = text.split()
-    lines = []
-    current_line = ""
-
-    for word in words:
-        if len(current_line + " " + word) <= max_chars:
-            current_line += (" " + word) if current_line else word
-        else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
-
-    if current_line:
-        lines.append(current_line)
-
-    return "\n".join(lines)
@@ -1,42 +1,15 @@
 """Component hiển thị worklog data - Refactored version"""
 
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-from component.worklog import display_worklog_table, display_worklog_statistics
+from component.worklog import (
+    display_worklog_table,
+    display_worklog_statistics,
+    display_worklog_capacity,
+    _prepare_worklog_data,
+)
 from service.utils.time_utils import seconds_to_hours
 
 
-def _prepare_worklog_data(worklog_data):
-    """Chuẩn bị dữ liệu worklog cho hiển thị"""
-    user_worklog_data = []
-
-    for issue in worklog_data:
-        for wl in issue["worklogs"]:
-            worklog_date = datetime.strptime(wl["started"][:10], "%Y-%m-%d").strftime(
-                "%d/%m/%Y"
-            )
-            worklog_time = wl["started"][11:16]  # Lấy giờ:phút
-
-            user_worklog_data.append(
-                {
-                    "User": wl["author"],
-                    "Date": worklog_date,
-                    "Time": worklog_time,
-                    "Issue Key": issue["key"],
-                    "Issue Summary": issue["summary"],
-                    "Status": issue["status"],
-                    "Time Spent": wl["timeSpent"],
-                    "Time (Hours)": seconds_to_hours(wl["timeSpentSeconds"]),
-                    "Comment": wl.get("comment", ""),
-                }
-            )
-
-    # Sắp xếp theo User, sau đó theo Date
-    user_worklog_data.sort(key=lambda x: (x["User"], x["Date"]))
-    return user_worklog_data
-
-
 def _calculate_worklog_metrics(worklog_data):
     """Tính toán các metrics từ worklog data"""
     total_hours = 0
@@ -91,11 +64,8 @@ def display_worklog_data(worklog_data, start_date=None, end_date=None):
         st.info("📭 Không có worklog nào trong khoảng thời gian đã chọn.")
         return
 
-    # Chuẩn bị dữ liệu
-    user_worklog_data = _prepare_worklog_data(worklog_data)
-
-    # Hiển thị thống kê trước với dates cho export
-    df_worklog = pd.DataFrame(user_worklog_data)
+    # Chuẩn bị dữ liệu (cột Date là datetime, chỉ format khi hiển thị)
+    df_worklog = _prepare_worklog_data(worklog_data)
 
     # Format dates cho Excel filename
     start_date_str = start_date.strftime("%Y-%m-%d") if start_date else None
@@ -103,5 +73,8 @@ def display_worklog_data(worklog_data, start_date=None, end_date=None):
 
     display_worklog_statistics(df_worklog, start_date_str, end_date_str)
 
+    # Giờ kỳ vọng / đã log / mức sử dụng (trừ cuối tuần và ngày nghỉ)
+    display_worklog_capacity(df_worklog, start_date_str, end_date_str)
+
     # Hiển thị bảng worklog sau
-    display_worklog_table(user_worklog_data)
+    display_worklog_table(df_worklog)
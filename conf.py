@@ -44,6 +44,29 @@ DEFAULT_FIELDS_ISSUE = [
 
 KEY_ISSUE_DEBUG = "1571"
 DEFAULT_MAX_ISSUE_PER_PAGE = 100
+DEFAULT_MAX_SPRINT_PER_PAGE = 50
+SPRINT_LIST_TTL_SECONDS = 300  # Cache danh sách sprint của board trong 5 phút
+# Xử lý sprint lớn bằng process pool: bật khi số issue >= ngưỡng (0 = tắt).
+# Worker khởi động bằng spawn (mất vài giây) nên chỉ đáng với sprint rất lớn
+SPRINT_PROCESS_POOL_MIN_ISSUES = int(os.getenv("SPRINT_PROCESS_POOL_MIN_ISSUES", "0"))
+SPRINT_PROCESS_CHUNK_SIZE = int(os.getenv("SPRINT_PROCESS_CHUNK_SIZE", "1000"))
+# Số process tối đa (0 = theo số CPU)
+SPRINT_PROCESS_MAX_WORKERS = int(os.getenv("SPRINT_PROCESS_MAX_WORKERS", "0"))
+# Báo cáo trend nhiều sprint: số sprint mặc định và số sprint load song song
+SPRINT_TREND_DEFAULT_COUNT = 6
+SPRINT_TREND_MAX_WORKERS = int(os.getenv("SPRINT_TREND_MAX_WORKERS", "4"))
+# Danh bạ user dùng chung toàn process (displayName / accountId -> user), refresh theo TTL
+USER_DIRECTORY_TTL_SECONDS = int(os.getenv("USER_DIRECTORY_TTL_SECONDS", "3600"))
+USER_SYNC_PAGE_SIZE = 200  # Số user mỗi page khi đồng bộ users/search
+# Avatar được cache trên đĩa và resize sẵn theo các size đang dùng (px)
+AVATAR_SIZES = [24, 32, 48]
+AVATAR_DOWNLOAD_TIMEOUT = 5  # Giây
+# Năng lực team: số giờ làm việc chuẩn / ngày (thứ 2 - thứ 6, trừ ngày nghỉ)
+WORKDAY_HOURS = float(os.getenv("WORKDAY_HOURS", "8"))
+TIME_OFF_CACHE_TTL_SECONDS = 300  # Cache ngày nghỉ theo khoảng ngày trong 5 phút
+# Job kiểm tra log thiếu giờ: số ngày gần nhất được theo dõi và mức thiếu được bỏ qua
+WORKLOG_GAP_LOOKBACK_DAYS = int(os.getenv("WORKLOG_GAP_LOOKBACK_DAYS", "30"))
+WORKLOG_GAP_TOLERANCE_HOURS = float(os.getenv("WORKLOG_GAP_TOLERANCE_HOURS", "0.25"))
 STATUS_IS_DEV_DONE = ["Done", "Dev Done"]
 
 STATUS_ORDER = {
@@ -4,6 +4,8 @@ from datetime import datetime
 from service.clients.jira.jira_client import get_jira_client
 from service.clients.jira.worklog_service import WorklogService
 from component.worklog_display import display_worklog_data, display_worklog_summary
+from component.worklog import display_worklog_gaps
+from component.progress_reporter import StreamlitProgressReporter
 from component.date_picker import (
     initialize_date_session_state,
     render_date_picker,
@@ -33,7 +35,7 @@ def load_worklog_data(start_date, end_date):
         return st.session_state[cache_key], True  # True = from cache
 
     # Chỉ call API khi chưa có cache
-    worklog_service = WorklogService()
+    worklog_service = WorklogService(progress=StreamlitProgressReporter())
 
     with st.spinner("Đang tìm kiếm worklog..."):
         try:
@@ -72,6 +74,9 @@ def display_worklog_results(
     # Hiển thị kết quả chi tiết với filter và dates cho export
     display_worklog_data(worklog_data, start_date, end_date)
 
+    # Ngày log thiếu giờ (bảng do job check_worklog_gaps.py cập nhật định kỳ)
+    display_worklog_gaps(start_date, end_date)
+
 
 def render_worklog_interface():
     """Render giao diện worklog"""
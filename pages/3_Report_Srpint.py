@@ -2,11 +2,15 @@ import streamlit as st
 from service.clients.jira.jira_client import get_jira_client
 from service.clients.jira.sprint_service import SprintService
 from component.dataframe import show_dataframe_with_filters
+from component.progress_reporter import StreamlitProgressReporter
 from component.report_sprint import (
     render_sprint_sidebar,
     render_cache_status,
     render_chart_by_status,
     render_pie_chart,
+    render_status_analytics,
+    render_burndown_chart,
+    render_snapshot_history,
 )
 
 # --- Page Config ---
@@ -18,7 +22,7 @@ def main():
     """Hàm chính của trang Báo cáo Sprint"""
     # --- Services ---
     jira = get_jira_client()
-    sprint_service = SprintService()
+    sprint_service = SprintService(progress=StreamlitProgressReporter())
 
     # --- Sidebar: Sprint Selection & Cache Controls ---
     selected_sprint_id, selected_sprint_name, use_cache, all_sprints = (
@@ -31,32 +35,23 @@ def main():
     try:
         # Get details of the selected sprint
         selected_sprint_details = next(
-            sprint for sprint in all_sprints if sprint["id"] == selected_sprint_id
+            sprint for sprint in all_sprints if sprint.id == selected_sprint_id
         )
         sprint_service.set_data_sprint(selected_sprint_details)
 
-        # Load issues với cache control và lấy cache info
-        result = sprint_service.get_issues_for_sprint(
+        # Load issues với cache control và lấy cache info. Trang chỉ dùng bảng
+        # sprint_service.list_issues nên không giữ lại list record
+        _, cache_info = sprint_service.get_issues_for_sprint(
             selected_sprint_id, use_cache=use_cache, return_cache_info=True
         )
 
-        if isinstance(result, tuple):
-            sprint_issues, cache_info = result
-        else:
-            sprint_issues = result
-            cache_info = {"from_cache": False, "timestamp": None}
-
-        # Ensure sprint_issues is a list
-        if sprint_issues is None:
-            sprint_issues = []
-
         # --- Thông báo Cache Status ---
         render_cache_status(cache_info)
         is_get_only_active = st.toggle("Chỉ lấy issues active", value=False)
         is_get_only_active = "active" if is_get_only_active else "all"
 
         # --- Calculations ---
-        total_issues = len(sprint_issues)
+        total_issues = len(sprint_service.list_issues)
 
         st.divider()
 
@@ -83,6 +78,11 @@ def main():
             )
         st.write(metric_sprint)
 
+        render_burndown_chart(sprint_service.get_burndown())
+        render_snapshot_history(sprint_service, selected_sprint_id, all_sprints)
+
+        render_status_analytics(sprint_service.get_status_analytics())
+
         show_dataframe_with_filters(
             sprint_service.list_issues, columns=["assignee", "summary"]
         )
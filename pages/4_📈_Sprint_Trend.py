@@ -0,0 +1,109 @@
+import streamlit as st
+from datetime import datetime
+from conf import SPRINT_TREND_DEFAULT_COUNT, SPRINT_TREND_MAX_WORKERS
+from service.clients.jira.jira_client import get_jira_client
+from service.clients.jira.sprint_service import sprint_cache_key
+from service.sprint_trend import build_sprint_trend
+from service.sprint_forecast import (
+    FORECAST_UNITS,
+    cached_forecast_completion,
+    forecast_dates,
+    remaining_backlog,
+    sprint_length_days,
+)
+from service.models.issue_model import build_issue_frame
+from service.utils.cache_utils import file_cache
+from component.sprint_trend import render_forecast, render_trend_charts
+
+# --- Page Config ---
+st.set_page_config(page_title="Trend Sprint", page_icon="📈", layout="wide")
+
+
+# --- Main ---
+def main():
+    """Hàm chính của trang Trend Sprint"""
+    jira = get_jira_client()
+
+    with st.sidebar:
+        st.markdown("### 📈 Trend Sprint")
+        closed_sprints = [
+            sprint
+            for sprint in jira.get_list_sprints("closed")
+            if sprint.state.lower() == "closed"
+        ]
+        if not closed_sprints:
+            st.error("Không tìm thấy Sprint đã đóng nào cho Board này.")
+            st.stop()
+
+        sprint_count = st.slider(
+            "Số sprint gần nhất",
+            min_value=1,
+            max_value=len(closed_sprints),
+            value=min(SPRINT_TREND_DEFAULT_COUNT, len(closed_sprints)),
+        )
+        use_cache = st.toggle(
+            "Sử dụng cache",
+            value=True,
+            help="Tắt để load lại toàn bộ sprint từ API",
+        )
+
+    st.title(f"📈 Trend {sprint_count} sprint gần nhất")
+    try:
+        with st.spinner(f"🔄 Đang tính trend cho {sprint_count} sprint..."):
+            trend = build_sprint_trend(
+                jira.board_id,
+                closed_sprints[:sprint_count],
+                max_workers=SPRINT_TREND_MAX_WORKERS,
+                use_cache=use_cache,
+            )
+        render_trend_charts(trend)
+        render_forecast_section(jira, trend)
+    except Exception as e:
+        st.error(f"❌ Lỗi khi tính trend sprint: {e}")
+        st.stop()
+
+
+def render_forecast_section(jira, trend):
+    """Dự báo thời điểm hoàn thành backlog từ throughput của các sprint trong trend"""
+    st.divider()
+    st.subheader("🔮 Dự báo hoàn thành backlog (Monte Carlo)")
+    if trend.empty:
+        return
+
+    unit_labels = {"points": "Points", "issues": "Số issue"}
+    unit = st.radio(
+        "Đơn vị",
+        options=list(FORECAST_UNITS),
+        format_func=unit_labels.get,
+        horizontal=True,
+    )
+
+    # Mặc định: backlog còn lại của sprint active (chỉ đọc file cache, không gọi API)
+    default_remaining = 0.0
+    active_sprints = jira.get_list_sprints("active")
+    if active_sprints:
+        cached_issues = file_cache.load_cache(
+            sprint_cache_key(jira.board_id, active_sprints[0].id)
+        )
+        if cached_issues:
+            default_remaining = remaining_backlog(
+                build_issue_frame(cached_issues), unit
+            )
+
+    remaining = st.number_input(
+        f"Backlog còn lại ({unit_labels[unit]})",
+        min_value=0.0,
+        value=default_remaining,
+        step=1.0,
+        help="Mặc định là phần chưa done của sprint active (nếu đã có cache)",
+    )
+    samples = tuple(trend[FORECAST_UNITS[unit]].astype(float))
+    forecast = cached_forecast_completion(samples, remaining)
+    completion_dates = forecast_dates(
+        forecast["confidence"], datetime.now(), sprint_length_days(trend)
+    )
+    render_forecast(forecast, completion_dates, unit_labels[unit])
+
+
+if __name__ == "__main__":
+    main()
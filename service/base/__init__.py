@@ -3,5 +3,6 @@ Base module cho kết nối Jira cơ bản
 """
 
 from .jira_base import JiraBase
+from .progress import LoggingProgressReporter, ProgressReporter
 
-__all__ = ["JiraBase"]
+__all__ = ["JiraBase", "LoggingProgressReporter", "ProgressReporter"]
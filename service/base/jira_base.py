@@ -1,11 +1,16 @@
+from typing import Optional
+
 from jira import JIRA
 from conf import JIRA_SERVER, JIRA_USER, JIRA_API_TOKEN
+from service.base.progress import ProgressReporter, default_progress_reporter
 
 
 class JiraBase:
     """Class cơ bản để kết nối đến Jira API"""
 
-    def __init__(self):
+    def __init__(self, progress: Optional[ProgressReporter] = None):
+        # Sự kiện tiến trình / lỗi được báo qua reporter, không gọi Streamlit trực tiếp
+        self.progress = progress or default_progress_reporter
         self.jira = JIRA(server=JIRA_SERVER, basic_auth=(JIRA_USER, JIRA_API_TOKEN))
         self.server = JIRA_SERVER
         self.user = JIRA_USER
@@ -18,6 +23,10 @@ class JiraBase:
             )
         ).upper()
 
+    def set_progress_reporter(self, progress: ProgressReporter):
+        """Thiết lập reporter nhận sự kiện tiến trình của service"""
+        self.progress = progress
+
     def get_project(self, project_key):
         """Lấy thông tin project theo key"""
         return self.jira.project(project_key)
@@ -0,0 +1,76 @@
+"""
+Progress Reporter - Interface báo tiến trình / sự kiện từ service layer
+
+Service (SprintService, WorklogService, ...) không gọi trực tiếp Streamlit mà
+báo sự kiện qua một ``ProgressReporter``. Mặc định sự kiện được ghi ra logging
+nên service chạy được trong worker thread, subprocess hoặc cron job; trang
+Streamlit truyền vào adapter ``component.progress_reporter.StreamlitProgressReporter``
+để hiển thị toast / spinner / thông báo lỗi như trước.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+logger = logging.getLogger("jira_dashboard.service")
+
+
+class ProgressReporter:
+    """Interface nhận sự kiện từ service layer (mặc định: bỏ qua mọi sự kiện)"""
+
+    def info(self, message: str):
+        """Thông báo ngắn (ví dụ: đã load từ cache)"""
+
+    def success(self, message: str):
+        """Một thao tác đã hoàn tất"""
+
+    def warning(self, message: str):
+        """Cảnh báo, service vẫn tiếp tục chạy"""
+
+    def error(self, message: str):
+        """Lỗi, service trả về kết quả rỗng / mặc định"""
+
+    def debug(self, label: str, data: Any):
+        """Dữ liệu debug (ví dụ: issue thô của KEY_ISSUE_DEBUG)"""
+
+    def progress(self, done: int, total: int, message: str = ""):
+        """Tiến độ của một tác vụ dài (done / total)"""
+
+    @contextmanager
+    def task(self, message: str) -> Iterator[None]:
+        """Bao một tác vụ dài (load API, xử lý dữ liệu, ...)"""
+        yield
+
+
+class LoggingProgressReporter(ProgressReporter):
+    """Ghi sự kiện ra logging - dùng cho batch job, thread và process con"""
+
+    def __init__(self, log: logging.Logger = logger):
+        self.log = log
+
+    def info(self, message: str):
+        self.log.info(message)
+
+    def success(self, message: str):
+        self.log.info(message)
+
+    def warning(self, message: str):
+        self.log.warning(message)
+
+    def error(self, message: str):
+        self.log.error(message)
+
+    def debug(self, label: str, data: Any):
+        self.log.debug("%s: %s", label, data)
+
+    def progress(self, done: int, total: int, message: str = ""):
+        self.log.debug("%s %s/%s", message, done, total)
+
+    @contextmanager
+    def task(self, message: str) -> Iterator[None]:
+        self.log.info(message)
+        yield
+
+
+# Reporter mặc định của service khi không được truyền vào
+default_progress_reporter = LoggingProgressReporter()
@@ -0,0 +1,192 @@
+"""
+Capacity Service - Giờ kỳ vọng, giờ đã log và mức sử dụng của team
+
+Ghép worklog (tổng giờ theo user / ngày) với ngày nghỉ trong Supabase
+``time_off`` (cả ngày = 1, buổi sáng / buổi chiều = 0.5; user "TEAM" = cả team
+nghỉ) và ngày làm việc (thứ 2 - thứ 6, theo ``CalendarUtils.is_weekend``).
+Mọi phép tính chạy trên ma trận user × ngày:
+
+    expected = WORKDAY_HOURS × ngày làm việc × (1 - phần ngày nghỉ)
+
+rồi tổng hợp theo user / team cho cả khoảng ngày. Kết quả được memo theo hash
+worklog, ngày nghỉ và khoảng ngày (``cached_capacity``).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from conf import WORKDAY_HOURS
+from service.models.time_off_model import TimeOffType
+from service.utils.calendar_utils import CalendarUtils
+
+TEAM_USER = "TEAM"  # user_name của ngày nghỉ áp dụng cho cả team
+
+
+def calendar_days(start_date: date, end_date: date) -> pd.DatetimeIndex:
+    """Tất cả các ngày trong khoảng (tính cả hai đầu)"""
+    return pd.date_range(
+        pd.Timestamp(start_date).normalize(), pd.Timestamp(end_date).normalize(), freq="D"
+    )
+
+
+def business_day_mask(days: pd.DatetimeIndex) -> np.ndarray:
+    """Mask ngày làm việc (không phải cuối tuần theo CalendarUtils.is_weekend)"""
+    return np.array([not CalendarUtils.is_weekend(day.date()) for day in days], dtype=bool)
+
+
+def logged_hours_matrix(
+    df_worklog: pd.DataFrame, users: List[str], days: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """Ma trận giờ đã log (user × ngày) từ bảng worklog (cột User, Date, Time (Hours))"""
+    if df_worklog.empty:
+        return pd.DataFrame(0.0, index=users, columns=days)
+    logged = (
+        df_worklog.groupby(["User", "Date"], observed=True)["Time (Hours)"]
+        .sum()
+        .unstack(fill_value=0.0)
+    )
+    logged.columns = pd.DatetimeIndex(logged.columns).normalize()
+    return logged.reindex(index=users, columns=days, fill_value=0.0).astype(float)
+
+
+def leave_matrix(
+    time_off_data: List[Dict], users: List[str], days: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """
+    Ma trận phần ngày nghỉ (user × ngày): 0, 0.5 hoặc 1
+
+    Nghỉ buổi sáng + buổi chiều cùng ngày tính là nghỉ cả ngày; ngày nghỉ của
+    TEAM áp dụng cho mọi user.
+    """
+    leave = pd.DataFrame(0.0, index=users, columns=days)
+    if not time_off_data:
+        return leave
+    frame = pd.DataFrame(time_off_data, columns=["date", "user_name", "time_off"])
+    frame["date"] = pd.to_datetime(frame["date"]).dt.normalize()
+    # Cùng quy ước với TimeOffService.get_user_stats
+    frame["fraction"] = np.where(
+        frame["time_off"] == TimeOffType.FULL_DAY.value, 1.0, 0.5
+    )
+    per_user = (
+        frame.groupby(["user_name", "date"])["fraction"]
+        .sum()
+        .clip(upper=1.0)
+        .unstack(fill_value=0.0)
+    )
+    leave = per_user.reindex(index=users, columns=days, fill_value=0.0)
+    if TEAM_USER in per_user.index:
+        team = per_user.loc[TEAM_USER].reindex(days, fill_value=0.0).to_numpy()
+        leave = pd.DataFrame(
+            np.maximum(leave.to_numpy(), team), index=leave.index, columns=days
+        )
+    return leave.astype(float)
+
+
+@dataclass
+class CapacityReport:
+    """Các ma trận user × ngày của một khoảng ngày"""
+
+    logged: pd.DataFrame
+    expected: pd.DataFrame
+    leave: pd.DataFrame
+    working: np.ndarray  # Mask ngày làm việc theo cột
+
+    @property
+    def users(self) -> List[str]:
+        return list(self.logged.index)
+
+    @property
+    def days(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.logged.columns)
+
+    @property
+    def diff(self) -> pd.DataFrame:
+        """Giờ log thừa (+) / thiếu (-) so với kỳ vọng, theo user × ngày"""
+        return self.logged - self.expected
+
+    def by_user(self) -> pd.DataFrame:
+        """
+        Tổng hợp theo user
+
+        Returns:
+            pd.DataFrame: Index User; cột working_days, leave_days, expected,
+            logged, diff, utilization (logged / expected, NaN nếu expected = 0)
+        """
+        leave_days = (self.leave.to_numpy() * self.working).sum(axis=1)
+        expected = self.expected.sum(axis=1)
+        logged = self.logged.sum(axis=1)
+        summary = pd.DataFrame(
+            {
+                "working_days": int(self.working.sum()) - leave_days,
+                "leave_days": leave_days,
+                "expected": expected,
+                "logged": logged,
+                "diff": logged - expected,
+                "utilization": logged / expected.where(expected > 0),
+            },
+            index=self.logged.index,
+        )
+        summary.index.name = "User"
+        return summary
+
+    def team_summary(self) -> Dict:
+        """Tổng hợp cả team trong khoảng ngày"""
+        expected = float(self.expected.to_numpy().sum())
+        logged = float(self.logged.to_numpy().sum())
+        return {
+            "users": len(self.users),
+            "working_days": int(self.working.sum()),
+            "expected": expected,
+            "logged": logged,
+            "diff": logged - expected,
+            "utilization": logged / expected if expected > 0 else None,
+        }
+
+
+def build_capacity(
+    df_worklog: pd.DataFrame,
+    time_off_data: List[Dict],
+    start_date: date,
+    end_date: date,
+    users: Optional[List[str]] = None,
+    hours_per_day: float = WORKDAY_HOURS,
+) -> CapacityReport:
+    """
+    Tính năng lực và giờ đã log của team trong khoảng ngày
+
+    Args:
+        df_worklog: Bảng worklog (``_prepare_worklog_data``)
+        time_off_data: Ngày nghỉ trong khoảng (record của bảng time_off)
+        start_date, end_date: Khoảng ngày (tính cả hai đầu)
+        users: Danh sách user (mặc định: các user có worklog)
+        hours_per_day: Số giờ chuẩn của một ngày làm việc
+    """
+    if users is None:
+        users = sorted(df_worklog["User"].astype(str).unique()) if len(df_worklog) else []
+    days = calendar_days(start_date, end_date)
+    working = business_day_mask(days)
+    leave = leave_matrix(time_off_data, users, days)
+    expected = hours_per_day * working * (1.0 - leave)
+    return CapacityReport(
+        logged=logged_hours_matrix(df_worklog, users, days),
+        expected=expected,
+        leave=leave,
+        working=working,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_capacity(
+    data_hash: str,
+    _df_worklog: pd.DataFrame,
+    time_off_data: List[Dict],
+    start_date: date,
+    end_date: date,
+) -> CapacityReport:
+    """``build_capacity`` memo theo hash worklog, ngày nghỉ và khoảng ngày"""
+    return build_capacity(_df_worklog, time_off_data, start_date, end_date)
@@ -0,0 +1,102 @@
+"""
+Burndown / Burnup - Chuỗi số liệu theo ngày của sprint từ bảng sự kiện changelog
+
+Thay vì replay changelog của từng issue cho từng ngày (O(issues × days)), engine
+quét bảng sự kiện đã sắp xếp đúng một lần (sweep line): mỗi sự kiện được quy
+thành một thay đổi "đã xong / chưa xong" có trọng số (points, giờ, số issue),
+gom vào ngày xảy ra rồi cộng dồn theo ngày. Độ phức tạp O(events + days).
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from conf import STATUS_IS_DEV_DONE
+from service.clients.jira.changelog_events import DEFAULT_STATUS
+
+# Các trọng số được burn: cột kết quả -> hàm lấy trọng số từ bảng issue.
+# Points đã là giờ Original Estimate (``process_issue``) nên không có cột giờ riêng
+BURNDOWN_WEIGHTS = {
+    "points": lambda issues: pd.to_numeric(issues["points"], errors="coerce"),
+    "count": lambda issues: pd.Series(1.0, index=issues.index),
+}
+
+
+def build_burndown(
+    events: pd.DataFrame,
+    issues: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    now: Optional[datetime] = None,
+    done_statuses: list = STATUS_IS_DEV_DONE,
+) -> pd.DataFrame:
+    """
+    Tính burndown / burnup theo ngày trong khoảng [start_date, end_date]
+
+    Scope là các issue hiển thị trên dashboard (is_show_dashboard) tại thời điểm
+    load; giá trị của ngày là trạng thái cuối ngày. Cùng quy ước với
+    ``status_in_sprint``: chỉ dùng history có duy nhất một item là status.
+
+    Args:
+        events: Bảng sự kiện từ ``build_status_events``
+        issues: Danh sách issue đã xử lý (cùng thứ tự position)
+        start_date: Ngày bắt đầu sprint (đã adjust)
+        end_date: Ngày kết thúc sprint (đã adjust)
+        now: Các ngày sau now để trống (NaN), mặc định không cắt
+        done_statuses: Các status được tính là đã xong
+
+    Returns:
+        pd.DataFrame: Index là ngày, các cột total_/done_/remaining_/ideal_ cho
+        points, count
+    """
+    start_day = pd.Timestamp(start_date).normalize()
+    days = pd.date_range(start_day, pd.Timestamp(end_date).normalize(), freq="D")
+    day_count = len(days)
+
+    in_scope = issues["is_show_dashboard"].astype(bool).to_numpy()
+    weights = {
+        name: np.where(in_scope, get_weight(issues).fillna(0).to_numpy(float), 0.0)
+        for name, get_weight in BURNDOWN_WEIGHTS.items()
+    }
+
+    # Sự kiện không có thời điểm (created NaT) không gán được vào ngày nào, bỏ qua
+    # như ``status_as_of``
+    events = events[events["status_only"] & events["created"].notna()]
+    positions = events["position"].to_numpy()
+    to_done = events["to_status"].isin(done_statuses).to_numpy(np.int8)
+
+    # Trạng thái trước mỗi sự kiện: to_status của sự kiện trước cùng issue;
+    # trước sự kiện đầu tiên issue ở DEFAULT_STATUS (giống ``status_as_of``)
+    first_of_issue = ~events["position"].duplicated().to_numpy()
+    before = np.roll(to_done, 1)
+    before[first_of_issue] = DEFAULT_STATUS in done_statuses
+    delta = to_done - before
+
+    # Ngày của sự kiện: bin 0 = trước sprint, 1..day_count = các ngày của sprint
+    day_index = (events["created"] - start_day) // pd.Timedelta(days=1)
+    bins = np.clip(day_index.to_numpy(np.int64) + 1, 0, day_count + 1)
+    valid = bins <= day_count  # Bỏ sự kiện sau sprint
+    initial_done = float(DEFAULT_STATUS in done_statuses)
+
+    burndown = pd.DataFrame(index=pd.Index(days.date, name="date"))
+    for name, weight in weights.items():
+        changes = np.bincount(
+            bins[valid],
+            weights=delta[valid] * weight[positions[valid]],
+            minlength=day_count + 1,
+        )
+        total = weight.sum()
+        done = initial_done * total + np.cumsum(changes)[1:]
+        burndown[f"total_{name}"] = total
+        burndown[f"done_{name}"] = done
+        burndown[f"remaining_{name}"] = total - done
+        burndown[f"ideal_{name}"] = np.linspace(total, 0, day_count) if day_count else []
+
+    if now is not None:
+        future = days.date > pd.Timestamp(now).date()
+        actual = [c for c in burndown.columns if c.startswith(("done_", "remaining_"))]
+        burndown.loc[future, actual] = np.nan
+    return burndown.round(2)
+
@@ -0,0 +1,119 @@
+"""
+Changelog Events - Bảng sự kiện chuyển trạng thái (status transition) của cả sprint
+
+Changelog của tất cả issue được chuẩn hóa một lần thành một bảng
+(issue, thời điểm, from, to, author). Bảng được giữ lại để dùng cho
+time-in-status, cycle time, burndown và truy vấn trạng thái tại một thời điểm
+mà không cần parse lại changelog.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from service.utils.time_utils import parse_jira_timestamps
+
+EVENT_COLUMNS = [
+    "position",  # Vị trí issue trong danh sách issue của sprint
+    "key",
+    "created",
+    "from_status",
+    "to_status",
+    "author",
+    "status_only",  # History chỉ có đúng một item là status
+]
+
+DEFAULT_STATUS = "To Do"
+
+
+def build_status_events(raw_issues: List[Dict]) -> pd.DataFrame:
+    """
+    Chuẩn hóa changelog của tất cả issue thành bảng sự kiện chuyển trạng thái
+
+    Args:
+        raw_issues: Danh sách issue thô (expand=changelog)
+
+    Returns:
+        pd.DataFrame: Các cột EVENT_COLUMNS, sắp xếp theo (position, created)
+    """
+    rows = []
+    for position, issue in enumerate(raw_issues):
+        key = issue.get("key", "")
+        histories = (issue.get("changelog") or {}).get("histories", [])
+        for history in histories:
+            items = history.get("items", [])
+            status_only = len(items) == 1
+            for item in items:
+                if item.get("field") != "status":
+                    continue
+                rows.append(
+                    (
+                        position,
+                        key,
+                        history.get("created", ""),
+                        item.get("fromString", ""),
+                        item.get("toString", ""),
+                        (history.get("author") or {}).get("displayName", ""),
+                        status_only,
+                    )
+                )
+
+    events = pd.DataFrame(rows, columns=EVENT_COLUMNS)
+    events["position"] = events["position"].astype(np.int64)
+    events["status_only"] = events["status_only"].astype(bool)
+    events["created"] = parse_jira_timestamps(events["created"]).to_numpy()
+    return events.sort_values(["position", "created"], kind="stable").reset_index(
+        drop=True
+    )
+
+
+def status_as_of(
+    events: pd.DataFrame,
+    as_of: datetime,
+    index: Optional[pd.Index] = None,
+    default: str = DEFAULT_STATUS,
+) -> pd.Series:
+    """
+    Trạng thái của từng issue tại thời điểm as_of (sự kiện cuối cùng trước as_of)
+
+    Args:
+        events: Bảng sự kiện từ ``build_status_events``
+        as_of: Thời điểm cần truy vấn
+        index: Index position của các issue cần trả về (mặc định: issue có sự kiện)
+        default: Trạng thái khi chưa có sự kiện nào trước as_of
+
+    Returns:
+        pd.Series: Index là position, giá trị là status
+    """
+    before = events[events["created"] <= as_of]
+    status = before.groupby("position")["to_status"].last()
+    if index is None:
+        index = pd.Index(events["position"].unique(), name="position")
+    return status.reindex(index, fill_value=default).astype(object)
+
+
+def status_intervals(events: pd.DataFrame, until: datetime) -> pd.DataFrame:
+    """
+    Chuyển bảng sự kiện thành các khoảng thời gian ở mỗi trạng thái
+
+    Mỗi sự kiện mở một khoảng ở ``to_status`` kéo dài tới sự kiện kế tiếp của
+    cùng issue (hoặc tới ``until``). Dùng cho time-in-status và cycle time.
+
+    Returns:
+        pd.DataFrame: Các cột position, key, status, start, end, hours
+    """
+    next_change = events.groupby("position")["created"].shift(-1)
+    intervals = pd.DataFrame(
+        {
+            "position": events["position"],
+            "key": events["key"],
+            "status": events["to_status"],
+            "start": events["created"],
+            "end": next_change.fillna(pd.Timestamp(until)).clip(upper=pd.Timestamp(until)),
+        }
+    )
+    intervals = intervals[intervals["start"] < intervals["end"]]
+    intervals["hours"] = (intervals["end"] - intervals["start"]).dt.total_seconds() / 3600
+    return intervals.reset_index(drop=True)
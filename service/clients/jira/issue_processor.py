@@ -0,0 +1,415 @@
+"""
+Issue Processor - Xử lý issue thô của sprint thành issue đã xử lý
+
+``process_sprint`` tổng hợp worklog và bảng sự kiện changelog của cả sprint
+một lần (dùng cho worklog summary, time-in-status, burndown), còn các field
+của issue được tính bằng ``process_issue`` cho từng issue: vòng lặp dict rẻ
+hơn chi phí cố định của pandas ở mọi kích thước sprint thực tế.
+
+Với sprint rất lớn, ``process_sprint_parallel`` chia danh sách issue thành các
+chunk và xử lý trên process pool (start method "spawn"); hàm xử lý chunk không
+phụ thuộc Streamlit nên pickle được sang process con.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import repeat
+from typing import Dict, List, NamedTuple, Optional
+
+import pandas as pd
+import pytz
+
+from service.clients.jira.changelog_events import build_status_events
+from service.clients.jira.worklog_service import WorklogService
+from service.utils.time_utils import (
+    JIRA_TIMEZONE,
+    convert_seconds_to_jira_time,
+    convert_time_str_to_datetime,
+    parse_jira_timestamp,
+)
+
+# Thứ tự key của issue sau khi xử lý (``process_issue``)
+ISSUE_COLUMNS = [
+    "key",
+    "summary",
+    "status",
+    "status_in_sprint",
+    "issuetype",
+    "assignee",
+    "reporter",
+    "tester",
+    "priority",
+    "points",
+    "steve_estimate",
+    "tech",
+    "env",
+    "customer",
+    "is_development",
+    "is_show_dashboard",
+    "is_popup",
+    "feature",
+    "has_subtasks",
+    "active_in_sprint",
+    "originalEstimate",
+    "timeSpent",
+    "remaining",
+    "remainingEstimate",
+    "originalEstimateSeconds",
+    "timeSpentSeconds",
+    "remainingEstimateSeconds",
+    "remainingSeconds",
+    "count_spinrt_closed",
+    "created_at",
+    "updated_at",
+    "hours_elapsed",
+    "hours_elapsed_str",
+    "date_elapsed",
+    "count_worklog",
+    "time_spent_in_sprint_hours",
+    "time_spent_in_sprint_seconds",
+    "unique_loggers_count",
+    "first_time_in_progress",
+    "count_reopen",
+    "has_reopen",
+    "reopen_in_sprint",
+    "is_done_in_sprint",
+    "time_done_in_sprint",
+    "duration_hours_to_done",
+    "duration_date_to_done",
+    "duedate",
+]
+
+
+def process_issue(
+    raw_issue: Dict,
+    start_date: datetime,
+    end_date: datetime,
+    now: Optional[datetime] = None,
+) -> Dict:
+    """
+    Xử lý một issue thô (đã đủ worklog, expand=changelog)
+
+    Args:
+        raw_issue: Issue thô từ Jira
+        start_date: Ngày bắt đầu sprint (đã adjust)
+        end_date: Ngày kết thúc sprint (đã adjust)
+        now: Thời điểm tính hours_elapsed, mặc định là hiện tại
+
+    Returns:
+        Dict: Issue đã xử lý, key theo ISSUE_COLUMNS
+    """
+    key = raw_issue.get("key", "")
+    fields = raw_issue.get("fields") or {}
+    status = (fields.get("status") or {}).get("name", "")
+    issuetype = (fields.get("issuetype") or {}).get("name", "")
+    assignee = _get_field(fields, "assignee", "displayName")
+    is_development = _get_field(fields, "customfield_10160", is_bool=True)
+    has_subtasks = len(fields.get("subtasks") or []) > 0
+
+    time_in_seconds = fields.get("timeoriginalestimate")
+    points = round(time_in_seconds / 3600, 2) if time_in_seconds else 0.0
+    timetracking = fields.get("timetracking") or {}
+    remaining_seconds = timetracking.get(
+        "originalEstimateSeconds", 0
+    ) - timetracking.get("timeSpentSeconds", 0)
+    updated_at = fields.get("updated") or ""
+    hours_elapsed = _hours_elapsed(updated_at, _local_now(now))
+
+    data_worklog = WorklogService.calculate_worklog_data(
+        (fields.get("worklog") or {}).get("worklogs", []),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    changelog = process_changelog(
+        (raw_issue.get("changelog") or {}).get("histories", []), start_date, end_date
+    )
+
+    is_show_dashboard = bool(
+        issuetype != "Epic" and is_development and assignee and not has_subtasks
+    )
+    is_to_do = status == "To Do" and is_show_dashboard
+    active_in_sprint = bool(
+        (
+            data_worklog["time_spent_in_sprint_seconds"]
+            and status != "Close"
+            and is_show_dashboard
+        )
+        or is_to_do
+    )
+
+    return {
+        "key": key,
+        "summary": fields.get("summary") or "",
+        "status": status,
+        "status_in_sprint": changelog["status_in_sprint"],
+        "issuetype": issuetype,
+        "assignee": assignee,
+        "reporter": _get_field(fields, "reporter", "displayName"),
+        "tester": _get_field(fields, "customfield_10031", "displayName"),
+        "priority": (fields.get("priority") or {}).get("name", ""),
+        "points": points,
+        "steve_estimate": _get_field(fields, "customfield_10159"),
+        "tech": _get_field(fields, "customfield_10192"),
+        "env": _get_field(fields, "customfield_10191"),
+        "customer": _get_field(fields, "customfield_10092"),
+        "is_development": is_development,
+        "is_show_dashboard": is_show_dashboard,
+        "is_popup": _get_field(fields, "customfield_10130", is_bool=True),
+        "feature": _get_field(fields, "customfield_10132"),
+        "has_subtasks": has_subtasks,
+        "active_in_sprint": active_in_sprint,
+        "originalEstimate": timetracking.get("originalEstimate", "0h"),
+        "timeSpent": timetracking.get("timeSpent", "0h"),
+        "remaining": convert_seconds_to_jira_time(remaining_seconds),
+        "remainingEstimate": timetracking.get("remainingEstimate", "0h"),
+        "originalEstimateSeconds": timetracking.get("originalEstimateSeconds", 0),
+        "timeSpentSeconds": timetracking.get("timeSpentSeconds", 0),
+        "remainingEstimateSeconds": timetracking.get("remainingEstimateSeconds", 0),
+        "remainingSeconds": remaining_seconds,
+        "count_spinrt_closed": len(fields.get("closedSprints") or []),
+        "created_at": fields.get("created") or "",
+        "updated_at": updated_at,
+        "hours_elapsed": hours_elapsed,
+        "hours_elapsed_str": f"{hours_elapsed}h",
+        "date_elapsed": f"{hours_elapsed // 24}d {hours_elapsed % 24}h",
+        "count_worklog": data_worklog["count_worklog"],
+        "time_spent_in_sprint_hours": data_worklog["time_spent_in_sprint_hours"],
+        "time_spent_in_sprint_seconds": data_worklog["time_spent_in_sprint_seconds"],
+        "unique_loggers_count": data_worklog["unique_loggers_count"],
+        "first_time_in_progress": changelog["first_time_in_progress"],
+        "count_reopen": changelog["count_reopen"],
+        "has_reopen": changelog["has_reopen"],
+        "reopen_in_sprint": changelog["reopen_in_sprint"],
+        "is_done_in_sprint": changelog["is_done_in_sprint"],
+        "time_done_in_sprint": changelog["time_done_in_sprint"],
+        "duration_hours_to_done": changelog["duration_hours_to_done"],
+        "duration_date_to_done": changelog["duration_date_to_done"],
+        "duedate": convert_time_str_to_datetime(fields.get("duedate") or ""),
+    }
+
+
+class ProcessedSprint(NamedTuple):
+    """Kết quả xử lý issue của một sprint (hoặc một chunk issue)"""
+
+    issues: List[Dict]
+    worklog_summary: Dict
+    status_events: pd.DataFrame
+
+
+def process_sprint(
+    raw_issues: List[Dict],
+    start_date: datetime,
+    end_date: datetime,
+    now: Optional[datetime] = None,
+) -> ProcessedSprint:
+    """
+    Xử lý danh sách issue thô: tổng hợp worklog, bảng sự kiện changelog và
+    danh sách issue đã xử lý (``process_issue`` cho từng issue). Không dùng
+    Streamlit, chạy được trong process con.
+
+    Args:
+        raw_issues: Danh sách issue thô (đã đủ worklog, expand=changelog)
+        start_date: Ngày bắt đầu sprint (đã adjust)
+        end_date: Ngày kết thúc sprint (đã adjust)
+        now: Thời điểm tính hours_elapsed, mặc định là hiện tại
+
+    Returns:
+        ProcessedSprint
+    """
+    worklog_summary = WorklogService.aggregate_sprint_worklogs(
+        raw_issues, start_date, end_date
+    )
+    status_events = build_status_events(raw_issues)
+    # Cố định thời điểm hiện tại cho cả sprint
+    now = _local_now(now)
+    issues = [
+        process_issue(issue, start_date, end_date, now=now) for issue in raw_issues
+    ]
+    return ProcessedSprint(issues, worklog_summary, status_events)
+
+
+def process_sprint_parallel(
+    raw_issues: List[Dict],
+    start_date: datetime,
+    end_date: datetime,
+    now: Optional[datetime] = None,
+    chunk_size: int = 1000,
+    max_workers: Optional[int] = None,
+) -> ProcessedSprint:
+    """
+    Xử lý sprint lớn trên process pool: mỗi chunk issue được ``process_sprint``
+    trong một process, kết quả được ghép lại theo đúng thứ tự issue ban đầu.
+
+    Args:
+        raw_issues: Danh sách issue thô (đã đủ worklog, expand=changelog)
+        start_date: Ngày bắt đầu sprint (đã adjust)
+        end_date: Ngày kết thúc sprint (đã adjust)
+        now: Thời điểm tính hours_elapsed, mặc định là hiện tại
+        chunk_size: Số issue mỗi chunk
+        max_workers: Số process tối đa (None = theo số CPU)
+
+    Returns:
+        ProcessedSprint: Giống hệt kết quả ``process_sprint`` trên cả danh sách
+    """
+    chunk_size = max(1, chunk_size)
+    chunks = [
+        raw_issues[idx : idx + chunk_size]
+        for idx in range(0, len(raw_issues), chunk_size)
+    ]
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        return process_sprint(raw_issues, start_date, end_date, now=now)
+
+    # Cố định thời điểm hiện tại để mọi chunk tính hours_elapsed giống nhau
+    if now is None:
+        now = datetime.now(pytz.timezone(JIRA_TIMEZONE))
+
+    # Luôn dùng "spawn": fork trong server Streamlit (nhiều thread) có thể sao
+    # chép lock đang bị giữ sang process con và làm treo worker
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        parts = list(
+            pool.map(
+                process_sprint,
+                chunks,
+                repeat(start_date),
+                repeat(end_date),
+                repeat(now),
+            )
+        )
+    return _merge_processed(parts, chunk_size)
+
+
+def _merge_processed(parts: List[ProcessedSprint], chunk_size: int) -> ProcessedSprint:
+    """Ghép kết quả các chunk liên tiếp, dời position của bảng sự kiện"""
+    issues = [issue for part in parts for issue in part.issues]
+    events = []
+    for idx, part in enumerate(parts):
+        part_events = part.status_events.copy()
+        part_events["position"] += idx * chunk_size
+        events.append(part_events)
+    # Các chunk đã sắp xếp theo (position, created) nên ghép lại vẫn giữ thứ tự
+    status_events = pd.concat(events, ignore_index=True)
+    worklog_summary = WorklogService.merge_sprint_worklog_summaries(
+        [part.worklog_summary for part in parts]
+    )
+    return ProcessedSprint(issues, worklog_summary, status_events)
+
+
+def process_changelog(histories: list, start_date: datetime, end_date: datetime):
+    """Tính các chỉ số trạng thái trong sprint từ changelog của một issue"""
+    status_changes = []
+    count_reopen = 0
+
+    is_done_in_sprint = False
+    first_time_in_progress = None
+    time_done_in_sprint = None
+    reopen_in_sprint = False
+
+    status_in_sprint = "To Do"
+
+    # Sắp xếp lịch sử để đảm bảo xử lý đúng thứ tự thời gian
+    histories.sort(key=lambda x: x.get("created", "s"))
+
+    for history in histories:
+        items = history.get("items", [])
+        if len(items) == 1 and items[0].get("field") == "status":
+            status_to = items[0].get("toString", "")
+            status_from = items[0].get("fromString", "")
+            time_change = convert_time_str_to_datetime(
+                history.get("created", "")
+            )  # type: ignore
+            author = history.get("author", {}).get("displayName", "")
+
+            is_in_sprint = (
+                time_change is not None
+                and start_date is not None
+                and end_date is not None
+                and time_change >= start_date
+                and time_change <= end_date
+            )
+
+            if time_change is not None and end_date is not None and time_change <= end_date:
+                status_in_sprint = status_to
+
+            if status_from == "Reopen":
+                count_reopen += 1
+                reopen_in_sprint = True if is_in_sprint else False
+
+            if status_to == "Done" and is_in_sprint:
+                is_done_in_sprint = True
+                time_done_in_sprint = time_change
+
+            status_changes.append(
+                {
+                    "created": time_change,
+                    "author": author,
+                    "fromString": status_from,
+                    "toString": status_to,
+                }
+            )
+    first_time_in_progress = (
+        convert_time_str_to_datetime(status_changes[0]["created"])
+        if status_changes
+        else None
+    )
+    duration_hours_to_done = (
+        (time_done_in_sprint - first_time_in_progress)
+        if time_done_in_sprint and first_time_in_progress
+        else None
+    )
+    duration_date_to_done = (
+        round(duration_hours_to_done.total_seconds() / 3600 / 24, 2)
+        if duration_hours_to_done
+        else 0.0
+    )
+
+    return {
+        "status_in_sprint": status_in_sprint,
+        "first_time_in_progress": first_time_in_progress,
+        "count_reopen": count_reopen,
+        "has_reopen": count_reopen > 0,
+        "histories": status_changes,
+        "is_done_in_sprint": is_done_in_sprint,
+        "time_done_in_sprint": time_done_in_sprint,
+        "duration_hours_to_done": duration_hours_to_done,
+        "duration_date_to_done": duration_date_to_done,
+        "reopen_in_sprint": reopen_in_sprint,
+    }
+
+
+def _get_field(data: dict, field_name: str, key: str = "value", is_bool: bool = False):
+    data_field = data.get(field_name, {})
+    if data_field:
+
+        vaule_field = (
+            data_field[0].get(key, "")
+            if isinstance(data_field, list)
+            else data_field.get(key, "")
+        )
+    else:
+        vaule_field = ""
+    if is_bool:
+        return True if (vaule_field and vaule_field == "YES") else False
+    return vaule_field
+
+
+def _local_now(now: Optional[datetime] = None) -> datetime:
+    """Thời điểm hiện tại (hoặc now) theo giờ JIRA_TIMEZONE, bỏ tzinfo"""
+    if now is None:
+        now = datetime.now(pytz.timezone(JIRA_TIMEZONE))
+    if now.tzinfo is not None:
+        now = now.astimezone(pytz.timezone(JIRA_TIMEZONE)).replace(tzinfo=None)
+    return now
+
+
+def _hours_elapsed(updated_at: str, now: datetime) -> int:
+    """Số giờ (nguyên) từ ``updated`` tới now, cùng quy ước với ``cal_hours_since_update``"""
+    if not updated_at:
+        return 0
+    elapsed = now - parse_jira_timestamp(updated_at)
+    return int(round(elapsed.total_seconds() / 3600, 2))
+
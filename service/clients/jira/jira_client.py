@@ -63,8 +63,8 @@ class JiraHybridClient(HybridSingletonBase):
         return self.project_service.get_project_info()
 
     # ===== USER METHODS =====
-    def get_list_users(self, limit=200):
-        """Lấy danh sách user từ Jira Cloud"""
+    def get_list_users(self, limit=None):
+        """Lấy danh sách user từ Jira Cloud (tất cả các page nếu không có limit)"""
         return self.user_service.get_list_users(limit)
 
     def search_users(self):
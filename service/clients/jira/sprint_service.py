@@ -3,45 +3,92 @@ from pandas.tseries.frequencies import key
 from service.base.jira_base import JiraBase
 import streamlit as st
 import pandas as pd
+import pytz
 from conf import (
     DEFAULT_FIELDS_ISSUE,
     KEY_ISSUE_DEBUG,
     DEFAULT_MAX_ISSUE_PER_PAGE,
+    DEFAULT_MAX_SPRINT_PER_PAGE,
+    SPRINT_LIST_TTL_SECONDS,
+    SPRINT_PROCESS_POOL_MIN_ISSUES,
+    SPRINT_PROCESS_CHUNK_SIZE,
+    SPRINT_PROCESS_MAX_WORKERS,
     STATUS_ORDER,
 )
-from service.utils.time_utils import (
-    cal_hours_since_update,
-    convert_time_str_to_datetime,
-    convert_seconds_to_jira_time,
-)
+from service.utils.time_utils import JIRA_TIMEZONE
 from service.clients.jira.worklog_service import WorklogService
+from service.clients.jira.issue_processor import (
+    process_sprint,
+    process_sprint_parallel,
+)
+from service.clients.jira.status_analytics import (
+    STATUS_ANALYTICS_VERSION,
+    build_status_analytics,
+)
+from service.clients.jira.burndown import build_burndown
 from service.utils.date_utils import parse_jira_datetime
 from service.utils.cache_utils import file_cache
+from service.utils.snapshot_store import snapshot_store
 from typing import Optional
 from datetime import datetime
 from service.utils.date_utils import adjust_sprint_dates
+from service.models.sprint_model import SprintRecord
+from service.models.issue_model import (
+    ISSUE_SCHEMA_VERSION,
+    build_issue_frame,
+    to_issue_records,
+)
+
+# Các loại dữ liệu được cache theo sprint (issues + các bảng tổng hợp đi kèm,
+# trend_row là dòng metric của sprint trong báo cáo trend - service/sprint_trend.py)
+SPRINT_CACHE_NAMES = [
+    "issues",
+    "worklog_summary",
+    "status_events",
+    "status_analytics",
+    "trend_row",
+]
+
+# Các chiều của metric cube: tên cột -> key trong kết quả get_metric_sprint
+METRIC_DIMENSIONS = {
+    "status_in_sprint": "metric_by_status",
+    "issuetype": "metric_by_type",
+    "priority": "metric_by_priority",
+    "feature": "metric_by_feature",
+    "assignee": "metric_by_assignee",
+    "tech": "metric_by_tech",
+    "customer": "metric_by_customer",
+    "env": "metric_by_env",
+}
+METRIC_ORDERS = {"status_in_sprint": list(STATUS_ORDER.keys())}
+# Các cache lưu IssueRecord (pickle): key gắn với version schema của record
+RECORD_CACHE_NAMES = {"issues"}
 
 
 class SprintService(JiraBase):
     start_date = None
     end_date = None
     board_id = 0
+    worklog_summary = None
+    status_events = None
+    status_analytics = None
+    data_version = None
 
     """Service quản lý sprint trong Jira"""
 
-    def __init__(self, board_id=None, data_sprint: dict = {}):
-        super().__init__()
+    def __init__(self, board_id=None, data_sprint: dict = {}, progress=None):
+        super().__init__(progress)
         if board_id:
             self.board_id = board_id
 
-    def set_data_sprint(self, data_sprint: dict):
-        self.board_id = data_sprint.get("originBoardId", None)
-        self.start_date = data_sprint.get("startDate", None)
-        self.end_date = data_sprint.get("endDate", None)
+    def set_data_sprint(self, data_sprint: SprintRecord):
+        if isinstance(data_sprint, dict):
+            data_sprint = SprintRecord.from_dict(data_sprint)
+        self.board_id = data_sprint.origin_board_id
         self.start_date, self.end_date = adjust_sprint_dates(
-            self.start_date, self.end_date
+            data_sprint.start_date, data_sprint.end_date
         )
-        self.goal = data_sprint.get("goal", "")
+        self.goal = data_sprint.goal
 
     def set_board_id(self, board_id):
         """Thiết lập board_id cho service"""
@@ -53,44 +100,31 @@ class SprintService(JiraBase):
 
     def get_list_sprints(self, state: str = "", sort_by_state: bool = True):
         """
-        Lấy danh sách sprint của 1 board.
+        Lấy danh sách sprint của 1 board (tất cả các trang, cache theo board với TTL).
         state: 'active', 'future', 'closed' hoặc None
+
+        Returns:
+            List[SprintRecord]: Sprint mới nhất trước, tên hiển thị dùng
+            ``SprintRecord.display_name``
         """
         if not self.board_id:
             raise ValueError("Board ID chưa được thiết lập")
 
-        params = {}
-        if state:
-            params["state"] = state
-        list_sprint = self.jira._get_json(
-            f"board/{self.board_id}/sprint",
-            params,
-            base=self.jira.AGILE_BASE_URL,
-        ).get("values", [])
-
-        filtered_sprints = [
-            sprint
-            for sprint in list_sprint
-            if sprint.get("originBoardId") == self.board_id
-        ][::-1]
-
-        for idx, sprint in enumerate(filtered_sprints):
-            filtered_sprints[idx][
-                "name"
-            ] = f"{sprint['name']} - {sprint['state'].upper()}"
+        sprints = list(_fetch_board_sprints(self.board_id, state, self.jira))
 
         # Sắp xếp theo thứ tự state: active, future, closed
         state_order = {"active": 0, "future": 1, "closed": 2}
 
-        def sort_key(sprint):
-            sprint_state = sprint.get("state", "").lower()
-            return state_order.get(sprint_state, 3)  # Các state khác sẽ được đặt cuối
+        def sort_key(sprint: SprintRecord):
+            # Các state khác sẽ được đặt cuối
+            return state_order.get(sprint.state.lower(), 3)
 
-        return (
-            sorted(filtered_sprints, key=sort_key)
-            if sort_by_state
-            else filtered_sprints
-        )
+        return sorted(sprints, key=sort_key) if sort_by_state else sprints
+
+    @staticmethod
+    def clear_sprint_list_cache():
+        """Xóa cache danh sách sprint của tất cả board"""
+        _fetch_board_sprints.clear()
 
     def get_issues_for_sprint(
         self,
@@ -111,13 +145,17 @@ class SprintService(JiraBase):
             return_cache_info: Có trả về thông tin cache không
 
         Returns:
-            issues list hoặc tuple (issues, cache_info) nếu return_cache_info=True
+            List[IssueRecord] hoặc tuple (issues, cache_info) nếu
+            return_cache_info=True. Trước đây là list dict: dùng
+            ``IssueRecord.to_dict()`` nếu cần dict. Bảng issue (DataFrame gọn)
+            nằm ở ``self.list_issues``; caller chỉ cần bảng thì không nên giữ
+            lại list record để sprint không bị giữ hai lần trong bộ nhớ.
         """
         if not sprint_id:
             raise ValueError("Sprint ID is required")
 
         # Tạo cache key theo yêu cầu: cache_issues_sprint + board_id
-        cache_key = f"cache_issues_sprint_{self.board_id}_{sprint_id}"
+        cache_key = self._sprint_cache_key(sprint_id)
         cache_info = {"from_cache": False, "timestamp": None}
 
         # Kiểm tra cache trước nếu use_cache = True
@@ -126,21 +164,52 @@ class SprintService(JiraBase):
                 cache_key
             )
             if cached_issues is not None:
-                st.toast("⚡ Sprint issues loaded từ file cache")
-                self.list_issues = pd.DataFrame(cached_issues)
+                self.progress.info("⚡ Sprint issues loaded từ file cache")
+                self.list_issues = build_issue_frame(cached_issues)
+                self.worklog_summary = file_cache.load_cache(
+                    self._sprint_cache_key(sprint_id, "worklog_summary")
+                )
+                self.status_events = file_cache.load_cache(
+                    self._sprint_cache_key(sprint_id, "status_events")
+                )
+                self.status_analytics = file_cache.load_cache(
+                    self._sprint_cache_key(sprint_id, "status_analytics")
+                )
+                # Cache cũ chưa có status_analytics (hoặc tính theo quy ước cũ):
+                # tính lại từ bảng sự kiện và lưu lại
+                if self.status_events is not None and (
+                    self.status_analytics or {}
+                ).get("version") != STATUS_ANALYTICS_VERSION:
+                    self.status_analytics = self._build_status_analytics()
+                    file_cache.save_cache(
+                        self._sprint_cache_key(sprint_id, "status_analytics"),
+                        self.status_analytics,
+                    )
                 cache_info = {
                     "from_cache": True,
                     "timestamp": (
                         cache_metadata.get("timestamp") if cache_metadata else None
                     ),
                 }
+                self.data_version = (
+                    f"{self._sprint_cache_key(sprint_id)}_{cache_info['timestamp']}"
+                )
+                # Dữ liệu từ cache là trạng thái tại lúc lưu cache: ghi snapshot
+                # với ngày của cache, chỉ khi store chưa có ngày đó hoặc mới hơn
+                # (tránh ghi đè lịch sử bằng trạng thái cũ hơn)
+                cached_at = cache_info["timestamp"]
+                if cached_issues and isinstance(cached_at, datetime):
+                    self._record_snapshot(
+                        sprint_id,
+                        cached_at.astimezone(pytz.timezone(JIRA_TIMEZONE)).date(),
+                    )
 
                 if return_cache_info:
                     return cached_issues, cache_info
                 return cached_issues
 
         # Nếu không có cache hoặc user chọn không dùng cache, call API
-        with st.spinner(f"🔄 Đang load issues cho sprint {sprint_id}..."):
+        with self.progress.task(f"🔄 Đang load issues cho sprint {sprint_id}..."):
             all_issues = []
             start_at = 0
             while True:
@@ -164,6 +233,9 @@ class SprintService(JiraBase):
                 all_issues.extend(issues_on_page)
 
                 total = response.get("total", 0)
+                self.progress.progress(
+                    len(all_issues), total, f"Đã tải issue của sprint {sprint_id}"
+                )
                 # break  # Only get one page
                 if len(all_issues) >= total:
                     break
@@ -171,14 +243,34 @@ class SprintService(JiraBase):
                 start_at += len(issues_on_page)
 
             # Xử lý và thêm "points" vào mỗi issue
-            all_issues = [self._process_issue(issue) for issue in all_issues]
+            all_issues = to_issue_records(self._process_issues(all_issues))
+            self.list_issues = build_issue_frame(all_issues)
+            self.status_analytics = self._build_status_analytics()
+            if all_issues:
+                self._record_snapshot(sprint_id)
 
             # Cache kết quả nếu use_cache = True
             if use_cache and all_issues:
                 file_cache.save_cache(cache_key, all_issues)
-                st.toast(f"💾 Sprint issues đã được cache ({len(all_issues)} issues)")
+                file_cache.save_cache(
+                    self._sprint_cache_key(sprint_id, "worklog_summary"),
+                    self.worklog_summary,
+                )
+                file_cache.save_cache(
+                    self._sprint_cache_key(sprint_id, "status_events"),
+                    self.status_events,
+                )
+                file_cache.save_cache(
+                    self._sprint_cache_key(sprint_id, "status_analytics"),
+                    self.status_analytics,
+                )
+                # Dữ liệu sprint mới -> dòng trend cũ không còn đúng
+                file_cache.clear_cache(self._sprint_cache_key(sprint_id, "trend_row"))
+                self.progress.info(
+                    f"💾 Sprint issues đã được cache ({len(all_issues)} issues)"
+                )
 
-        self.list_issues = pd.DataFrame(all_issues)
+        self.data_version = f"{cache_key}_{datetime.now().isoformat()}"
 
         if return_cache_info:
             return all_issues, cache_info
@@ -192,15 +284,19 @@ class SprintService(JiraBase):
             sprint_id: ID sprint cần xóa cache, None để xóa tất cả
         """
         if sprint_id:
-            cache_key = f"cache_issues_sprint_{self.board_id}_{sprint_id}"
-            file_cache.clear_cache(cache_key)
-            st.success(f"🗑️ Đã xóa cache cho sprint {sprint_id}")
+            for name in SPRINT_CACHE_NAMES:
+                file_cache.clear_cache(self._sprint_cache_key(sprint_id, name))
+            self.progress.success(f"🗑️ Đã xóa cache cho sprint {sprint_id}")
         else:
             # Xóa tất cả cache sprint của board này
             # Vì file_cache không support pattern matching,
             # chúng ta sẽ chỉ clear toàn bộ cache
             file_cache.clear_cache()
-            st.success(f"🗑️ Đã xóa tất cả cache")
+            self.progress.success(f"🗑️ Đã xóa tất cả cache")
+
+    def _sprint_cache_key(self, sprint_id: int, name: str = "issues") -> str:
+        """Cache key cho dữ liệu của sprint, ví dụ cache_issues_sprint_{board}_{sprint}"""
+        return sprint_cache_key(self.board_id, sprint_id, name)
 
     def get_cache_info(self):
         """Lấy thông tin cache hiện tại"""
@@ -209,313 +305,254 @@ class SprintService(JiraBase):
     def cal_report_metric(self, issues):
         return issues
 
-    def get_issue_active_in_sprint(self):
-        return self.list_issues[self.list_issues["active_in_sprint"]]
+    def _record_snapshot(self, sprint_id: int, cached_date=None):
+        """
+        Ghi snapshot trạng thái issue (chỉ append phần thay đổi)
 
-    def _process_issue(
-        self,
-        issue,
-    ):
-        """Xử lý dữ liệu cho một issue, ví dụ tính points."""
-        worklog_service = WorklogService()
-        # Đảm bảo issue có key 'fields'
-        key = issue.get("key", "")
-        # if key == "CLD-1060":
-
-        #     st.write(key)
-        #     st.write(issue)
-
-        fields = issue.get("fields", {})
-        summary = fields.get("summary", "")
-        status = fields.get("status", {}).get("name", "")
-        issuetype = fields.get("issuetype", {}).get("name", "")
-        assignee = _get_field(fields, "assignee", "displayName")
-
-        priority = fields.get("priority", {}).get("name", "")
-
-        time_in_seconds = fields.get("timeoriginalestimate")
-        points = round(time_in_seconds / 3600, 2) if time_in_seconds else 0.0
-        tech = _get_field(data=fields, field_name="customfield_10192", key="value")
-        is_development = _get_field(
-            data=fields, field_name="customfield_10160", key="value", is_bool=True
-        )
-        is_popup = _get_field(
-            data=fields, field_name="customfield_10130", key="value", is_bool=True
+        Args:
+            cached_date: Ngày lưu file cache khi dữ liệu lấy từ cache; bỏ qua nếu
+                store đã có snapshot của ngày này hoặc ngày sau. Mặc định (dữ
+                liệu vừa lấy từ API): snapshot của hôm nay
+        """
+        snapshot_date = cached_date or datetime.now(
+            pytz.timezone(JIRA_TIMEZONE)
+        ).date()
+        if cached_date and snapshot_store.is_recorded(
+            self.board_id, sprint_id, cached_date
+        ):
+            return
+        try:
+            changes = snapshot_store.record_snapshot(
+                self.board_id, sprint_id, self.list_issues, snapshot_date
+            )
+            self.progress.info(f"📸 Snapshot sprint {sprint_id}: {changes} thay đổi")
+        except Exception as e:
+            self.progress.warning(f"Không ghi được snapshot sprint {sprint_id}: {e}")
+
+    def has_snapshot(self, sprint_id: int) -> bool:
+        """Sprint đã có snapshot trong snapshot store chưa"""
+        return snapshot_store.has_snapshot(self.board_id, sprint_id)
+
+    def get_snapshot_dates(self, sprint_id: int) -> list:
+        """Các ngày đã có snapshot của sprint"""
+        return snapshot_store.snapshot_dates(self.board_id, sprint_id)
+
+    def get_snapshot_as_of(self, sprint_id: int, as_of_date=None) -> pd.DataFrame:
+        """Trạng thái issue của sprint tại một ngày, đọc từ snapshot store (không gọi API)"""
+        return snapshot_store.as_of(self.board_id, sprint_id, as_of_date)
+
+    def compare_sprint_snapshots(
+        self, sprint_id: int, other_sprint_id: int, as_of_date=None, other_date=None
+    ) -> dict:
+        """So sánh snapshot của hai sprint (hoặc hai ngày của cùng sprint)"""
+        return snapshot_store.compare(
+            self.board_id, sprint_id, other_sprint_id, as_of_date, other_date
         )
 
-        feature = _get_field(data=fields, field_name="customfield_10132", key="value")
-        steve_estimate = _get_field(
-            data=fields, field_name="customfield_10159", key="value"
-        )
-        customer = _get_field(data=fields, field_name="customfield_10092", key="value")
-        has_subtasks = len(fields.get("subtasks", [])) > 0
-        reporter = _get_field(data=fields, field_name="reporter", key="displayName")
-        tester = _get_field(
-            data=fields, field_name="customfield_10031", key="displayName"
+    def get_status_analytics(self):
+        """
+        Time-in-status và percentile cycle/lead time của sprint (đã tính sẵn
+        khi load sprint, xem ``status_analytics.build_status_analytics``)
+        """
+        if self.status_analytics is None:
+            self.status_analytics = self._build_status_analytics()
+        return self.status_analytics
+
+    def _build_status_analytics(self):
+        """Tính status analytics từ bảng sự kiện, tới cuối sprint hoặc hiện tại"""
+        list_issues = getattr(self, "list_issues", None)
+        if self.status_events is None or list_issues is None or list_issues.empty:
+            return None
+        now = datetime.now(pytz.timezone(JIRA_TIMEZONE)).replace(tzinfo=None)
+        until = min(self.end_date, now) if self.end_date else now
+        return build_status_analytics(self.status_events, list_issues, until)
+
+    def get_burndown(self) -> Optional[pd.DataFrame]:
+        """
+        Burndown / burnup theo ngày trong khoảng sprint (đã adjust), memo theo
+        data_version; các ngày sau hôm nay để trống
+        """
+        list_issues = getattr(self, "list_issues", None)
+        if self.status_events is None or list_issues is None or list_issues.empty:
+            return None
+        today = datetime.now(pytz.timezone(JIRA_TIMEZONE)).date()
+        data_version = self.data_version or _hash_issues(list_issues)
+        return _build_burndown(
+            data_version,
+            self.status_events,
+            list_issues,
+            self.start_date,
+            self.end_date,
+            today,
         )
-        env = _get_field(data=fields, field_name="customfield_10191", key="value")
-        timetracking = fields.get("timetracking", {})
-        remainingSeconds = timetracking.get(
-            "originalEstimateSeconds", 0
-        ) - timetracking.get("timeSpentSeconds", 0)
-        remaining = convert_seconds_to_jira_time(remainingSeconds)
-        duedate = convert_time_str_to_datetime(fields.get("duedate", ""))
-        count_spinrt_closed = len(fields.get("closedSprints", []))
-        updated_at = fields.get("updated", "")
-        hours_since_update = cal_hours_since_update(updated_at)
-        created_at = fields.get("created", "")
-        worklogs = fields.get("worklog", {})
-        worklog_list = worklogs.get("worklogs", [])
-        # Lấy toàn bộ worklog cho issue nếu không đầy đủ
-        if worklogs.get("total", 0) > len(worklog_list):
-            st.toast(
-                f"Lấy toàn bộ worklog cho issue {key} vì có {worklogs.get('total',0)} worklogs"
-            )
-            worklog_list = worklog_service.get_worklogs_by_issue_key(issue_key=key)
 
+    def get_issue_active_in_sprint(self):
+        return self.list_issues[self.list_issues["active_in_sprint"]]
+
+    def _process_issues(self, issues: list):
+        """Xử lý cả danh sách issue (xem ``process_sprint``)"""
         # Kiểm tra và đảm bảo start_date và end_date không None trước khi gọi
         if self.start_date is None or self.end_date is None:
-            st.error("start_date hoặc end_date không được None")
-            return None
+            self.progress.error("start_date hoặc end_date không được None")
+            return []
+
+        worklog_service = None
+        for issue in issues:
+            key = issue.get("key", "")
+            worklogs = issue.get("fields", {}).get("worklog", {})
+            # Lấy toàn bộ worklog cho issue nếu không đầy đủ
+            if worklogs.get("total", 0) > len(worklogs.get("worklogs", [])):
+                self.progress.info(
+                    f"Lấy toàn bộ worklog cho issue {key} vì có {worklogs.get('total',0)} worklogs"
+                )
+                worklog_service = worklog_service or WorklogService(progress=self.progress)
+                worklogs["worklogs"] = worklog_service.get_worklogs_by_issue_key(
+                    issue_key=key
+                )
 
-        data_worklog = worklog_service.calculate_worklog_data(
-            worklog_list,
-            start_date=self.start_date,
-            end_date=self.end_date,
-        )
+            if key == KEY_ISSUE_DEBUG and KEY_ISSUE_DEBUG:
+                self.progress.debug(f"Issue {key}", issue)
 
-        changelog = self._process_changelog(
-            issue.get("changelog", {}).get("histories", [])
-        )
-        is_show_dashboard = (
-            True
-            if (
-                issuetype != "Epic" and is_development and assignee and not has_subtasks
-            )
-            else False
-        )
-        is_to_do = True if (status == "To Do" and is_show_dashboard) else False
-        active_in_sprint = (
-            True
-            if (
-                (
-                    data_worklog["time_spent_in_sprint_seconds"]
-                    and status != "Close"
-                    and is_show_dashboard
-                )
-                or is_to_do
+        if SPRINT_PROCESS_POOL_MIN_ISSUES and len(issues) >= SPRINT_PROCESS_POOL_MIN_ISSUES:
+            processed = process_sprint_parallel(
+                issues,
+                self.start_date,
+                self.end_date,
+                chunk_size=SPRINT_PROCESS_CHUNK_SIZE,
+                max_workers=SPRINT_PROCESS_MAX_WORKERS or None,
             )
-            else False
-        )
+        else:
+            processed = process_sprint(issues, self.start_date, self.end_date)
 
-        if key == KEY_ISSUE_DEBUG and KEY_ISSUE_DEBUG:
-            st.write(issue)
-
-        issue_processed = {
-            "key": key,
-            "summary": summary,
-            "status": status,
-            "status_in_sprint": changelog["status_in_sprint"],
-            "issuetype": issuetype,
-            "assignee": assignee,
-            "reporter": reporter,
-            "tester": tester,
-            "priority": priority,
-            "points": points,
-            "steve_estimate": steve_estimate,
-            "tech": tech,
-            "env": env,
-            "customer": customer,
-            "is_development": is_development,
-            "is_show_dashboard": is_show_dashboard,
-            "is_popup": is_popup,
-            "feature": feature,
-            "has_subtasks": has_subtasks,
-            "active_in_sprint": active_in_sprint,
-            "originalEstimate": timetracking.get("originalEstimate", "0h"),
-            "timeSpent": timetracking.get("timeSpent", "0h"),
-            "remaining": remaining,
-            "remainingEstimate": timetracking.get("remainingEstimate", "0h"),
-            "originalEstimateSeconds": timetracking.get("originalEstimateSeconds", 0),
-            "timeSpentSeconds": timetracking.get("timeSpentSeconds", 0),
-            "remainingEstimateSeconds": timetracking.get("remainingEstimateSeconds", 0),
-            "remainingSeconds": remainingSeconds,
-            "count_spinrt_closed": count_spinrt_closed,
-            "created_at": created_at,
-            "updated_at": updated_at,
-            "hours_elapsed": hours_since_update.get("hours_elapsed", 0),
-            "hours_elapsed_str": hours_since_update.get("hours_elapsed_str", "0h"),
-            "date_elapsed": hours_since_update.get("date_elapsed", "0d 0h"),
-            # Dữ liệu worklog mới
-            "count_worklog": data_worklog["count_worklog"],
-            "time_spent_in_sprint_hours": data_worklog["time_spent_in_sprint_hours"],
-            "time_spent_in_sprint_seconds": data_worklog[
-                "time_spent_in_sprint_seconds"
-            ],
-            "unique_loggers_count": data_worklog["unique_loggers_count"],
-            "first_time_in_progress": changelog["first_time_in_progress"],
-            "count_reopen": changelog["count_reopen"],
-            "has_reopen": changelog["has_reopen"],
-            "reopen_in_sprint": changelog["reopen_in_sprint"],
-            "is_done_in_sprint": changelog["is_done_in_sprint"],
-            "time_done_in_sprint": changelog["time_done_in_sprint"],
-            "duration_hours_to_done": changelog["duration_hours_to_done"],
-            "duration_date_to_done": changelog["duration_date_to_done"],
-            "duedate": duedate,
-        }
-        return issue_processed
+        self.worklog_summary = processed.worklog_summary
+        self.status_events = processed.status_events
+        return processed.issues
 
     def print_list_issues(self, data):
         data = data or self.list_issues
-        st.write(data)
-
-    def _process_changelog(self, histories: list):
-        status_changes = []
-        count_reopen = 0
-
-        is_done_in_sprint = False
-        first_time_in_progress = None
-        time_done_in_sprint = None
-        reopen_in_sprint = False
-
-        status_in_sprint = "To Do"
-
-        # Sắp xếp lịch sử để đảm bảo xử lý đúng thứ tự thời gian
-        histories.sort(key=lambda x: x.get("created", "s"))
-
-        for history in histories:
-            items = history.get("items", [])
-            if len(items) == 1 and items[0].get("field") == "status":
-                status_to = items[0].get("toString", "")
-                status_from = items[0].get("fromString", "")
-                time_change = convert_time_str_to_datetime(
-                    history.get("created", "")
-                )  # type: ignore
-                author = history.get("author", {}).get("displayName", "")
-
-                is_in_sprint = (
-                    time_change is not None
-                    and self.start_date is not None
-                    and self.end_date is not None
-                    and time_change >= self.start_date
-                    and time_change <= self.end_date
-                )
+        self.progress.debug("Danh sách issue", data)
 
-                if (
-                    time_change is not None
-                    and self.end_date is not None
-                    and time_change <= self.end_date
-                ):
-                    status_in_sprint = status_to
-
-                if status_from == "Reopen":
-                    count_reopen += 1
-                    reopen_in_sprint = True if is_in_sprint else False
-
-                if status_to == "Done" and is_in_sprint:
-                    is_done_in_sprint = True
-                    time_done_in_sprint = time_change
-
-                status_changes.append(
-                    {
-                        "created": time_change,
-                        "author": author,
-                        "fromString": status_from,
-                        "toString": status_to,
-                    }
-                )
-        first_time_in_progress = (
-            convert_time_str_to_datetime(status_changes[0]["created"])
-            if status_changes
-            else None
-        )
-        duration_hours_to_done = (
-            (time_done_in_sprint - first_time_in_progress)
-            if time_done_in_sprint and first_time_in_progress
-            else None
-        )
-        duration_date_to_done = (
-            round(duration_hours_to_done.total_seconds() / 3600 / 24, 2)
-            if duration_hours_to_done
-            else 0.0
-        )
+    def get_metric_sprint(self):
+        """
+        Thống kê số issue theo các chiều (status, type, priority, feature, ...)
+        cho tất cả issue hiển thị và issue active, đọc từ metric cube
+        """
+        cube = self.get_metric_cube()
+        active_cube = _active_slice(cube)
 
-        return {
-            "status_in_sprint": status_in_sprint,
-            "first_time_in_progress": first_time_in_progress,
-            "count_reopen": count_reopen,
-            "has_reopen": count_reopen > 0,
-            "histories": status_changes,
-            "is_done_in_sprint": is_done_in_sprint,
-            "time_done_in_sprint": time_done_in_sprint,
-            "duration_hours_to_done": duration_hours_to_done,
-            "duration_date_to_done": duration_date_to_done,
-            "reopen_in_sprint": reopen_in_sprint,
+        data = {
+            "count_issues": int(cube.sum()),
+            "count_issues_active": int(active_cube.sum()),
         }
+        for dimension, metric_name in METRIC_DIMENSIONS.items():
+            data[metric_name] = {
+                "all": _get_metric_from_cube(cube, dimension),
+                "active": _get_metric_from_cube(active_cube, dimension),
+            }
+        return data
 
-    def get_metric_sprint(self):
-        list_issues_active = self.get_issue_active_in_sprint()
-        all_issues = self.list_issues[self.list_issues["is_show_dashboard"]]
-        count_issues = len(all_issues["is_development"])
-        st.write("Thống kê theo status_in_sprint")
-        metric_by_status_in_sprint = _get_metric_by_key(
-            all_issues, "status_in_sprint", list(STATUS_ORDER.keys())
-        )
-        metric_by_status_issues_active_in_sprint = _get_metric_by_key(
-            list_issues_active, "status_in_sprint", list(STATUS_ORDER.keys())
-        )
-        metric_by_type_issues = _get_metric_by_key(all_issues, "issuetype")
-        metric_by_type_issues_active = _get_metric_by_key(
-            list_issues_active, "issuetype"
+    def get_metric_by_dimension(self, dimension: str, only_active: bool = False):
+        """Thống kê số issue theo một chiều bất kỳ trong METRIC_DIMENSIONS"""
+        cube = self.get_metric_cube()
+        return _get_metric_from_cube(
+            _active_slice(cube) if only_active else cube, dimension
         )
 
-        metric_by_priority = _get_metric_by_key(all_issues, "priority")
-        metric_by_priority_active = _get_metric_by_key(list_issues_active, "priority")
-
-        metric_by_feature = _get_metric_by_key(all_issues, "feature")
-        metric_by_feature_active = _get_metric_by_key(list_issues_active, "feature")
+    def get_metric_cube(self) -> pd.Series:
+        """
+        Metric cube: số issue hiển thị (is_show_dashboard) theo
+        (active_in_sprint, các chiều trong METRIC_DIMENSIONS), memo theo data_version
+        """
+        data_version = self.data_version or _hash_issues(self.list_issues)
+        return _build_metric_cube(data_version, self.list_issues)
+
+
+def sprint_cache_key(board_id: int, sprint_id: int, name: str = "issues") -> str:
+    """Cache key cho dữ liệu của sprint (dùng được khi chưa tạo SprintService)"""
+    cache_key = f"cache_{name}_sprint_{board_id}_{sprint_id}"
+    if name in RECORD_CACHE_NAMES:
+        cache_key = f"{cache_key}_{ISSUE_SCHEMA_VERSION}"
+    return cache_key
+
+
+@st.cache_data(ttl=SPRINT_LIST_TTL_SECONDS, show_spinner=False)
+def _fetch_board_sprints(board_id: int, state: str, _jira) -> tuple:
+    """Lấy toàn bộ sprint của board qua các trang của API (cache theo board + state)"""
+    params = {"maxResults": DEFAULT_MAX_SPRINT_PER_PAGE}
+    if state:
+        params["state"] = state
+
+    list_sprint = []
+    start_at = 0
+    while True:
+        params["startAt"] = start_at
+        response = _jira._get_json(
+            f"board/{board_id}/sprint", params, base=_jira.AGILE_BASE_URL
+        )
+        sprints_on_page = response.get("values", [])
+        list_sprint.extend(sprints_on_page)
+        if not sprints_on_page or response.get("isLast", True):
+            break
+        start_at += len(sprints_on_page)
+
+    # Sprint mới nhất lên đầu
+    return tuple(
+        SprintRecord.from_dict(sprint)
+        for sprint in reversed(list_sprint)
+        if sprint.get("originBoardId") == board_id
+    )
 
-        data = {
-            "count_issues": count_issues,
-            "count_issues_active": len(list_issues_active),
-            "metric_by_status": {
-                "all": metric_by_status_in_sprint,
-                "active": metric_by_status_issues_active_in_sprint,
-            },
-            "metric_by_type": {
-                "all": metric_by_type_issues,
-                "active": metric_by_type_issues_active,
-            },
-            "metric_by_priority": {
-                "all": metric_by_priority,
-                "active": metric_by_priority_active,
-            },
-            "metric_by_feature": {
-                "all": metric_by_feature,
-                "active": metric_by_feature_active,
-            },
-        }
-        return data
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_metric_cube(data_version: str, _list_issues: pd.DataFrame) -> pd.Series:
+    """Một lần groupby cho toàn bộ thống kê của sprint (memo theo data_version)"""
+    shown = _list_issues[_list_issues["is_show_dashboard"]]
+    dimensions = [name for name in METRIC_DIMENSIONS if name in shown.columns]
+    return shown.groupby(
+        ["active_in_sprint", *dimensions], dropna=False, observed=True
+    ).size()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_burndown(
+    data_version: str,
+    _events: pd.DataFrame,
+    _list_issues: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    today,
+) -> pd.DataFrame:
+    """Burndown của sprint (memo theo data_version, khoảng sprint và ngày hiện tại)"""
+    return build_burndown(_events, _list_issues, start_date, end_date, now=today)
+
+
+def _active_slice(cube: pd.Series) -> pd.Series:
+    """Phần cube của các issue active_in_sprint"""
+    return cube[cube.index.get_level_values("active_in_sprint").astype(bool)]
+
+
+def _get_metric_from_cube(cube: pd.Series, dimension: str) -> dict:
+    """Roll-up cube theo một chiều, giữ thứ tự định sẵn nếu có"""
+    if cube.empty or dimension not in cube.index.names:
+        return {}
+    counts = (
+        cube.groupby(level=dimension, dropna=False, observed=True)
+        .sum()
+        .sort_values(ascending=False, kind="stable")
+    )
+    counts = counts[counts > 0]
+    return _order_metric(
+        {key: int(count) for key, count in counts.items()},
+        METRIC_ORDERS.get(dimension, []),
+    )
 
-def _get_field(data: dict, field_name: str, key: str = "value", is_bool: bool = False):
-    data_field = data.get(field_name, {})
-    if data_field:
 
-        vaule_field = (
-            data_field[0].get(key, "")
-            if isinstance(data_field, list)
-            else data_field.get(key, "")
-        )
-    else:
-        vaule_field = ""
-    if is_bool:
-        return True if (vaule_field and vaule_field == "YES") else False
-    return vaule_field
+def _hash_issues(list_issues: pd.DataFrame) -> str:
+    """Version của dữ liệu sprint khi không có data_version (hash nội dung)"""
+    return str(pd.util.hash_pandas_object(list_issues.astype(str), index=False).sum())
 
 
-def _get_metric_by_key(all_issues, key_count: str, order_by_list: list = []):
-    status_counts = all_issues[key_count].value_counts().to_dict()
+def _order_metric(status_counts: dict, order_by_list: list = []):
     if not order_by_list:
         return status_counts
     # Sắp xếp theo thứ tự định sẵn và thêm các status còn lại
@@ -0,0 +1,149 @@
+"""
+Status Analytics - Time-in-status, cycle time và lead time của sprint
+
+Tính một lần từ bảng sự kiện changelog (``build_status_events``) khi load
+sprint, rồi cache cùng dữ liệu sprint. Trang báo cáo chỉ đọc kết quả đã tính,
+không duyệt lại changelog mỗi lần rerun.
+
+- Time-in-status: ma trận issue × status -> số giờ ở status đó (tính cả khoảng
+  từ lúc tạo issue tới lần chuyển trạng thái đầu tiên)
+- Cycle time: từ lần chuyển trạng thái đầu tiên tới lần chuyển sang Done cuối cùng
+- Lead time: từ lúc tạo issue tới lần chuyển sang Done cuối cùng
+
+Giống ``process_changelog`` và burndown, chỉ dùng các history có duy
+nhất một item là status (``status_only``), nên started_at trùng với
+``first_time_in_progress``.
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+import pandas as pd
+
+from conf import STATUS_ORDER
+from service.clients.jira.changelog_events import DEFAULT_STATUS, status_intervals
+from service.utils.time_utils import parse_jira_timestamps
+
+DONE_STATUS = "Done"
+FLOW_DIMENSIONS = ["issuetype", "feature", "assignee"]
+FLOW_PERCENTILES = [50, 75, 85, 95]
+FLOW_METRICS = ["cycle_hours", "lead_hours"]
+ALL_GROUP = "(Tất cả)"
+# Tăng khi quy ước tính thay đổi để kết quả đã cache được tính lại
+STATUS_ANALYTICS_VERSION = 2
+
+
+def build_status_analytics(
+    events: pd.DataFrame, issues: pd.DataFrame, until: datetime
+) -> Dict:
+    """
+    Tính toàn bộ số liệu time-in-status / flow time của sprint
+
+    Args:
+        events: Bảng sự kiện từ ``build_status_events``
+        issues: Danh sách issue đã xử lý (cùng thứ tự position), cần các cột
+            key, created_at và các cột trong FLOW_DIMENSIONS
+        until: Thời điểm kết thúc tính (cuối sprint hoặc hiện tại nếu sớm hơn)
+
+    Returns:
+        dict: {
+            "time_in_status": ma trận giờ, index là key issue, cột là status,
+            "flow_times": cycle/lead time theo issue,
+            "percentiles": {dimension: bảng percentile cycle/lead time},
+            "version": STATUS_ANALYTICS_VERSION,
+        }
+    """
+    created = parse_jira_timestamps(issues["created_at"])
+    flow = flow_times(events, issues, created, until)
+    return {
+        "version": STATUS_ANALYTICS_VERSION,
+        "time_in_status": time_in_status_matrix(events, issues["key"], created, until),
+        "flow_times": flow,
+        "percentiles": {
+            dimension: flow_percentiles(flow, dimension) for dimension in FLOW_DIMENSIONS
+        },
+    }
+
+
+def time_in_status_matrix(
+    events: pd.DataFrame, keys: pd.Series, created: pd.Series, until: datetime
+) -> pd.DataFrame:
+    """
+    Ma trận issue × status -> số giờ ở mỗi status trước ``until``
+
+    Khoảng đầu tiên (từ lúc tạo tới sự kiện đầu) được tính vào ``from_status``
+    của sự kiện đầu, hoặc DEFAULT_STATUS nếu issue chưa đổi trạng thái.
+    """
+    until = pd.Timestamp(until)
+    events = events[events["status_only"]]
+    intervals = status_intervals(events, until)
+
+    first = events.groupby("position").agg(
+        first_at=("created", "first"), first_from=("from_status", "first")
+    )
+    initial = pd.DataFrame(
+        {"position": range(len(created)), "start": created.to_numpy()}
+    ).join(first, on="position")
+    initial["status"] = initial["first_from"].replace("", None).fillna(DEFAULT_STATUS)
+    initial["end"] = initial["first_at"].fillna(until).clip(upper=until)
+    initial = initial[initial["start"] < initial["end"]]
+    initial["hours"] = (initial["end"] - initial["start"]).dt.total_seconds() / 3600
+
+    columns = ["position", "status", "hours"]
+    all_intervals = pd.concat([initial[columns], intervals[columns]], ignore_index=True)
+    matrix = all_intervals.pivot_table(
+        index="position", columns="status", values="hours", aggfunc="sum", fill_value=0.0
+    )
+    statuses = [s for s in STATUS_ORDER if s in matrix.columns]
+    statuses += [s for s in matrix.columns if s not in statuses]
+    matrix = matrix.reindex(index=range(len(keys)), columns=statuses, fill_value=0.0)
+    matrix.index = pd.Index(keys.to_numpy(), name="key")
+    matrix.columns.name = "status"
+    return matrix.round(2)
+
+
+def flow_times(
+    events: pd.DataFrame, issues: pd.DataFrame, created: pd.Series, until: datetime
+) -> pd.DataFrame:
+    """
+    Cycle time và lead time (giờ) của từng issue, NaN nếu chưa Done trước ``until``
+    """
+    events = events[events["status_only"]]
+    before = events[events["created"] <= pd.Timestamp(until)]
+    is_done = before["to_status"] == DONE_STATUS
+    done_at = before["created"][is_done].groupby(before["position"][is_done]).last()
+    started_at = before.groupby("position")["created"].first()
+
+    index = pd.RangeIndex(len(issues), name="position")
+    flow = issues.reindex(columns=["key", *FLOW_DIMENSIONS]).set_axis(index)
+    flow["created_at"] = created.to_numpy()
+    flow["started_at"] = started_at.reindex(index)
+    flow["done_at"] = done_at.reindex(index)
+    flow["cycle_hours"] = _hours_between(flow["started_at"], flow["done_at"])
+    flow["lead_hours"] = _hours_between(flow["created_at"], flow["done_at"])
+    return flow
+
+
+def flow_percentiles(
+    flow: pd.DataFrame, dimension: str, percentiles: List[int] = FLOW_PERCENTILES
+) -> pd.DataFrame:
+    """
+    Percentile cycle/lead time (giờ) theo một chiều, kèm dòng ALL_GROUP cho cả sprint
+
+    Returns:
+        pd.DataFrame: Index là giá trị của chiều, cột count, cycle_hours_p50, ...
+    """
+    done = flow[flow["done_at"].notna()]
+    done = pd.concat([done.assign(**{dimension: ALL_GROUP}), done], ignore_index=True)
+    grouped = done.groupby(dimension, sort=False)[FLOW_METRICS]
+
+    table = grouped.quantile([p / 100 for p in percentiles]).unstack()
+    table.columns = [f"{metric}_p{round(q * 100)}" for metric, q in table.columns]
+    table.insert(0, "count", grouped.size())
+    table.index.name = dimension
+    return table.round(1)
+
+
+def _hours_between(start: pd.Series, end: pd.Series) -> pd.Series:
+    hours = (end - start).dt.total_seconds() / 3600
+    return hours.where(hours >= 0)
@@ -0,0 +1,195 @@
+"""
+User Directory - Danh bạ user dùng chung toàn process
+
+Gộp toàn bộ user Jira (``users/search``, đọc hết các page) với ``user.json``
+(shortName, role), index theo displayName và accountId. Danh bạ được lưu thành
+snapshot trên đĩa (file cache, kèm etag = hash nội dung và thời điểm sync) nên
+khởi động lại app không phải gọi API. Khi snapshot quá
+``USER_DIRECTORY_TTL_SECONDS``, danh bạ hiện có vẫn được dùng ngay và việc sync
+chạy ở thread nền; request của trang không bao giờ phải chờ danh sách user.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from conf import USER_DIRECTORY_TTL_SECONDS
+from service.clients.jira.user_service import UserService, load_local_users
+from service.utils.cache_utils import file_cache
+
+USER_DIRECTORY_CACHE_KEY = "user_directory"
+
+# Field lấy từ user.json, ghi đè dữ liệu Jira
+USER_OVERRIDE_FIELDS = ["shortName", "role"]
+
+
+def fetch_jira_users() -> List[Dict]:
+    """Toàn bộ user Jira (active, accountType atlassian)"""
+    return UserService().get_list_users()
+
+
+def merge_users(jira_users: List[Dict], local_users: List[Dict]) -> List[Dict]:
+    """Gộp user Jira với user.json theo accountId (hoặc displayName)"""
+    merged = {}
+    for user in jira_users:
+        merged[user.get("accountId") or user.get("displayName")] = dict(user)
+    # user.json có thể có nhiều dòng cùng accountId (tài khoản dùng chung):
+    # user chỉ có trong user.json được giữ nguyên từng dòng
+    local_only = []
+    for local in local_users:
+        key = local.get("accountId") or local.get("displayName")
+        if key in merged:
+            for field in USER_OVERRIDE_FIELDS:
+                if local.get(field):
+                    merged[key][field] = local[field]
+        else:
+            local_only.append(dict(local))
+    return [*merged.values(), *local_only]
+
+
+def users_etag(users: List[Dict]) -> str:
+    """Hash nội dung danh bạ, dùng để biết lần sync có thay đổi hay không"""
+    payload = json.dumps(users, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class UserDirectory:
+    """Danh bạ user index theo displayName / accountId, sync nền theo TTL"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = USER_DIRECTORY_TTL_SECONDS,
+        fetcher: Optional[Callable[[], List[Dict]]] = None,
+        local_loader: Optional[Callable[[], List[Dict]]] = None,
+        cache_key: str = USER_DIRECTORY_CACHE_KEY,
+        background: bool = True,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.cache_key = cache_key
+        self.background = background
+        self._fetcher = fetcher or fetch_jira_users
+        self._local_loader = local_loader or load_local_users
+        self._lock = threading.Lock()
+        self._users: List[Dict] = []
+        self._by_display_name: Dict[str, Dict] = {}
+        self._by_account_id: Dict[str, Dict] = {}
+        self._loaded = False
+        self._refreshing = False
+        self.etag: Optional[str] = None
+        self.synced_at: Optional[datetime] = None
+
+    def _ensure_loaded(self):
+        """Load snapshot ở lần dùng đầu tiên; sync (nền) nếu snapshot đã cũ"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load_snapshot()
+        if self.is_stale():
+            self.refresh(wait=not self.background)
+
+    def _load_snapshot(self):
+        snapshot = file_cache.load_cache(self.cache_key)
+        if snapshot:
+            self.set_users(snapshot["users"])
+            self.etag = snapshot.get("etag")
+            self.synced_at = snapshot.get("synced_at")
+        else:
+            # Chưa sync lần nào: dùng user.json trong lúc chờ sync
+            self.set_users(merge_users([], self._local_loader()))
+        self._loaded = True
+
+    def is_stale(self) -> bool:
+        """Danh bạ chưa sync hoặc đã sync quá TTL"""
+        if self.synced_at is None:
+            return True
+        return (datetime.now() - self.synced_at).total_seconds() >= self.ttl_seconds
+
+    def refresh(self, wait: bool = False) -> Optional[threading.Thread]:
+        """
+        Sync danh bạ với Jira (chỉ một lần sync chạy tại một thời điểm)
+
+        Args:
+            wait: True để sync ngay trong thread hiện tại
+
+        Returns:
+            Thread đang sync nền, hoặc None
+        """
+        with self._lock:
+            if self._refreshing:
+                return None
+            self._refreshing = True
+        if wait:
+            self._sync()
+            return None
+        thread = threading.Thread(
+            target=self._sync, name="user-directory-sync", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _sync(self):
+        try:
+            users = merge_users(self._fetcher(), self._local_loader())
+            etag = users_etag(users)
+            if etag != self.etag:
+                self.set_users(users)
+                self.etag = etag
+            self.synced_at = datetime.now()
+            file_cache.save_cache(
+                self.cache_key,
+                {"users": self._users, "etag": self.etag, "synced_at": self.synced_at},
+            )
+        except Exception as e:
+            # Giữ danh bạ hiện có, thử lại sau TTL
+            print(f"Warning: Could not sync user directory: {e}")
+            self.synced_at = datetime.now()
+        finally:
+            self._refreshing = False
+
+    def set_users(self, users: List[Dict]):
+        """Thay toàn bộ danh bạ và build lại index"""
+        by_display_name = {}
+        by_account_id = {}
+        for user in users:
+            if user.get("displayName"):
+                by_display_name[user["displayName"]] = user
+            if user.get("accountId"):
+                by_account_id[user["accountId"]] = user
+        self._users = list(users)
+        self._by_display_name = by_display_name
+        self._by_account_id = by_account_id
+
+    def invalidate(self):
+        """Đánh dấu danh bạ hết hạn, lần tra cứu sau sẽ sync lại"""
+        self.synced_at = None
+
+    def get_users(self) -> List[Dict]:
+        """Tất cả user trong danh bạ"""
+        self._ensure_loaded()
+        return self._users
+
+    def get_by_display_name(self, display_name: str) -> Optional[Dict]:
+        """Lấy user theo displayName - O(1)"""
+        self._ensure_loaded()
+        return self._by_display_name.get(display_name)
+
+    def get_by_account_id(self, account_id: str) -> Optional[Dict]:
+        """Lấy user theo accountId - O(1)"""
+        self._ensure_loaded()
+        return self._by_account_id.get(account_id)
+
+    def get_avatar_url(self, display_name: str) -> str:
+        """Avatar URL theo displayName ("" nếu không có)"""
+        user = self.get_by_display_name(display_name)
+        return user.get("avatar", "") if user else ""
+
+    def get_short_name(self, display_name: str) -> str:
+        """shortName theo displayName (mặc định là displayName)"""
+        user = self.get_by_display_name(display_name)
+        return (user.get("shortName") if user else None) or display_name
+
+
+# Global instance
+user_directory = UserDirectory()
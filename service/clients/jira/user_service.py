@@ -1,7 +1,19 @@
 import json
 import os
+from typing import Optional
 from service.base.jira_base import JiraBase
-from conf import DEFAULT_PROJECT
+from conf import DEFAULT_PROJECT, USER_SYNC_PAGE_SIZE
+
+USER_JSON_PATH = "./service/utils/user.json"
+
+
+def load_local_users() -> list:
+    """Đọc danh sách user cấu hình tay (shortName, role...) từ user.json"""
+    try:
+        with open(USER_JSON_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
 
 
 class UserService(JiraBase):
@@ -10,11 +22,7 @@ class UserService(JiraBase):
     def __init__(self):
         super().__init__()
         # Load users từ file JSON
-        try:
-            with open("./service/utils/user.json", "r", encoding="utf-8") as f:
-                self.users = json.load(f)
-        except FileNotFoundError:
-            self.users = []
+        self.users = load_local_users()
 
         # Tạo dict mapping để query user data nhanh hơn - O(1) complexity
         self._users_by_display_name = {}
@@ -30,20 +38,38 @@ class UserService(JiraBase):
             if account_id:
                 self._users_by_account_id[account_id] = user
 
-    def get_list_users(self, limit=200):
-        """Lấy danh sách user từ Jira Cloud, chỉ lấy user có accountType là 'atlassian'"""
-        params = {"maxResults": limit}
-        users = self.jira._get_json("users/search", params)
+    def get_list_users(
+        self, limit: Optional[int] = None, page_size: int = USER_SYNC_PAGE_SIZE
+    ):
+        """
+        Lấy danh sách user từ Jira Cloud, chỉ lấy user có accountType là 'atlassian'
+
+        Đọc lần lượt từng page của users/search đến khi hết user (hoặc đủ limit).
+
+        Args:
+            limit: Số user tối đa cần đọc từ API (None = tất cả)
+            page_size: Số user mỗi page
+        """
         result = []
-        for user in users:
-            user_is_active_and_human = user.get(
-                "accountType"
-            ) == "atlassian" and user.get("active")
-            if not user_is_active_and_human:
-                continue
-            user["avatar"] = user["avatarUrls"]["48x48"]
-            del user["avatarUrls"]
-            result.append(user)
+        start_at = 0
+        while limit is None or start_at < limit:
+            max_results = (
+                page_size if limit is None else min(page_size, limit - start_at)
+            )
+            params = {"startAt": start_at, "maxResults": max_results}
+            users = self.jira._get_json("users/search", params)
+            for user in users:
+                user_is_active_and_human = user.get(
+                    "accountType"
+                ) == "atlassian" and user.get("active")
+                if not user_is_active_and_human:
+                    continue
+                user["avatar"] = user["avatarUrls"]["48x48"]
+                del user["avatarUrls"]
+                result.append(user)
+            if len(users) < max_results:
+                break
+            start_at += len(users)
         return result
 
     def search_users(self):
@@ -1,14 +1,20 @@
+import json
+import numpy as np
+import pandas as pd
 from datetime import datetime
+from typing import List, Tuple
 from conf import DEFAULT_PROJECT
 from service.base.jira_base import JiraBase
-import streamlit as st
+from service.utils.time_utils import parse_jira_timestamp, parse_jira_timestamps
+
+WORKLOG_LIST_MAX_IDS = 1000  # Số id tối đa mỗi request worklog/list
 
 
 class WorklogService(JiraBase):
     """Service quản lý worklog trong Jira"""
 
-    def __init__(self, project_key=None):
-        super().__init__()
+    def __init__(self, project_key=None, progress=None):
+        super().__init__(progress)
         self.project_key = project_key or DEFAULT_PROJECT
 
     def set_project_key(self, project_key):
@@ -49,6 +55,43 @@ class WorklogService(JiraBase):
 
         return all_worklogs
 
+    def _get_changed_worklog_ids(self, path: str, since_ms: int) -> Tuple[List[int], int]:
+        """Đọc hết các page của worklog/updated hoặc worklog/deleted từ since_ms"""
+        ids = []
+        until = since_ms
+        while True:
+            page = self.jira._get_json(path, {"since": since_ms})
+            ids.extend(value["worklogId"] for value in page.get("values", []))
+            until = page.get("until", until)
+            if page.get("lastPage", True):
+                break
+            since_ms = until
+        return ids, until
+
+    def get_updated_worklog_ids(self, since_ms: int) -> Tuple[List[int], int]:
+        """
+        Id các worklog được tạo / sửa từ thời điểm since_ms (epoch ms), toàn site
+
+        Returns:
+            (ids, until): until là mốc (ms) dùng cho lần đọc tiếp theo
+        """
+        return self._get_changed_worklog_ids("worklog/updated", since_ms)
+
+    def get_deleted_worklog_ids(self, since_ms: int) -> Tuple[List[int], int]:
+        """Id các worklog bị xóa từ thời điểm since_ms (epoch ms), kèm mốc until"""
+        return self._get_changed_worklog_ids("worklog/deleted", since_ms)
+
+    def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[dict]:
+        """Chi tiết worklog theo danh sách id (worklog/list, tối đa 1000 id / request)"""
+        worklogs = []
+        url = self.jira._get_url("worklog/list")
+        for start in range(0, len(worklog_ids), WORKLOG_LIST_MAX_IDS):
+            chunk = [int(value) for value in worklog_ids[start : start + WORKLOG_LIST_MAX_IDS]]
+            response = self.jira._session.post(url, data=json.dumps({"ids": chunk}))
+            response.raise_for_status()
+            worklogs.extend(response.json())
+        return worklogs
+
     def get_issues_with_worklog_in_period(self, start_date, end_date):
         """
         Lấy tất cả issue có worklog trong khoảng thời gian từ start_date đến end_date
@@ -127,21 +170,16 @@ class WorklogService(JiraBase):
             return result
 
         except Exception as e:
-            print(f"Lỗi khi lấy issue có worklog: {e}")
+            self.progress.error(f"Lỗi khi lấy issue có worklog: {e}")
             return []
 
-    def calculate_worklog_data(
-        self, worklogs: list, start_date: datetime, end_date: datetime
-    ):
-        author_name = []
+    @staticmethod
+    def calculate_worklog_data(worklogs: list, start_date: datetime, end_date: datetime):
+        author_name = set()
         time_spent_in_sprint_seconds = 0
         for w in worklogs:
-            author = w["author"]["displayName"]
-            if author not in author_name:
-                author_name.append(author)
-            started_time = datetime.strptime(
-                w["started"], "%Y-%m-%dT%H:%M:%S.%f%z"
-            ).replace(tzinfo=None)
+            author_name.add(w["author"]["displayName"])
+            started_time = parse_jira_timestamp(w["started"])
             if started_time >= start_date and started_time <= end_date:
                 time_spent_in_sprint_seconds += w["timeSpentSeconds"]
 
@@ -153,3 +191,124 @@ class WorklogService(JiraBase):
             "time_spent_in_sprint_seconds": time_spent_in_sprint_seconds,
             "time_spent_in_sprint_hours": f"{time_spent_in_sprint_hours:.2f}h",
         }
+
+    @staticmethod
+    def aggregate_sprint_worklogs(
+        raw_issues: list, start_date: datetime, end_date: datetime
+    ) -> dict:
+        """
+        Gộp worklog của tất cả issue trong sprint thành các mảng theo cột và tính
+        các chỉ số một lượt: chỉ số theo issue bằng ``np.bincount`` trên position,
+        các bảng theo user / ngày roll-up từ một lần groupby (user, ngày).
+
+        Worklog có ``started`` không parse được (NaT) vẫn được đếm vào
+        count_worklog / unique_loggers_count của issue nhưng không tính giờ
+        trong sprint.
+
+        Args:
+            raw_issues: Danh sách issue thô (fields.worklog.worklogs đã đầy đủ)
+            start_date: Ngày bắt đầu sprint (đã adjust)
+            end_date: Ngày kết thúc sprint (đã adjust)
+
+        Returns:
+            dict: {
+                "by_issue": chỉ số theo issue (cùng thứ tự raw_issues, giống
+                    ``calculate_worklog_data``),
+                "by_user": tổng giờ trong sprint theo user,
+                "by_day": tổng giờ trong sprint theo ngày,
+                "by_user_day": tổng giờ trong sprint theo user và ngày,
+            }
+        """
+        positions, authors, started, seconds = [], [], [], []
+        for position, issue in enumerate(raw_issues):
+            worklog = (issue.get("fields") or {}).get("worklog") or {}
+            for w in worklog.get("worklogs", []):
+                positions.append(position)
+                authors.append(w["author"]["displayName"])
+                started.append(w["started"])
+                seconds.append(w["timeSpentSeconds"])
+
+        issue_count = len(raw_issues)
+        positions = np.asarray(positions, dtype=np.int64)
+        seconds = np.asarray(seconds, dtype=np.int64)
+        started_time = parse_jira_timestamps(started)
+        in_sprint = (
+            ((started_time >= start_date) & (started_time <= end_date))
+            .fillna(False)
+            .to_numpy(dtype=bool)
+        )
+        seconds_in_sprint = np.where(in_sprint, seconds, 0)
+
+        # Chỉ số theo issue: đếm / cộng theo position, không cần groupby
+        author_codes, author_names = pd.factorize(pd.Series(authors, dtype=object))
+        logger_pairs = np.unique(positions * max(len(author_names), 1) + author_codes)
+        by_issue = pd.DataFrame(
+            {
+                "count_worklog": np.bincount(positions, minlength=issue_count),
+                "unique_loggers_count": np.bincount(
+                    logger_pairs // max(len(author_names), 1), minlength=issue_count
+                ),
+                "time_spent_in_sprint_seconds": np.bincount(
+                    positions, weights=seconds_in_sprint, minlength=issue_count
+                ),
+            },
+            index=pd.RangeIndex(issue_count, name="position"),
+        ).astype(np.int64)
+        hours = np.round(by_issue["time_spent_in_sprint_seconds"] / 3600, 2)
+        by_issue["time_spent_in_sprint_hours"] = [f"{h:.2f}h" for h in hours]
+        by_issue.insert(0, "key", [issue.get("key", "") for issue in raw_issues])
+
+        # Một lần groupby (user, ngày) trên worklog trong sprint, by_user / by_day
+        # roll-up từ bảng này
+        in_sprint_rows = pd.DataFrame(
+            {
+                "author": author_names.take(author_codes[in_sprint]),
+                "date": started_time[in_sprint].dt.normalize().to_numpy(),
+                "count_worklog": np.ones(int(in_sprint.sum()), dtype=np.int64),
+                "seconds": seconds[in_sprint],
+            }
+        )
+        by_user_day = in_sprint_rows.groupby(["author", "date"]).sum()
+        rollups = {
+            "by_user": by_user_day.groupby(level="author").sum(),
+            "by_day": by_user_day.groupby(level="date").sum(),
+            "by_user_day": by_user_day,
+        }
+        for name, rollup in rollups.items():
+            rollup["hours"] = np.round(rollup["seconds"] / 3600, 2)
+            rollups[name] = rollup.reset_index()
+
+        return {"by_issue": by_issue, **rollups}
+
+    @staticmethod
+    def merge_sprint_worklog_summaries(summaries: list) -> dict:
+        """
+        Ghép kết quả ``aggregate_sprint_worklogs`` của các phần (chunk) liên tiếp
+        của cùng một danh sách issue thành một kết quả như khi tính cả sprint.
+
+        Args:
+            summaries: Danh sách kết quả theo đúng thứ tự các chunk
+
+        Returns:
+            dict: Cùng cấu trúc với ``aggregate_sprint_worklogs``
+        """
+        # by_issue đánh index theo position trong chunk -> đánh lại theo thứ tự ghép
+        by_issue = pd.concat([summary["by_issue"] for summary in summaries])
+        by_issue.index = range(len(by_issue))
+
+        rollups = {}
+        for name, keys in [
+            ("by_user", ["author"]),
+            ("by_day", ["date"]),
+            ("by_user_day", ["author", "date"]),
+        ]:
+            # Cùng user/ngày có thể xuất hiện ở nhiều chunk nên phải cộng lại
+            rollup = (
+                pd.concat([summary[name] for summary in summaries])
+                .groupby(keys)[["count_worklog", "seconds"]]
+                .sum()
+            )
+            rollup["hours"] = np.round(rollup["seconds"] / 3600, 2)
+            rollups[name] = rollup.reset_index()
+
+        return {"by_issue": by_issue, **rollups}
@@ -131,6 +131,25 @@ class SupabaseHybridClient(HybridSingletonBase):
             st.error(f"Error filtering data from table {table_name}: {str(e)}")
             return []
 
+    def select_in_range(self, table_name: str, column: str, start, end):
+        """Get data with start <= column <= end"""
+        if not self.is_connected:
+            st.error("Supabase client is not connected")
+            return []
+
+        try:
+            response = (
+                self.client.table(table_name)
+                .select("*")
+                .gte(column, start)
+                .lte(column, end)
+                .execute()
+            )
+            return response.data
+        except Exception as e:
+            st.error(f"Error filtering data from table {table_name}: {str(e)}")
+            return []
+
     def select_with_pagination(self, table_name: str, limit: int = 10, offset: int = 0):
         """Get data with pagination"""
         if not self.is_connected:
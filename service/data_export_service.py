@@ -7,6 +7,8 @@ import streamlit as st
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from service.utils.excel_writer import ExcelSheet, write_excel
+
 
 class DataExportService:
     """Service để xử lý export data"""
@@ -148,22 +150,13 @@ class DataExportService:
             )
 
         with col2:
-            # Export Excel (nếu cần)
-            try:
-                import io
-
-                buffer = io.BytesIO()
-                with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                    df.to_excel(writer, index=False, sheet_name="Data")
-
-                st.download_button(
-                    label="📊 Tải về Excel",
-                    data=buffer.getvalue(),
-                    file_name=f"{filename}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                )
-            except ImportError:
-                st.info("Cần cài đặt openpyxl để export Excel")
+            # Export Excel (ghi streaming, độ rộng cột theo nội dung)
+            st.download_button(
+                label="📊 Tải về Excel",
+                data=write_excel([ExcelSheet(name="Data", frame=df)]),
+                file_name=f"{filename}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
 
         with col3:
             # Export JSON (nếu cần)
@@ -205,36 +198,29 @@ class DataExportService:
             return
 
         try:
-            import io
-
-            buffer = io.BytesIO()
+            sheets = []
 
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                # Sheet 1: Chi tiết ngày nghỉ
-                if time_off_data:
-                    df_details = DataExportService.prepare_time_off_dataframe(
-                        time_off_data
-                    )
-                    df_details.to_excel(
-                        writer, sheet_name="Chi tiết ngày nghỉ", index=False
-                    )
+            # Sheet 1: Chi tiết ngày nghỉ
+            if time_off_data:
+                df_details = DataExportService.prepare_time_off_dataframe(
+                    time_off_data
+                )
+                sheets.append(ExcelSheet(name="Chi tiết ngày nghỉ", frame=df_details))
 
-                # Sheet 2: Thống kê
-                if user_stats:
-                    df_stats = DataExportService.get_user_stats_dataframe(user_stats)
-                    df_stats.to_excel(writer, sheet_name="Thống kê", index=False)
+            # Sheet 2: Thống kê
+            if user_stats:
+                df_stats = DataExportService.get_user_stats_dataframe(user_stats)
+                sheets.append(ExcelSheet(name="Thống kê", frame=df_stats))
 
             filename = f"bao_cao_nghi_phep_thang_{selected_month}_{selected_year}.xlsx"
 
             st.download_button(
                 label="📋 Tải báo cáo tổng hợp",
-                data=buffer.getvalue(),
+                data=write_excel(sheets),
                 file_name=filename,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
 
-        except ImportError:
-            st.error("Cần cài đặt openpyxl để export Excel")
         except Exception as e:
             st.error(f"Lỗi khi export: {str(e)}")
 
@@ -0,0 +1,174 @@
+"""
+Issue Models - Định nghĩa cấu trúc dữ liệu gọn cho issue đã xử lý của sprint
+
+Mỗi issue đã xử lý có khoảng 50 field. Lưu dưới dạng dict thì mỗi issue giữ
+riêng một bảng hash và các chuỗi lặp lại (status, assignee, priority, ...);
+``IssueRecord`` dùng ``__slots__`` và intern các chuỗi lặp lại nên nhỏ hơn nhiều.
+``build_issue_frame`` tạo DataFrame với dtype gọn (category cho cột lặp lại,
+string, bool, số nguyên, datetime64 / timedelta64).
+
+``SprintService.get_issues_for_sprint`` trả về ``List[IssueRecord]`` (trước đây
+là list dict): truy cập field bằng thuộc tính (``issue.status``) hoặc
+``issue.to_dict()``. Record được pickle vào file cache nên cache key gắn với
+``ISSUE_SCHEMA_VERSION``; đổi field của record thì cache cũ tự bị bỏ qua.
+"""
+
+import hashlib
+import sys
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+# Các cột có ít giá trị khác nhau: intern trong record, category trong DataFrame
+CATEGORY_FIELDS = [
+    "status",
+    "status_in_sprint",
+    "issuetype",
+    "assignee",
+    "reporter",
+    "tester",
+    "priority",
+    "steve_estimate",
+    "tech",
+    "env",
+    "customer",
+    "feature",
+    "originalEstimate",
+    "timeSpent",
+    "remaining",
+    "remainingEstimate",
+]
+STRING_FIELDS = [
+    "key",
+    "summary",
+    "created_at",
+    "updated_at",
+    "hours_elapsed_str",
+    "date_elapsed",
+    "time_spent_in_sprint_hours",
+]
+DATETIME_FIELDS = ["first_time_in_progress", "time_done_in_sprint", "duedate"]
+TIMEDELTA_FIELDS = ["duration_hours_to_done"]
+
+
+@dataclass(slots=True)
+class IssueRecord:
+    """Model cho một issue đã xử lý của sprint (cùng field với ``ISSUE_COLUMNS``)"""
+
+    key: str
+    summary: str
+    status: str
+    status_in_sprint: str
+    issuetype: str
+    assignee: str
+    reporter: str
+    tester: str
+    priority: str
+    points: float
+    steve_estimate: str
+    tech: str
+    env: str
+    customer: str
+    is_development: bool
+    is_show_dashboard: bool
+    is_popup: bool
+    feature: str
+    has_subtasks: bool
+    active_in_sprint: bool
+    originalEstimate: str
+    timeSpent: str
+    remaining: str
+    remainingEstimate: str
+    originalEstimateSeconds: int
+    timeSpentSeconds: int
+    remainingEstimateSeconds: int
+    remainingSeconds: int
+    count_spinrt_closed: int
+    created_at: str
+    updated_at: str
+    hours_elapsed: int
+    hours_elapsed_str: str
+    date_elapsed: str
+    count_worklog: int
+    time_spent_in_sprint_hours: str
+    time_spent_in_sprint_seconds: int
+    unique_loggers_count: int
+    first_time_in_progress: Optional[datetime]
+    count_reopen: int
+    has_reopen: bool
+    reopen_in_sprint: bool
+    is_done_in_sprint: bool
+    time_done_in_sprint: Optional[datetime]
+    duration_hours_to_done: Optional[timedelta]
+    duration_date_to_done: float
+    duedate: Union[datetime, str]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IssueRecord":
+        """
+        Tạo IssueRecord từ dict issue đã xử lý (``process_issue``)
+
+        Args:
+            data: Dictionary chứa dữ liệu issue
+
+        Returns:
+            IssueRecord: Instance của IssueRecord
+        """
+        values = [data.get(name) for name in ISSUE_FIELDS]
+        for index in _CATEGORY_INDEXES:
+            if isinstance(values[index], str):
+                values[index] = sys.intern(values[index])
+        return cls(*values)
+
+    def to_dict(self) -> dict:
+        """
+        Chuyển IssueRecord thành dictionary (cùng format với ``process_issue``)
+
+        Returns:
+            dict: Dictionary representation
+        """
+        return {name: getattr(self, name) for name in ISSUE_FIELDS}
+
+
+ISSUE_FIELDS = [field.name for field in fields(IssueRecord)]
+# Version layout của record (tên + thứ tự field), dùng trong cache key của sprint
+ISSUE_SCHEMA_VERSION = hashlib.md5(",".join(ISSUE_FIELDS).encode()).hexdigest()[:8]
+_CATEGORY_INDEXES = [ISSUE_FIELDS.index(name) for name in CATEGORY_FIELDS]
+
+
+def to_issue_records(issues: Iterable[Union[dict, IssueRecord]]) -> List[IssueRecord]:
+    """Chuyển danh sách issue (dict hoặc IssueRecord, ví dụ từ cache cũ) thành record"""
+    return [
+        issue if isinstance(issue, IssueRecord) else IssueRecord.from_dict(issue)
+        for issue in issues
+    ]
+
+
+def build_issue_frame(records: List[IssueRecord]) -> pd.DataFrame:
+    """
+    Tạo DataFrame gọn từ danh sách IssueRecord
+
+    Cột lặp lại -> category, chuỗi -> string, thời gian -> datetime64 / timedelta64
+    (giá trị thiếu là NaT), các cột còn lại giữ kiểu số / bool.
+
+    Returns:
+        pd.DataFrame: Các cột theo thứ tự ISSUE_FIELDS
+    """
+    columns: Dict[str, pd.Series] = {}
+    for name in ISSUE_FIELDS:
+        values = [getattr(record, name) for record in records]
+        if name in CATEGORY_FIELDS:
+            columns[name] = pd.Series(values, dtype="category")
+        elif name in STRING_FIELDS:
+            columns[name] = pd.Series(values, dtype=pd.StringDtype())
+        elif name in DATETIME_FIELDS:
+            columns[name] = pd.to_datetime(
+                pd.Series([value or None for value in values], dtype=object)
+            )
+        elif name in TIMEDELTA_FIELDS:
+            columns[name] = pd.to_timedelta(pd.Series(values, dtype=object))
+        else:
+            columns[name] = pd.Series(values)
+    return pd.DataFrame(columns, columns=ISSUE_FIELDS)
@@ -0,0 +1,69 @@
+"""
+Sprint Models - Định nghĩa cấu trúc dữ liệu cho sprint
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SprintRecord:
+    """Model (immutable) cho một sprint của board"""
+
+    id: int
+    name: str
+    state: str
+    origin_board_id: Optional[int] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    complete_date: Optional[str] = None
+    goal: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SprintRecord":
+        """
+        Tạo SprintRecord từ dictionary trả về bởi Jira Agile API
+
+        Args:
+            data: Dictionary chứa dữ liệu sprint
+
+        Returns:
+            SprintRecord: Instance của SprintRecord
+        """
+        return cls(
+            id=data["id"],
+            name=data.get("name", ""),
+            state=data.get("state", ""),
+            origin_board_id=data.get("originBoardId"),
+            start_date=data.get("startDate"),
+            end_date=data.get("endDate"),
+            complete_date=data.get("completeDate"),
+            goal=data.get("goal") or "",
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Chuyển SprintRecord thành dictionary theo format của Jira
+
+        Returns:
+            dict: Dictionary representation
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "originBoardId": self.origin_board_id,
+            "startDate": self.start_date,
+            "endDate": self.end_date,
+            "completeDate": self.complete_date,
+            "goal": self.goal,
+        }
+
+    @property
+    def display_name(self) -> str:
+        """Tên hiển thị kèm trạng thái, ví dụ "Sprint 12 - ACTIVE" """
+        return f"{self.name} - {self.state.upper()}"
+
+    def __str__(self) -> str:
+        """String representation"""
+        return self.display_name
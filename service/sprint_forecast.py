@@ -0,0 +1,154 @@
+"""
+Sprint Forecast - Dự báo Monte Carlo số sprint cần để hoàn thành backlog còn lại
+
+Mẫu lịch sử là throughput của các sprint đã đóng (velocity points hoặc số issue
+done, lấy từ dòng trend đã cache - ``service/sprint_trend.py``). Mỗi trial rút
+ngẫu nhiên throughput cho từng sprint tương lai; toàn bộ trial được mô phỏng
+cùng lúc bằng ma trận NumPy (trials × sprints) nên hàng chục nghìn trial chạy
+trong vài chục ms. Kết quả được memo theo input (``cached_forecast_completion``).
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+FORECAST_TRIALS = 20000
+FORECAST_MAX_SPRINTS = 52  # Trial chưa xong sau số sprint này coi như không xong
+FORECAST_CONFIDENCES = [50, 85, 95]
+FORECAST_SEED = 42
+
+# Đơn vị dự báo -> cột throughput trong bảng trend
+FORECAST_UNITS = {"points": "velocity_points", "issues": "done_count"}
+
+
+def simulate_sprints_to_finish(
+    samples,
+    remaining: float,
+    trials: int = FORECAST_TRIALS,
+    max_sprints: int = FORECAST_MAX_SPRINTS,
+    seed: Optional[int] = FORECAST_SEED,
+) -> np.ndarray:
+    """
+    Mô phỏng số sprint cần để làm xong ``remaining`` với throughput rút từ ``samples``
+
+    Returns:
+        np.ndarray: Số sprint của từng trial (max_sprints + 1 nếu chưa xong)
+    """
+    samples = np.asarray(samples, dtype=float)
+    samples = samples[np.isfinite(samples)]
+    if remaining <= 0:
+        return np.zeros(trials, dtype=np.int64)
+    if samples.size == 0 or samples.max() <= 0:
+        return np.full(trials, max_sprints + 1, dtype=np.int64)
+
+    rng = np.random.default_rng(seed)
+    result = np.full(trials, max_sprints + 1, dtype=np.int64)
+    totals = np.zeros(trials)
+    active = np.arange(trials)
+    # Mô phỏng theo block cỡ số sprint kỳ vọng: phần lớn trial xong ở block đầu,
+    # các block sau chỉ chạy cho trial chưa xong
+    block = int(np.ceil(remaining / samples.mean() * 1.5)) + 1
+    start = 0
+    while active.size and start < max_sprints:
+        width = min(block, max_sprints - start)
+        draws = rng.choice(samples, size=(active.size, width))
+        cumulative = totals[active, None] + np.cumsum(draws, axis=1)
+        finished = cumulative >= remaining
+        hit = finished[:, -1]
+        # argmax trả về sprint đầu tiên đạt remaining (cột đầu tiên True)
+        result[active[hit]] = start + finished[hit].argmax(axis=1) + 1
+        totals[active] = cumulative[:, -1]
+        active = active[~hit]
+        start += width
+    return result
+
+
+def forecast_completion(
+    samples,
+    remaining: float,
+    trials: int = FORECAST_TRIALS,
+    confidences: List[int] = FORECAST_CONFIDENCES,
+    seed: Optional[int] = FORECAST_SEED,
+    max_sprints: int = FORECAST_MAX_SPRINTS,
+) -> Dict:
+    """
+    Dự báo số sprint để hoàn thành backlog theo các mức độ tin cậy
+
+    Returns:
+        dict: {
+            "confidence": {mức tin cậy (%): số sprint, None nếu vượt max_sprints},
+            "distribution": pd.DataFrame (sprints, probability, cumulative),
+            "unfinished_rate": tỉ lệ trial chưa xong sau max_sprints,
+            "trials": số trial,
+        }
+    """
+    sprints = simulate_sprints_to_finish(samples, remaining, trials, max_sprints, seed)
+    counts = np.bincount(sprints, minlength=max_sprints + 2)[: max_sprints + 1]
+    cumulative = np.cumsum(counts) / trials
+
+    confidence = {}
+    for level in confidences:
+        reached = np.flatnonzero(cumulative >= level / 100)
+        confidence[level] = int(reached[0]) if reached.size else None
+
+    used = np.flatnonzero(counts)
+    distribution = pd.DataFrame(
+        {
+            "sprints": used,
+            "probability": counts[used] / trials,
+            "cumulative": cumulative[used],
+        }
+    )
+    return {
+        "confidence": confidence,
+        "distribution": distribution,
+        "unfinished_rate": float((sprints > max_sprints).mean()),
+        "trials": trials,
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_forecast_completion(
+    samples: tuple,
+    remaining: float,
+    trials: int = FORECAST_TRIALS,
+    seed: Optional[int] = FORECAST_SEED,
+) -> Dict:
+    """``forecast_completion`` memo theo hash của input (mẫu, backlog, số trial, seed)"""
+    return forecast_completion(list(samples), remaining, trials=trials, seed=seed)
+
+
+def sprint_length_days(trend: pd.DataFrame, default: int = 14) -> int:
+    """Độ dài sprint (ngày) điển hình từ bảng trend (median start -> end)"""
+    start = pd.to_datetime(trend["start_date"], errors="coerce")
+    end = pd.to_datetime(trend["end_date"], errors="coerce")
+    length = (end - start).dt.days.median()
+    return int(length) if pd.notna(length) and length > 0 else default
+
+
+def forecast_dates(
+    confidence: Dict, start_from: datetime, sprint_days: int
+) -> Dict[int, Optional[datetime]]:
+    """Quy đổi số sprint thành ngày dự kiến hoàn thành"""
+    return {
+        level: (
+            start_from + timedelta(days=sprints * sprint_days)
+            if sprints is not None
+            else None
+        )
+        for level, sprints in confidence.items()
+    }
+
+
+def remaining_backlog(issues: pd.DataFrame, unit: str = "points") -> float:
+    """Backlog còn lại của sprint: issue hiển thị chưa done (points hoặc số issue)"""
+    if issues.empty:
+        return 0.0
+    shown = issues[issues["is_show_dashboard"].astype(bool)]
+    open_issues = shown[~shown["is_done_in_sprint"].astype(bool)]
+    if unit == "issues":
+        return float(len(open_issues))
+    return float(pd.to_numeric(open_issues["points"], errors="coerce").fillna(0).sum())
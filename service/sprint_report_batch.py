@@ -0,0 +1,264 @@
+"""
+Sprint Report Batch - Chạy báo cáo sprint cho nhiều board / sprint song song
+(không cần Streamlit), dùng lại logic của ``SprintService``
+
+Mỗi sprint được load + xử lý trong một thread riêng với một ``SprintService``
+riêng; kết quả (issue + metric ``get_metric_sprint``) được ghi ra
+Parquet / XLSX / JSON.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from service.base.progress import ProgressReporter, default_progress_reporter
+from service.clients.jira.sprint_service import SprintService
+from service.models.sprint_model import SprintRecord
+from service.utils.excel_writer import ExcelSheet, write_excel
+
+OUTPUT_FORMATS = ["parquet", "xlsx", "json"]
+
+# Cột định danh sprint thêm vào bảng issue / metric khi ghép nhiều sprint
+SPRINT_ID_COLUMNS = ["board_id", "sprint_id", "sprint_name"]
+
+
+@dataclass
+class SprintReportResult:
+    """Kết quả báo cáo của một sprint"""
+
+    board_id: int
+    sprint: SprintRecord
+    issues: pd.DataFrame = field(default_factory=pd.DataFrame)
+    metrics: Dict = field(default_factory=dict)
+    from_cache: bool = False
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def issue_count(self) -> int:
+        return len(self.issues)
+
+
+def select_sprints(sprints: List[SprintRecord], selectors: List[str]) -> List[SprintRecord]:
+    """
+    Chọn sprint theo danh sách selector (giữ thứ tự mới nhất trước, không trùng)
+
+    Selector hỗ trợ:
+        - ``active`` / ``future`` / ``closed``: theo state
+        - ``last:N``: N sprint closed gần nhất
+        - ``id:123`` hoặc ``123``: theo sprint id
+        - ``name:abc``: tên sprint chứa "abc" (không phân biệt hoa thường)
+
+    Args:
+        sprints: Danh sách sprint của board (mới nhất trước)
+        selectors: Danh sách selector, rỗng = ``active``
+    """
+    selected = {}
+    for selector in selectors or ["active"]:
+        kind, _, value = selector.partition(":")
+        kind = kind.strip().lower()
+        if kind in ("active", "future", "closed") and not value:
+            matched = [s for s in sprints if s.state.lower() == kind]
+        elif kind == "last":
+            closed = [s for s in sprints if s.state.lower() == "closed"]
+            matched = closed[: int(value or 1)]
+        elif kind == "name":
+            matched = [s for s in sprints if value.lower() in s.name.lower()]
+        elif kind == "id" or (kind.isdigit() and not value):
+            sprint_id = int(value or kind)
+            matched = [s for s in sprints if s.id == sprint_id]
+        else:
+            raise ValueError(f"Selector sprint không hợp lệ: {selector}")
+        selected.update({sprint.id: sprint for sprint in matched})
+
+    return [sprint for sprint in sprints if sprint.id in selected]
+
+
+def run_sprint_report(
+    board_id: int,
+    sprint: SprintRecord,
+    use_cache: bool = True,
+    progress: Optional[ProgressReporter] = None,
+) -> SprintReportResult:
+    """Load issue + tính metric cho một sprint (chạy được trong worker thread)"""
+    started = time.perf_counter()
+    result = SprintReportResult(board_id=board_id, sprint=sprint)
+    try:
+        sprint_service = SprintService(board_id, progress=progress)
+        sprint_service.set_data_sprint(sprint)
+        _, cache_info = sprint_service.get_issues_for_sprint(
+            sprint.id, use_cache=use_cache, return_cache_info=True
+        )
+        result.from_cache = cache_info["from_cache"]
+        result.issues = sprint_service.list_issues
+        if not result.issues.empty:
+            result.metrics = sprint_service.get_metric_sprint()
+    except Exception as e:
+        result.error = str(e)
+        (progress or default_progress_reporter).error(
+            f"Lỗi khi chạy báo cáo sprint {sprint.name} ({sprint.id}): {e}"
+        )
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def run_batch(
+    board_ids: List[int],
+    selectors: List[str],
+    max_workers: int = 4,
+    use_cache: bool = True,
+    progress: Optional[ProgressReporter] = None,
+) -> List[SprintReportResult]:
+    """
+    Chạy báo cáo cho các sprint được chọn của nhiều board song song
+
+    Returns:
+        List[SprintReportResult]: Theo thứ tự board, sprint mới nhất trước
+    """
+    progress = progress or default_progress_reporter
+    jobs = []
+    for board_id in board_ids:
+        sprints = SprintService(board_id, progress=progress).get_list_sprints(
+            sort_by_state=False
+        )
+        jobs.extend((board_id, sprint) for sprint in select_sprints(sprints, selectors))
+
+    progress.info(f"Chạy báo cáo cho {len(jobs)} sprint với {max_workers} thread")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [
+            pool.submit(run_sprint_report, board_id, sprint, use_cache, progress)
+            for board_id, sprint in jobs
+        ]
+        results = []
+        for done, future in enumerate(futures, start=1):
+            results.append(future.result())
+            progress.progress(done, len(futures), "Đã xong sprint")
+    return results
+
+
+def issues_table(results: List[SprintReportResult]) -> pd.DataFrame:
+    """Ghép bảng issue của các sprint, thêm cột board / sprint"""
+    frames = [
+        result.issues.assign(
+            board_id=result.board_id,
+            sprint_id=result.sprint.id,
+            sprint_name=result.sprint.name,
+        )
+        for result in results
+        if not result.issues.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=SPRINT_ID_COLUMNS)
+    table = pd.concat(frames, ignore_index=True)
+    return table[SPRINT_ID_COLUMNS + [c for c in table.columns if c not in SPRINT_ID_COLUMNS]]
+
+
+def metrics_table(results: List[SprintReportResult]) -> pd.DataFrame:
+    """
+    Trải phẳng output ``get_metric_sprint`` thành bảng dài:
+    board_id, sprint_id, sprint_name, metric, scope (all/active), value, count
+    """
+    rows = []
+    for result in results:
+        ids = (result.board_id, result.sprint.id, result.sprint.name)
+        for metric, data in result.metrics.items():
+            if not isinstance(data, dict):
+                rows.append((*ids, metric, "all", "", int(data)))
+                continue
+            for scope, counts in data.items():
+                rows.extend(
+                    (*ids, metric, scope, str(value), count)
+                    for value, count in counts.items()
+                )
+    return pd.DataFrame(
+        rows, columns=SPRINT_ID_COLUMNS + ["metric", "scope", "value", "count"]
+    )
+
+
+def timings_table(results: List[SprintReportResult]) -> pd.DataFrame:
+    """Thời gian chạy của từng sprint"""
+    return pd.DataFrame(
+        [
+            {
+                "board_id": result.board_id,
+                "sprint_id": result.sprint.id,
+                "sprint_name": result.sprint.name,
+                "issues": result.issue_count,
+                "from_cache": result.from_cache,
+                "seconds": round(result.seconds, 3),
+                "error": result.error or "",
+            }
+            for result in results
+        ]
+    )
+
+
+def write_results(
+    results: List[SprintReportResult], output_dir: str, formats: List[str]
+) -> List[str]:
+    """
+    Ghi bảng issue và metric ra các định dạng yêu cầu
+
+    Returns:
+        List[str]: Đường dẫn các file đã ghi
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tables = {"issues": issues_table(results), "metrics": metrics_table(results)}
+    paths = []
+    for fmt in formats:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Định dạng không hỗ trợ: {fmt}")
+        for name, table in tables.items():
+            path = os.path.join(output_dir, f"{name}.{fmt}")
+            if fmt == "parquet":
+                _to_export_frame(table).to_parquet(path, index=False)
+            elif fmt == "xlsx":
+                write_excel(
+                    [ExcelSheet(name=name, frame=_to_export_frame(table))], output=path
+                )
+            elif fmt == "json" and name == "metrics":
+                # Metric giữ nguyên cấu trúc lồng của get_metric_sprint
+                _write_metrics_json(results, path)
+            else:
+                table.to_json(
+                    path, orient="records", force_ascii=False, date_format="iso",
+                    default_handler=str,
+                )
+            paths.append(path)
+    return paths
+
+
+def _write_metrics_json(results: List[SprintReportResult], path: str):
+    data = [
+        {
+            "board_id": result.board_id,
+            "sprint_id": result.sprint.id,
+            "sprint_name": result.sprint.name,
+            "metrics": result.metrics,
+        }
+        for result in results
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+
+
+def _to_export_frame(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Chuẩn hóa cột object có kiểu lẫn lộn (datetime / timedelta / chuỗi rỗng)
+    để ghi Parquet / Excel
+    """
+    table = table.copy()
+    for column in table.columns[table.dtypes == object]:
+        kinds = set(table[column].dropna().map(type))
+        if kinds <= {str}:
+            continue
+        if kinds <= {bool}:
+            table[column] = table[column].astype("boolean")
+        else:
+            table[column] = table[column].map(lambda v: "" if v is None else str(v))
+    return table
@@ -0,0 +1,139 @@
+"""
+Sprint Trend - Velocity và xu hướng qua nhiều sprint của một board
+
+Mỗi sprint được rút gọn thành một dòng metric (velocity, số issue done, tỉ lệ
+reopen, chênh lệch estimate / spent) và cache riêng theo sprint trong file
+cache (``cache_trend_row_sprint_{board}_{sprint}``). Xem trend N sprint chỉ load
+các sprint chưa có dòng cache, song song qua ``get_issues_for_sprint`` (dùng
+file cache issue của sprint), nên thêm một sprint mới chỉ tốn công của một sprint.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from service.base.progress import ProgressReporter, default_progress_reporter
+from service.clients.jira.sprint_service import SprintService, sprint_cache_key
+from service.models.sprint_model import SprintRecord
+from service.utils.cache_utils import file_cache
+
+TREND_ROW_CACHE_NAME = "trend_row"
+
+TREND_COLUMNS = [
+    "sprint_id",
+    "sprint_name",
+    "start_date",
+    "end_date",
+    "issue_count",
+    "committed_points",
+    "velocity_points",
+    "done_count",
+    "reopen_count",
+    "reopen_rate",
+    "estimate_hours",
+    "spent_hours",
+    "drift_pct",
+]
+
+
+def compute_trend_row(issues: pd.DataFrame, sprint: SprintRecord) -> Dict:
+    """
+    Rút gọn danh sách issue của một sprint thành một dòng metric
+
+    Chỉ tính issue hiển thị trên dashboard (is_show_dashboard). Velocity là
+    tổng points của issue done trong sprint; drift so sánh giờ thực tế với
+    estimate ban đầu của các issue done trong sprint.
+    """
+    row = {
+        "sprint_id": sprint.id,
+        "sprint_name": sprint.name,
+        "start_date": (sprint.start_date or "")[:10],
+        "end_date": (sprint.end_date or "")[:10],
+    }
+    if issues.empty:
+        return {column: row.get(column, 0) for column in TREND_COLUMNS}
+
+    shown = issues[issues["is_show_dashboard"].astype(bool)]
+    done = shown[shown["is_done_in_sprint"].astype(bool)]
+    points = pd.to_numeric(shown["points"], errors="coerce").fillna(0)
+    estimate_hours = done["originalEstimateSeconds"].fillna(0).sum() / 3600
+    spent_hours = done["timeSpentSeconds"].fillna(0).sum() / 3600
+    reopen_count = int(shown["reopen_in_sprint"].astype(bool).sum())
+
+    row.update(
+        {
+            "issue_count": len(shown),
+            "committed_points": round(float(points.sum()), 2),
+            "velocity_points": round(float(points[done.index].sum()), 2),
+            "done_count": len(done),
+            "reopen_count": reopen_count,
+            "reopen_rate": (
+                round(reopen_count / len(shown) * 100, 1) if len(shown) else 0.0
+            ),
+            "estimate_hours": round(estimate_hours, 1),
+            "spent_hours": round(spent_hours, 1),
+            "drift_pct": (
+                round((spent_hours - estimate_hours) / estimate_hours * 100, 1)
+                if estimate_hours
+                else 0.0
+            ),
+        }
+    )
+    return row
+
+
+def get_trend_row(
+    board_id: int,
+    sprint: SprintRecord,
+    use_cache: bool = True,
+    progress: Optional[ProgressReporter] = None,
+) -> Dict:
+    """Dòng metric của một sprint: đọc từ cache, hoặc load sprint rồi cache lại"""
+    cache_key = sprint_cache_key(board_id, sprint.id, TREND_ROW_CACHE_NAME)
+    if use_cache:
+        row = file_cache.load_cache(cache_key)
+        if row is not None:
+            return row
+
+    # Chỉ tạo service (kết nối Jira) khi sprint chưa có dòng cache
+    sprint_service = SprintService(board_id, progress=progress)
+    sprint_service.set_data_sprint(sprint)
+    sprint_service.get_issues_for_sprint(sprint.id, use_cache=use_cache)
+    row = compute_trend_row(sprint_service.list_issues, sprint)
+    file_cache.save_cache(cache_key, row)
+    return row
+
+
+def build_sprint_trend(
+    board_id: int,
+    sprints: List[SprintRecord],
+    max_workers: int = 4,
+    use_cache: bool = True,
+    progress: Optional[ProgressReporter] = None,
+) -> pd.DataFrame:
+    """
+    Bảng trend của các sprint (sprint cũ nhất trước)
+
+    Sprint đã có dòng cache chỉ tốn một lần đọc file; các sprint còn thiếu
+    được load song song. Worker dùng ``progress`` mặc định (logging) vì không
+    chạy trong script thread của Streamlit.
+
+    Returns:
+        pd.DataFrame: Các cột TREND_COLUMNS, thêm cột ``seconds`` (thời gian
+        lấy dòng của từng sprint)
+    """
+    progress = progress or default_progress_reporter
+
+    def load(sprint: SprintRecord) -> Dict:
+        started = time.perf_counter()
+        row = get_trend_row(board_id, sprint, use_cache=use_cache)
+        return {**row, "seconds": round(time.perf_counter() - started, 3)}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        rows = list(pool.map(load, sprints))
+    progress.info(f"📈 Đã tính trend cho {len(rows)} sprint")
+
+    trend = pd.DataFrame(rows, columns=[*TREND_COLUMNS, "seconds"])
+    return trend.sort_values("start_date", kind="stable").reset_index(drop=True)
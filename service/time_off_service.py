@@ -6,6 +6,9 @@ import calendar
 from datetime import datetime, date
 from typing import List, Dict, Optional
 
+import streamlit as st
+
+from conf import TIME_OFF_CACHE_TTL_SECONDS
 from .get_client import get_supabase
 
 
@@ -48,6 +51,30 @@ class TimeOffService:
         except Exception as e:
             raise Exception(f"Lỗi khi lấy dữ liệu ngày nghỉ: {str(e)}")
 
+    def get_time_off_in_range(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        Lấy dữ liệu ngày nghỉ trong khoảng ngày (tính cả hai đầu)
+
+        Args:
+            start_date: Ngày bắt đầu
+            end_date: Ngày kết thúc
+
+        Returns:
+            List[Dict]: Danh sách ngày nghỉ
+        """
+        try:
+            if not getattr(self.supabase, "is_connected", False):
+                return []
+            data = self.supabase.select_in_range(
+                "time_off",
+                "date",
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%d"),
+            )
+            return data or []
+        except Exception as e:
+            raise Exception(f"Lỗi khi lấy dữ liệu ngày nghỉ: {str(e)}")
+
     def save_time_off(
         self, selected_date: date, user_name: str, time_off_type: str, note: str
     ) -> bool:
@@ -71,6 +98,7 @@ class TimeOffService:
             }
 
             result = self.supabase.insert_data("time_off", data)
+            cached_time_off_in_range.clear()
             return bool(result)
         except Exception as e:
             raise Exception(f"Lỗi khi lưu ngày nghỉ: {str(e)}")
@@ -87,6 +115,7 @@ class TimeOffService:
         """
         try:
             result = self.supabase.delete_data("time_off", "id", time_off_id)
+            cached_time_off_in_range.clear()
             return bool(result)
         except Exception as e:
             raise Exception(f"Lỗi khi xóa ngày nghỉ: {str(e)}")
@@ -126,3 +155,9 @@ class TimeOffService:
                 time_off_dict[item_date] = []
             time_off_dict[item_date].append(item)
         return time_off_dict
+
+
+@st.cache_data(show_spinner=False, ttl=TIME_OFF_CACHE_TTL_SECONDS)
+def cached_time_off_in_range(start_date: date, end_date: date) -> List[Dict]:
+    """``get_time_off_in_range`` memo theo khoảng ngày (xóa khi lưu / xóa ngày nghỉ)"""
+    return TimeOffService().get_time_off_in_range(start_date, end_date)
@@ -0,0 +1,120 @@
+"""
+Avatar cache - Tải avatar một lần, resize sẵn và trả về dạng data URI
+
+Các bảng worklog và ô lịch nhúng avatar của hàng chục user; dùng URL gốc thì
+trình duyệt phải tải lại ảnh từ host Atlassian / CDN ở mỗi lần rerun. Cache này
+tải mỗi avatar một lần, resize thành các size đang dùng (AVATAR_SIZES) rồi lưu
+PNG trên đĩa (``.streamlit_cache/avatars``); trang chỉ nhúng data URI nên không
+phát sinh request ảnh ra ngoài.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+import requests
+from PIL import Image
+
+from conf import AVATAR_DOWNLOAD_TIMEOUT, AVATAR_SIZES
+
+
+class AvatarCache:
+    """Cache avatar trên đĩa + data URI trong bộ nhớ"""
+
+    def __init__(
+        self,
+        cache_dir: str = os.path.join(".streamlit_cache", "avatars"),
+        sizes: List[int] = AVATAR_SIZES,
+    ):
+        self.cache_dir = cache_dir
+        self.sizes = sorted(sizes)
+        self._data_uris: Dict[tuple, str] = {}
+        self._failed = set()
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_avatar_path(self, url: str, size: int) -> str:
+        hashed_url = hashlib.md5(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{hashed_url}_{size}.png")
+
+    def _pick_size(self, size: int) -> int:
+        """Size nhỏ nhất trong AVATAR_SIZES không nhỏ hơn size yêu cầu"""
+        return next((value for value in self.sizes if value >= size), self.sizes[-1])
+
+    def get_data_uri(self, url: str, size: int = 32) -> str:
+        """
+        Avatar dạng data URI (PNG) với size gần nhất trong AVATAR_SIZES
+
+        Tải ảnh nếu chưa có trên đĩa. Nếu không tải / đọc được ảnh thì trả về
+        URL gốc (và không thử tải lại URL đó trong process này).
+        """
+        if not url:
+            return ""
+        size = self._pick_size(size)
+        key = (url, size)
+        data_uri = self._data_uris.get(key)
+        if data_uri:
+            return data_uri
+        if url in self._failed:
+            return url
+
+        path = self._get_avatar_path(url, size)
+        if not os.path.exists(path) and not self._download(url):
+            return url
+        with open(path, "rb") as f:
+            data_uri = "data:image/png;base64," + base64.b64encode(f.read()).decode()
+        with self._lock:
+            self._data_uris[key] = data_uri
+        return data_uri
+
+    def _download(self, url: str) -> bool:
+        """Tải avatar và lưu các bản resize; trả về False nếu lỗi"""
+        try:
+            response = requests.get(url, timeout=AVATAR_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            image = Image.open(io.BytesIO(response.content)).convert("RGBA")
+            for size in self.sizes:
+                resized = image.resize((size, size), Image.Resampling.LANCZOS)
+                # Ghi file tạm rồi rename để thread khác không đọc file dở dang
+                path = self._get_avatar_path(url, size)
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                resized.save(temp_path, format="PNG", optimize=True)
+                os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            print(f"Warning: Could not cache avatar {url}: {e}")
+            with self._lock:
+                self._failed.add(url)
+            return False
+
+    def prefetch(self, urls: Iterable[str], max_workers: int = 8):
+        """Tải song song các avatar chưa có trên đĩa (gọi trước vòng render)"""
+        missing = {
+            url
+            for url in urls
+            if url
+            and url not in self._failed
+            and not os.path.exists(self._get_avatar_path(url, self.sizes[-1]))
+        }
+        if not missing:
+            return
+        workers = max(1, min(max_workers, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(self._download, missing))
+
+    def clear(self):
+        """Xóa toàn bộ avatar đã cache (trên đĩa và trong bộ nhớ)"""
+        with self._lock:
+            self._data_uris.clear()
+            self._failed.clear()
+        for file in os.listdir(self.cache_dir):
+            if file.endswith(".png"):
+                os.remove(os.path.join(self.cache_dir, file))
+
+
+# Global instance
+avatar_cache = AvatarCache()
@@ -0,0 +1,127 @@
+"""
+Excel writer - Ghi file XLSX từ DataFrame theo kiểu streaming
+
+Dùng workbook ``write_only`` của openpyxl: các dòng được ghi thẳng ra XML theo
+từng chunk của DataFrame thay vì tạo object cho từng ô trong bộ nhớ (như
+``DataFrame.to_excel`` với openpyxl ở chế độ thường), nên bộ nhớ gần như không
+tăng theo số dòng. Định dạng được khai báo một lần cho cả cột (độ rộng), không
+gán style cho từng ô; header / index để trơn giống ``to_excel`` của pandas.
+"""
+
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+EXCEL_CHUNK_SIZE = 10000
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+
+@dataclass
+class ExcelSheet:
+    """Một sheet cần ghi: DataFrame và các tùy chọn hiển thị"""
+
+    name: str
+    frame: pd.DataFrame
+    index: bool = False
+    # Các dòng tiêu đề phía trên bảng: (nội dung, font)
+    title_rows: List[Tuple[str, Optional[Font]]] = field(default_factory=list)
+    # Dòng bắt đầu của header bảng (0-based, giống startrow của to_excel)
+    startrow: int = 0
+    # None = tự tính theo độ dài nội dung
+    column_widths: Optional[List[float]] = None
+
+
+def column_widths(
+    frame: pd.DataFrame, index: bool = False, extra_first: tuple = ()
+) -> List[int]:
+    """
+    Độ rộng cột (tối đa EXCEL_MAX_COLUMN_WIDTH) tính vectorized trên frame
+
+    Args:
+        frame: DataFrame được export
+        index: Frame được export kèm index (index là cột đầu tiên)
+        extra_first: Các chuỗi khác nằm ở cột đầu tiên (ví dụ dòng tiêu đề)
+    """
+    columns = frame.reset_index() if index else frame
+    widths = []
+    for position, name in enumerate(columns.columns):
+        lengths = columns.iloc[:, position].astype(str).str.len()
+        longest = max(len(str(name)), int(lengths.max()) if len(lengths) else 0)
+        if position == 0:
+            longest = max([longest, *(len(str(text)) for text in extra_first)])
+        widths.append(min(longest + 2, EXCEL_MAX_COLUMN_WIDTH))
+    return widths
+
+
+def _python_rows(block: pd.DataFrame) -> list:
+    """Chuyển một chunk thành list các dòng giá trị Python (NaN / NaT -> None)"""
+    # Timedelta ghi thành số ngày (float) như to_excel của pandas
+    durations = block.select_dtypes("timedelta")
+    if not durations.empty:
+        block = block.assign(**(durations / pd.Timedelta(days=1)))
+    values = block.astype(object)
+    return values.where(values.notna(), None).to_numpy().tolist()
+
+
+def _write_sheet(workbook: Workbook, sheet: ExcelSheet, chunk_size: int):
+    worksheet = workbook.create_sheet(sheet.name)
+    frame = sheet.frame
+    widths = sheet.column_widths
+    if widths is None:
+        widths = column_widths(
+            frame, sheet.index, tuple(text for text, _ in sheet.title_rows)
+        )
+    # Định dạng cột khai báo một lần, trước khi ghi dòng (yêu cầu của write_only)
+    for position, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(position)].width = width
+
+    for text, font in sheet.title_rows:
+        cell = WriteOnlyCell(worksheet, value=text)
+        if font is not None:
+            cell.font = font
+        worksheet.append([cell])
+    for _ in range(sheet.startrow - len(sheet.title_rows)):
+        worksheet.append([])
+
+    header = [str(name) for name in frame.columns]
+    if sheet.index:
+        header.insert(0, frame.index.name)
+        frame = frame.reset_index()
+    worksheet.append(header)
+
+    for start in range(0, len(frame), chunk_size):
+        for row in _python_rows(frame.iloc[start : start + chunk_size]):
+            worksheet.append(row)
+
+
+def write_excel(
+    sheets: List[ExcelSheet],
+    output: Optional[Union[str, BinaryIO]] = None,
+    chunk_size: int = EXCEL_CHUNK_SIZE,
+) -> Optional[bytes]:
+    """
+    Ghi các sheet thành file XLSX bằng workbook write_only
+
+    Args:
+        sheets: Danh sách sheet theo thứ tự
+        output: Đường dẫn / file để ghi (None = trả về bytes)
+        chunk_size: Số dòng DataFrame được chuyển đổi mỗi lần
+
+    Returns:
+        bytes: Nội dung file XLSX khi không truyền output
+    """
+    workbook = Workbook(write_only=True)
+    for sheet in sheets:
+        _write_sheet(workbook, sheet, chunk_size)
+    if output is not None:
+        workbook.save(output)
+        return None
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
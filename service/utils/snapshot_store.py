@@ -0,0 +1,221 @@
+"""
+Snapshot store - Lưu trạng thái hằng ngày của issue trong sprint (append-only, gzip CSV)
+
+Mỗi sprint có một file ``sprint_{board}_{sprint}.csv.gz``. Mỗi lần ghi snapshot
+chỉ append các dòng thay đổi so với trạng thái mới nhất (issue mới, issue đổi
+status / assignee / estimate / remaining, issue bị bỏ khỏi sprint) dưới dạng
+một gzip member mới, nên file nhỏ và không phải ghi lại từ đầu. Trạng thái tại
+một ngày bất kỳ = dòng cuối cùng của mỗi issue có snapshot_date <= ngày đó.
+
+Lịch sử đọc từ file được memo theo (mtime, size) của file nên các truy vấn liên
+tiếp (snapshot_dates, as_of, compare) không giải nén lại file.
+"""
+
+import gzip
+import os
+import threading
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Các cột trạng thái được lưu (tên cột trong snapshot -> cột của issue đã xử lý)
+SNAPSHOT_FIELDS = {
+    "status": "status",
+    "assignee": "assignee",
+    "points": "points",
+    "estimate_seconds": "originalEstimateSeconds",
+    "remaining_seconds": "remainingEstimateSeconds",
+}
+SNAPSHOT_COLUMNS = ["snapshot_date", "key", *SNAPSHOT_FIELDS, "removed"]
+SNAPSHOT_DTYPES = {
+    "key": str,
+    "status": str,
+    "assignee": str,
+    "points": float,
+    "estimate_seconds": float,
+    "remaining_seconds": float,
+    "removed": bool,
+}
+NUMERIC_FIELDS = [name for name, kind in SNAPSHOT_DTYPES.items() if kind is float]
+
+
+class SnapshotStore:
+    """Lưu và truy vấn snapshot trạng thái issue theo ngày của từng sprint"""
+
+    def __init__(
+        self, snapshot_dir: str = os.path.join(".streamlit_cache", "snapshots")
+    ):
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        # path -> ((mtime_ns, size), lịch sử đã đọc)
+        self._history_cache: Dict[str, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+    def _get_snapshot_path(self, board_id: int, sprint_id: int) -> str:
+        return os.path.join(self.snapshot_dir, f"sprint_{board_id}_{sprint_id}.csv.gz")
+
+    def has_snapshot(self, board_id: int, sprint_id: int) -> bool:
+        return os.path.exists(self._get_snapshot_path(board_id, sprint_id))
+
+    def is_recorded(self, board_id: int, sprint_id: int, snapshot_date: date) -> bool:
+        """Store đã có snapshot của snapshot_date hoặc của ngày sau đó chưa"""
+        dates = self.snapshot_dates(board_id, sprint_id)
+        return bool(dates) and dates[-1] >= snapshot_date
+
+    def record_snapshot(
+        self, board_id: int, sprint_id: int, issues: pd.DataFrame, snapshot_date: date
+    ) -> int:
+        """
+        Ghi snapshot của sprint tại snapshot_date (chỉ append phần thay đổi)
+
+        Args:
+            issues: Danh sách issue đã xử lý (cần cột key và các cột SNAPSHOT_FIELDS)
+            snapshot_date: Ngày của snapshot
+
+        Returns:
+            int: Số dòng thay đổi đã append
+        """
+        current = _to_state(issues)
+        with self._lock:
+            latest = self.as_of(board_id, sprint_id)
+            changes = _diff_state(latest, current)
+            if changes.empty:
+                return 0
+            changes.insert(0, "snapshot_date", pd.Timestamp(snapshot_date).date())
+
+            path = self._get_snapshot_path(board_id, sprint_id)
+            header = not os.path.exists(path)
+            with gzip.open(path, "ab") as f:
+                csv = changes[SNAPSHOT_COLUMNS].to_csv(index=False, header=header)
+                f.write(csv.encode())
+        return len(changes)
+
+    def load_history(self, board_id: int, sprint_id: int) -> pd.DataFrame:
+        """Toàn bộ các dòng thay đổi của sprint, theo thứ tự ghi (memo theo mtime)"""
+        path = self._get_snapshot_path(board_id, sprint_id)
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=SNAPSHOT_COLUMNS).astype(SNAPSHOT_DTYPES)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._history_cache.get(path)
+        if cached is None or cached[0] != version:
+            cached = (version, self._read_history(path))
+            self._history_cache[path] = cached
+        return cached[1].copy()
+
+    @staticmethod
+    def _read_history(path: str) -> pd.DataFrame:
+        history = pd.read_csv(
+            path,
+            compression="gzip",
+            dtype=SNAPSHOT_DTYPES,
+            # Giữ chuỗi rỗng cho status / assignee, chỉ cột số mới là NaN
+            keep_default_na=False,
+            na_values={name: [""] for name in NUMERIC_FIELDS},
+        )
+        history["snapshot_date"] = pd.to_datetime(history["snapshot_date"]).dt.date
+        return history
+
+    def snapshot_dates(self, board_id: int, sprint_id: int) -> list:
+        """Các ngày đã có snapshot của sprint"""
+        return sorted(self.load_history(board_id, sprint_id)["snapshot_date"].unique())
+
+    def as_of(
+        self, board_id: int, sprint_id: int, as_of_date: Optional[date] = None
+    ) -> pd.DataFrame:
+        """
+        Trạng thái các issue của sprint tại as_of_date (mặc định: mới nhất)
+
+        Returns:
+            pd.DataFrame: Index là key, các cột trong SNAPSHOT_FIELDS
+        """
+        history = self.load_history(board_id, sprint_id)
+        if as_of_date is not None:
+            history = history[history["snapshot_date"] <= as_of_date]
+        state = history.drop_duplicates("key", keep="last")
+        state = state[~state["removed"]].set_index("key")
+        return state[list(SNAPSHOT_FIELDS)]
+
+    def compare(
+        self,
+        board_id: int,
+        left_sprint_id: int,
+        right_sprint_id: int,
+        left_date: Optional[date] = None,
+        right_date: Optional[date] = None,
+    ) -> Dict:
+        """
+        So sánh hai snapshot (hai sprint, hoặc cùng sprint ở hai ngày khác nhau)
+
+        Returns:
+            dict: {
+                "by_status": số issue / points theo status của hai bên,
+                "totals": tổng issue, points, estimate, remaining của hai bên,
+                "carried_over": các issue có ở cả hai bên (bị chuyển sprint),
+            }
+        """
+        left = self.as_of(board_id, left_sprint_id, left_date)
+        right = self.as_of(board_id, right_sprint_id, right_date)
+        sides = {"left": left, "right": right}
+
+        by_status = pd.concat(
+            {
+                name: state.groupby("status").agg(
+                    issues=("points", "size"), points=("points", "sum")
+                )
+                for name, state in sides.items()
+            },
+            axis=1,
+        ).fillna(0)
+        totals = pd.DataFrame(
+            {
+                name: {
+                    "issues": len(state),
+                    "points": state["points"].sum(),
+                    "estimate_hours": state["estimate_seconds"].sum() / 3600,
+                    "remaining_hours": state["remaining_seconds"].sum() / 3600,
+                }
+                for name, state in sides.items()
+            }
+        ).round(2)
+        carried_over = left.join(right, how="inner", lsuffix="_left", rsuffix="_right")
+        return {"by_status": by_status, "totals": totals, "carried_over": carried_over}
+
+
+def _to_state(issues: pd.DataFrame) -> pd.DataFrame:
+    """Rút gọn danh sách issue thành các cột trạng thái của snapshot"""
+    state = pd.DataFrame({"key": issues["key"].astype(str)})
+    for name, column in SNAPSHOT_FIELDS.items():
+        if column in issues.columns:
+            values = issues[column]
+        else:
+            values = pd.Series(np.nan, index=issues.index)
+        if name in NUMERIC_FIELDS:
+            state[name] = pd.to_numeric(values, errors="coerce").astype(float)
+        else:
+            # astype(object) trước: cột category không nhận giá trị "" mới
+            state[name] = values.astype(object).fillna("").astype(str)
+    state["removed"] = False
+    return state.drop_duplicates("key", keep="last").set_index("key")
+
+
+def _diff_state(latest: pd.DataFrame, current: pd.DataFrame) -> pd.DataFrame:
+    """Các dòng cần append: issue mới / thay đổi, và issue bị bỏ (removed=True)"""
+    fields = list(SNAPSHOT_FIELDS)
+    previous = latest.reindex(current.index)
+    changed = np.zeros(len(current), dtype=bool)
+    for name in fields:
+        before, after = previous[name], current[name]
+        same = (before == after) | (before.isna() & after.isna())
+        changed |= ~same.to_numpy()
+
+    removed = latest.loc[~latest.index.isin(current.index), fields].copy()
+    removed["removed"] = True
+    rows = pd.concat([current[changed], removed])
+    return rows.rename_axis("key").reset_index()
+
+
+# Global instance
+snapshot_store = SnapshotStore()
@@ -1,8 +1,16 @@
 import streamlit as st
+import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 
 """Utility functions cho xử lý thời gian"""
 
+# Timestamp Jira dạng "2025-06-11T09:58:07.555+0700": 23 ký tự đầu là giờ địa phương
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+JIRA_TIMESTAMP_LENGTH = 23
+JIRA_DATE_FORMAT = "%Y-%m-%d"
+JIRA_TIMEZONE = "Asia/Ho_Chi_Minh"
+
 
 def format_time_spent(seconds):
     """
@@ -66,7 +74,7 @@ def cal_hours_since_update(input_time_str: str):
     import pytz
 
     input_time = convert_time_str_to_datetime(input_time_str)
-    now = datetime.now(pytz.timezone("Asia/Ho_Chi_Minh"))
+    now = datetime.now(pytz.timezone(JIRA_TIMEZONE))
 
     # Bỏ thông tin timezone để so sánh
     if input_time.tzinfo is not None:
@@ -88,20 +96,68 @@ def cal_hours_since_update(input_time_str: str):
 
 def convert_time_str_to_datetime(time_str) -> datetime:
 
-    from dateutil import parser
-
     if not time_str:
         return ""
 
     if isinstance(time_str, datetime):
         return time_str
     try:
-        parsed_datetime = parser.parse(time_str)
-        return parsed_datetime.replace(tzinfo=None)
+        return parse_jira_timestamp(time_str)
     except Exception as e:
         raise ValueError(f"Không thể parse chuỗi thời gian '{time_str}': {str(e)}")
 
 
+@lru_cache(maxsize=65536)
+def parse_jira_timestamp(time_str: str) -> datetime:
+    """
+    Parse timestamp Jira (ISO 8601) có memo cho các chuỗi lặp lại
+
+    Quy ước timezone: trả về datetime naive theo giờ địa phương ghi trong chuỗi
+    (bỏ offset), giống ``dateutil.parser.parse(...).replace(tzinfo=None)``.
+
+    Args:
+        time_str: Ví dụ "2025-06-11T09:58:07.555+0700" hoặc "2025-06-11"
+
+    Returns:
+        datetime: Datetime naive
+    """
+    try:
+        return datetime.fromisoformat(time_str).replace(tzinfo=None)
+    except ValueError:
+        # Fallback cho các format không chuẩn ISO
+        from dateutil import parser
+
+        return parser.parse(time_str).replace(tzinfo=None)
+
+
+def parse_jira_timestamps(values, fmt: str = JIRA_TIMESTAMP_FORMAT) -> pd.Series:
+    """
+    Phiên bản theo cột của ``parse_jira_timestamp`` dùng ``pd.to_datetime(format=...)``
+
+    Cùng quy ước timezone: giờ địa phương ghi trong chuỗi, bỏ offset.
+    Giá trị rỗng/None trả về NaT.
+
+    Args:
+        values: List hoặc Series các chuỗi timestamp
+        fmt: JIRA_TIMESTAMP_FORMAT (mặc định) hoặc JIRA_DATE_FORMAT
+
+    Returns:
+        pd.Series: Series dtype datetime64 (naive)
+    """
+    series = pd.Series(values, dtype=object)
+    series = series.where(series.astype(bool) & series.notna(), None)
+    local_part = series.str.slice(0, JIRA_TIMESTAMP_LENGTH)
+    parsed = pd.to_datetime(local_part, format=fmt, errors="coerce")
+
+    # Chuỗi không đúng format cố định thì parse lại từng giá trị
+    invalid = parsed.isna() & series.notna()
+    if invalid.any():
+        parsed[invalid] = pd.to_datetime(
+            series[invalid].map(parse_jira_timestamp), errors="coerce"
+        )
+    return parsed
+
+
 def convert_seconds_to_jira_time(seconds: int) -> str:
     """
     Chuyển đổi số giây thành định dạng thời gian Jira.
@@ -0,0 +1,105 @@
+"""
+Worklog gap store - Dữ liệu của job phát hiện ngày log thiếu giờ
+
+Lưu trong ``.streamlit_cache/worklog_gaps``:
+- ``worklogs.csv.gz``: worklog của team trong cửa sổ kiểm tra (id, User, Date,
+  Time (Hours)); job chỉ upsert / xóa các worklog thay đổi từ lần chạy trước
+- ``gaps.csv``: bảng nhỏ các ngày làm việc bị log thiếu (User, Date, expected,
+  logged, missing) mà trang Worklog đọc trực tiếp
+- ``state.json``: watermark của Jira (worklog/updated, worklog/deleted), ngày đã
+  kiểm tra đến, digest ngày nghỉ / danh sách user của lần chạy trước
+
+File được ghi ra file tạm rồi rename nên trang không bao giờ đọc phải file dở.
+"""
+
+import json
+import os
+import threading
+from typing import Dict
+
+import pandas as pd
+
+WORKLOG_COLUMNS = ["id", "User", "Date", "Time (Hours)"]
+GAP_COLUMNS = ["User", "Date", "expected", "logged", "missing"]
+
+
+class WorklogGapStore:
+    """Đọc / ghi worklog, bảng gap và state của job kiểm tra worklog"""
+
+    def __init__(
+        self, store_dir: str = os.path.join(".streamlit_cache", "worklog_gaps")
+    ):
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.store_dir, name)
+
+    def _replace(self, name: str, write):
+        """Ghi file qua file tạm rồi rename (atomic)"""
+        path = self._path(name)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            write(temp_path)
+            os.replace(temp_path, path)
+
+    def load_state(self) -> Dict:
+        """State của lần chạy trước ({} nếu job chưa chạy)"""
+        path = self._path("state.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_state(self, state: Dict):
+        def write(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+
+        self._replace("state.json", write)
+
+    def load_worklogs(self) -> pd.DataFrame:
+        """Worklog của team trong cửa sổ kiểm tra"""
+        return self._load_frame("worklogs.csv.gz", WORKLOG_COLUMNS, {"id": str})
+
+    def save_worklogs(self, worklogs: pd.DataFrame):
+        self._replace(
+            "worklogs.csv.gz",
+            lambda path: worklogs[WORKLOG_COLUMNS].to_csv(
+                path, index=False, compression="gzip"
+            ),
+        )
+
+    def load_gaps(self) -> pd.DataFrame:
+        """Các ngày làm việc bị log thiếu giờ"""
+        return self._load_frame("gaps.csv", GAP_COLUMNS, {})
+
+    def save_gaps(self, gaps: pd.DataFrame):
+        self._replace(
+            "gaps.csv", lambda path: gaps[GAP_COLUMNS].to_csv(path, index=False)
+        )
+
+    def last_modified(self) -> float:
+        """Thời điểm bảng gap được ghi gần nhất (0 nếu chưa có)"""
+        path = self._path("gaps.csv")
+        return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+    def reset(self):
+        """Xóa toàn bộ dữ liệu, lần chạy sau sẽ đọc lại cả cửa sổ kiểm tra"""
+        for name in ["worklogs.csv.gz", "gaps.csv", "state.json"]:
+            if os.path.exists(self._path(name)):
+                os.remove(self._path(name))
+
+    def _load_frame(self, name: str, columns: list, dtype: dict) -> pd.DataFrame:
+        path = self._path(name)
+        if not os.path.exists(path):
+            frame = pd.DataFrame(columns=columns)
+        else:
+            frame = pd.read_csv(path, dtype={"User": str, **dtype})
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        return frame
+
+
+# Global instance
+worklog_gap_store = WorklogGapStore()
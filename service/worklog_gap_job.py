@@ -0,0 +1,245 @@
+"""
+Worklog Gap Job - Phát hiện ngày làm việc bị log thiếu giờ (chạy định kỳ, tăng dần)
+
+Mỗi lần chạy:
+1. Đọc các worklog được tạo / sửa / xóa từ watermark của lần trước
+   (``worklog/updated``, ``worklog/deleted``) rồi upsert vào worklog store;
+   lần chạy đầu tiên watermark là đầu cửa sổ kiểm tra (WORKLOG_GAP_LOOKBACK_DAYS);
+   khi số ngày lookback tăng so với lần trước, dữ liệu cũ bị xóa và đọc lại
+   toàn bộ cửa sổ như lần đầu
+2. Xác định các ngày cần tính lại: ngày của worklog thay đổi (giá trị cũ và
+   mới), các ngày vừa kết thúc từ lần chạy trước, ngày có thay đổi ngày nghỉ
+3. Tính ma trận user × ngày (``build_capacity``) chỉ trên các ngày đó: ngày làm
+   việc (không phải cuối tuần, ``CalendarUtils.is_weekend``) trừ ngày nghỉ
+   (``TimeOffService``) so với giờ đã log, rồi thay các dòng của những ngày này
+   trong bảng gap
+
+Chỉ kiểm tra các ngày đã kết thúc (đến hôm qua). Worklog được tính trên mọi
+project nhưng chỉ cho user của team (``user.json``).
+
+Chạy: python check_worklog_gaps.py (ví dụ đặt cron mỗi giờ)
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from conf import WORKDAY_HOURS, WORKLOG_GAP_LOOKBACK_DAYS, WORKLOG_GAP_TOLERANCE_HOURS
+from service.capacity_service import TEAM_USER, build_capacity
+from service.clients.jira.user_service import load_local_users
+from service.utils.worklog_gap_store import (
+    GAP_COLUMNS,
+    WORKLOG_COLUMNS,
+    WorklogGapStore,
+    worklog_gap_store,
+)
+
+
+@dataclass
+class GapJobResult:
+    """Thống kê một lần chạy job"""
+
+    bootstrap: bool = False
+    updated: int = 0
+    deleted: int = 0
+    days_checked: int = 0
+    gaps: int = 0
+    seconds: float = 0.0
+
+
+def default_team_users() -> List[str]:
+    """User của team (displayName trong user.json, trừ TEAM)"""
+    return sorted(
+        {
+            user["displayName"]
+            for user in load_local_users()
+            if user.get("displayName") and user["displayName"] != TEAM_USER
+        }
+    )
+
+
+def default_time_off_loader(start_date: date, end_date: date) -> List[Dict]:
+    """Ngày nghỉ trong khoảng ngày từ Supabase"""
+    from service.time_off_service import TimeOffService
+
+    return TimeOffService().get_time_off_in_range(start_date, end_date)
+
+
+def worklog_rows(worklogs: List[Dict]) -> pd.DataFrame:
+    """Worklog JSON của Jira -> các dòng (id, User, Date, Time (Hours))"""
+    rows = pd.DataFrame(
+        [
+            (
+                str(worklog["id"]),
+                (worklog.get("author") or {}).get("displayName", ""),
+                worklog["started"][:10],
+                worklog.get("timeSpentSeconds") or 0,
+            )
+            for worklog in worklogs
+        ],
+        columns=WORKLOG_COLUMNS,
+    )
+    rows["Date"] = pd.to_datetime(rows["Date"], format="%Y-%m-%d")
+    rows["Time (Hours)"] = rows["Time (Hours)"].astype(float) / 3600
+    return rows
+
+
+def time_off_digests(time_off_data: List[Dict]) -> Dict[str, str]:
+    """Digest các record ngày nghỉ theo từng ngày, để biết ngày nào thay đổi"""
+    by_date: Dict[str, list] = {}
+    for item in time_off_data:
+        by_date.setdefault(item["date"], []).append((item["user_name"], item["time_off"]))
+    return {
+        day: hashlib.md5(json.dumps(sorted(items), ensure_ascii=False).encode()).hexdigest()
+        for day, items in by_date.items()
+    }
+
+
+def find_gaps(
+    worklogs: pd.DataFrame,
+    time_off_data: List[Dict],
+    days: List[pd.Timestamp],
+    users: List[str],
+    hours_per_day: float = WORKDAY_HOURS,
+    tolerance: float = WORKLOG_GAP_TOLERANCE_HOURS,
+) -> pd.DataFrame:
+    """
+    Các ô (user, ngày) trong ``days`` có giờ log thấp hơn kỳ vọng quá ``tolerance``
+
+    Returns:
+        pd.DataFrame: Cột GAP_COLUMNS
+    """
+    if not days or not users:
+        return pd.DataFrame(columns=GAP_COLUMNS)
+    start, end = min(days), max(days)
+    in_range = worklogs[(worklogs["Date"] >= start) & (worklogs["Date"] <= end)]
+    report = build_capacity(
+        in_range, time_off_data, start, end, users=users, hours_per_day=hours_per_day
+    )
+    columns = pd.DatetimeIndex(sorted(days))
+    expected = report.expected[columns].stack()
+    logged = report.logged[columns].stack()
+    gaps = pd.DataFrame(
+        {"expected": expected, "logged": logged.round(2), "missing": (expected - logged).round(2)}
+    )
+    gaps = gaps[(gaps["expected"] > 0) & (gaps["missing"] > tolerance)]
+    gaps.index.names = ["User", "Date"]
+    return gaps.reset_index()[GAP_COLUMNS]
+
+
+def _epoch_ms(day: date) -> int:
+    return int(datetime.combine(day, datetime.min.time()).timestamp() * 1000)
+
+
+def run_gap_job(
+    store: Optional[WorklogGapStore] = None,
+    service=None,
+    today: Optional[date] = None,
+    lookback_days: int = WORKLOG_GAP_LOOKBACK_DAYS,
+    users: Optional[List[str]] = None,
+    time_off_loader: Optional[Callable[[date, date], List[Dict]]] = None,
+) -> GapJobResult:
+    """
+    Cập nhật bảng gap với các worklog thay đổi từ lần chạy trước
+
+    Args:
+        store: Nơi lưu worklog / gap / state (mặc định worklog_gap_store)
+        service: WorklogService (mặc định tạo mới)
+        today: Ngày hiện tại (chỉ kiểm tra đến hôm qua)
+        lookback_days: Số ngày của cửa sổ kiểm tra
+        users: User cần kiểm tra (mặc định user của team trong user.json)
+        time_off_loader: Hàm (start, end) -> ngày nghỉ (mặc định TimeOffService)
+    """
+    started = time.perf_counter()
+    store = store or worklog_gap_store
+    if service is None:
+        from service.clients.jira.worklog_service import WorklogService
+
+        service = WorklogService()
+    users = sorted(users if users is not None else default_team_users())
+    time_off_loader = time_off_loader or default_time_off_loader
+    today = today or date.today()
+    window_start = today - timedelta(days=lookback_days)
+    last_day = today - timedelta(days=1)
+
+    state = store.load_state()
+    if state and lookback_days > state.get("lookback_days", 0):
+        # Cửa sổ rộng ra: các ngày mới ở đầu cửa sổ nằm trước watermark nên
+        # không bao giờ được đọc, đọc lại toàn bộ như --reset
+        store.reset()
+        state = {}
+    result = GapJobResult(bootstrap=not state)
+    worklogs = store.load_worklogs()
+    gaps = store.load_gaps()
+
+    # 1. Worklog thay đổi từ watermark
+    updated_ids, updated_until = service.get_updated_worklog_ids(
+        state.get("updated_since", _epoch_ms(window_start))
+    )
+    deleted_ids, deleted_until = service.get_deleted_worklog_ids(
+        state.get("deleted_since", _epoch_ms(window_start))
+    )
+    fresh = worklog_rows(service.get_worklogs_by_ids(updated_ids))
+    fresh = fresh[fresh["User"].isin(users)]
+    changed = worklogs["id"].isin({str(value) for value in [*updated_ids, *deleted_ids]})
+    affected = set(worklogs.loc[changed, "Date"]) | set(fresh["Date"])
+    worklogs = pd.concat([worklogs[~changed], fresh], ignore_index=True)
+    worklogs = worklogs[worklogs["Date"] >= pd.Timestamp(window_start)]
+    result.updated, result.deleted = len(updated_ids), len(deleted_ids)
+
+    # 2. Ngày cần tính lại
+    checked_through = state.get("checked_through")
+    if state.get("users") != users or state.get("window_start") is None:
+        # Danh sách user thay đổi (hoặc lần đầu): tính lại cả cửa sổ
+        first_new_day = window_start
+    else:
+        first_new_day = max(
+            window_start, date.fromisoformat(checked_through) + timedelta(days=1)
+        )
+    affected |= set(pd.date_range(first_new_day, last_day, freq="D"))
+
+    time_off_data = time_off_loader(window_start, last_day)
+    digests = time_off_digests(time_off_data)
+    previous_digests = state.get("time_off_digest", {})
+    affected |= {
+        pd.Timestamp(day)
+        for day in set(digests) | set(previous_digests)
+        if digests.get(day) != previous_digests.get(day)
+    }
+    days = sorted(
+        day
+        for day in affected
+        if pd.Timestamp(window_start) <= day <= pd.Timestamp(last_day)
+    )
+
+    # 3. Tính lại gap của các ngày bị ảnh hưởng
+    new_gaps = find_gaps(worklogs, time_off_data, days, users)
+    keep = ~gaps["Date"].isin(days) & (gaps["Date"] >= pd.Timestamp(window_start))
+    gaps = (
+        pd.concat([gaps[keep], new_gaps], ignore_index=True)
+        .sort_values(["Date", "User"], ascending=[False, True], ignore_index=True)
+    )
+
+    store.save_worklogs(worklogs)
+    store.save_gaps(gaps)
+    store.save_state(
+        {
+            "updated_since": updated_until,
+            "deleted_since": deleted_until,
+            "window_start": window_start.isoformat(),
+            "lookback_days": lookback_days,
+            "checked_through": last_day.isoformat(),
+            "users": users,
+            "time_off_digest": digests,
+            "last_run": datetime.now().isoformat(timespec="seconds"),
+        }
+    )
+    result.days_checked = len(days)
+    result.gaps = len(gaps)
+    result.seconds = time.perf_counter() - started
+    return result